@@ -0,0 +1,36 @@
+"""index refresh tokens by expiry
+
+Revision ID: 0003_refresh_tokens_expires_at
+Revises: 0002_create_auth_tables
+Create Date: 2026-10-18 00:00:00
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = "0003_refresh_tokens_expires_at"
+down_revision: str | None = "0002_create_auth_tables"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # refresh_tokens may already be large: build the index without blocking logins on PostgreSQL.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_refresh_tokens_expires_at",
+            "refresh_tokens",
+            ["expires_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_refresh_tokens_expires_at",
+            table_name="refresh_tokens",
+            postgresql_concurrently=True,
+        )
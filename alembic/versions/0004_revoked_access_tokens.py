@@ -0,0 +1,44 @@
+"""create revoked access tokens table
+
+Revision ID: 0004_revoked_access_tokens
+Revises: 0003_refresh_tokens_expires_at
+Create Date: 2026-10-18 00:10:00
+"""
+
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004_revoked_access_tokens"
+down_revision: str | None = "0003_refresh_tokens_expires_at"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "revoked_access_tokens",
+        sa.Column("jti", sa.String(length=64), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("jti"),
+    )
+    op.create_index(
+        "ix_revoked_access_tokens_expires_at",
+        "revoked_access_tokens",
+        ["expires_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_revoked_access_tokens_revoked_at",
+        "revoked_access_tokens",
+        ["revoked_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_revoked_access_tokens_revoked_at", table_name="revoked_access_tokens")
+    op.drop_index("ix_revoked_access_tokens_expires_at", table_name="revoked_access_tokens")
+    op.drop_table("revoked_access_tokens")
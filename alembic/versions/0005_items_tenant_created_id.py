@@ -0,0 +1,43 @@
+"""index items by tenant and creation order for keyset pagination
+
+Revision ID: 0005_items_tenant_created_id
+Revises: 0004_revoked_access_tokens
+Create Date: 2026-10-18 00:00:00
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = "0005_items_tenant_created_id"
+down_revision: str | None = "0004_revoked_access_tokens"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Build the new index before dropping the old one so tenant queries never lose their index.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_items_tenant_created_id",
+            "items",
+            ["tenant_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # tenant_id is the composite index's leading column, so the single-column one is redundant.
+        op.drop_index("ix_items_tenant_id", table_name="items", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_items_tenant_id",
+            "items",
+            ["tenant_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_items_tenant_created_id", table_name="items", postgresql_concurrently=True
+        )
@@ -0,0 +1,130 @@
+"""Per-request cost of the bearer-token scope dependency (``require_scopes``).
+
+Usage:
+    poetry run python scripts/benchmarks/auth_dependency.py
+    poetry run python scripts/benchmarks/auth_dependency.py --token-scopes 20 --requests 200000
+
+Two measurements, both with a warm verified-token cache so JWT verification is out of the
+picture:
+
+- ``direct``: awaits the dependency returned by ``require_scopes(["items:write"])``.
+- ``fastapi``: drives a minimal FastAPI app through raw ASGI calls and reports the extra time a
+  protected route costs over an identical unprotected one (dependency resolution included).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Annotated, Any
+
+from starlette.types import Message
+
+
+def _configure_environment() -> None:
+    os.environ.update(
+        {
+            "APP_ENVIRONMENT": "test",
+            "APP_AUTH_ENABLED": "true",
+            "APP_AUTH_JWT_SECRET": "x" * 48,
+            "APP_LOG_LEVEL": "ERROR",
+        }
+    )
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message: Message) -> None:
+    return None
+
+
+def _scope(path: str, token: str) -> dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"bench"),
+            (b"authorization", f"Bearer {token}".encode()),
+        ],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+
+async def _per_call_us(call: Any, requests: int) -> float:
+    for _ in range(min(requests, 1000)):
+        await call()
+    started = time.perf_counter()
+    for _ in range(requests):
+        await call()
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+async def _run(args: argparse.Namespace) -> None:
+    from fastapi import Depends, FastAPI
+
+    from __PROJECT_SLUG__.core.security.auth import create_access_token, require_scopes
+
+    scopes = ["items:read", "items:write"] + [
+        f"extra:{index}" for index in range(max(0, args.token_scopes - 2))
+    ]
+    token, _ = create_access_token(username="bench", scopes=scopes)
+    dependency = require_scopes(["items:write"])
+
+    async def direct() -> None:
+        await dependency(token)
+
+    app = FastAPI()
+
+    @app.get("/open")
+    async def open_route() -> None:
+        return None
+
+    @app.get("/protected")
+    async def protected_route(_principal: Annotated[Any, Depends(dependency)]) -> None:
+        return None
+
+    open_scope = _scope("/open", token)
+    protected_scope = _scope("/protected", token)
+
+    async def open_request() -> None:
+        await app(open_scope, _receive, _send)
+
+    async def protected_request() -> None:
+        await app(protected_scope, _receive, _send)
+
+    direct_us = await _per_call_us(direct, args.requests)
+    open_us = await _per_call_us(open_request, args.requests // 4)
+    protected_us = await _per_call_us(protected_request, args.requests // 4)
+
+    print(f"token scopes: {len(scopes)}")
+    print(f"  direct   {direct_us:7.2f} us/call")
+    print(
+        f"  fastapi  {protected_us - open_us:7.2f} us/request over an unprotected route "
+        f"({protected_us:.1f} vs {open_us:.1f} us)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--token-scopes", type=int, default=2)
+    args = parser.parse_args()
+
+    _configure_environment()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
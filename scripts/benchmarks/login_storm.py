@@ -0,0 +1,129 @@
+"""Latency of a cheap endpoint while password logins saturate the worker.
+
+Usage:
+    poetry run python scripts/benchmarks/login_storm.py
+    poetry run python scripts/benchmarks/login_storm.py --concurrency 64 --inline
+
+Runs the app in-process (one event loop, like one uvicorn worker) against a throwaway SQLite
+database with a seeded admin user. It measures ``GET /api/v1/ping`` latency while idle, then
+while ``--concurrency`` clients hammer ``POST /api/v1/auth/token``. ``--inline`` hashes on the
+event loop (the previous behaviour) for comparison; without it, hashing goes through the
+bounded executor and excess logins are rejected with 503.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+from typing import Any
+
+import httpx
+
+_PASSWORD = "login-storm-password"
+
+
+def _configure_environment(database_path: str, args: argparse.Namespace) -> None:
+    os.environ.update(
+        {
+            "APP_ENVIRONMENT": "test",
+            "APP_DATABASE_URL": f"sqlite+aiosqlite:///{database_path}",
+            "APP_DATABASE_AUTO_CREATE_SCHEMA": "true",
+            "APP_AUTH_ENABLED": "true",
+            "APP_AUTH_USE_DATABASE": "true",
+            "APP_AUTH_REFRESH_TOKEN_ENABLED": "false",
+            "APP_AUTH_SEED_ADMIN_ON_STARTUP": "true",
+            "APP_AUTH_ADMIN_PASSWORD": _PASSWORD,
+            "APP_AUTH_JWT_SECRET": "x" * 48,
+            "APP_AUTH_PASSWORD_HASH_WORKERS": str(args.workers),
+            "APP_AUTH_PASSWORD_HASH_MAX_QUEUE": str(args.max_queue),
+            "APP_RATE_LIMIT_ENABLED": "false",
+            "APP_LOG_LEVEL": "ERROR",
+        }
+    )
+
+
+def _percentiles(samples: list[float]) -> str:
+    cuts = statistics.quantiles(samples, n=100)
+    return f"p50={cuts[49]:7.2f}ms  p99={cuts[98]:7.2f}ms  max={max(samples):7.2f}ms"
+
+
+async def _ping_latencies(client: httpx.AsyncClient, count: int) -> list[float]:
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = await client.get("/api/v1/ping")
+        samples.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        await asyncio.sleep(0.005)
+    return samples
+
+
+async def _login_loop(client: httpx.AsyncClient, stop: asyncio.Event, statuses: Counter) -> None:
+    while not stop.is_set():
+        response = await client.post(
+            "/api/v1/auth/token",
+            data={"username": "admin", "password": _PASSWORD, "grant_type": "password"},
+        )
+        statuses[response.status_code] += 1
+        if response.status_code == 503:
+            await asyncio.sleep(0.01)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    from __PROJECT_SLUG__.core.security.hashing import password_hashing
+    from __PROJECT_SLUG__.main import create_app
+
+    if args.inline:
+
+        async def _inline(operation: str, func: Any, *func_args: Any) -> Any:
+            return func(*func_args)
+
+        password_hashing.run = _inline  # type: ignore[method-assign]
+
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://bench") as client,
+    ):
+        idle = await _ping_latencies(client, args.pings)
+
+        stop = asyncio.Event()
+        statuses: Counter = Counter()
+        storm = [
+            asyncio.create_task(_login_loop(client, stop, statuses))
+            for _ in range(args.concurrency)
+        ]
+        await asyncio.sleep(0.2)
+        loaded = await _ping_latencies(client, args.pings)
+        stop.set()
+        await asyncio.gather(*storm)
+
+    mode = "inline" if args.inline else f"executor ({args.workers} workers, queue {args.max_queue})"
+    print(f"hashing: {mode}")
+    print(f"  ping idle        {_percentiles(idle)}")
+    print(f"  ping under storm {_percentiles(loaded)}")
+    print(f"  login responses  {dict(sorted(statuses.items()))}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--pings", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=8)
+    parser.add_argument("--inline", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        _configure_environment(os.path.join(directory, "login-storm.db"), args)
+        asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Memory footprint of the deque-based vs counter-based in-memory rate limiters.
+
+Usage:
+    poetry run python scripts/benchmarks/rate_limit_footprint.py
+    poetry run python scripts/benchmarks/rate_limit_footprint.py --keys 50000 --requests 120
+
+Fills each limiter with ``--keys`` clients that have each spent ``--requests`` admits in the
+current window, then reports the traced Python heap held by the limiter.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+
+from __PROJECT_SLUG__.core.middleware.rate_limit import (
+    SlidingWindowCounterRateLimiter,
+    SlidingWindowRateLimiter,
+)
+
+MemoryLimiter = SlidingWindowRateLimiter | SlidingWindowCounterRateLimiter
+
+
+async def _fill(limiter: MemoryLimiter, *, keys: list[str], requests: int) -> None:
+    for step in range(requests):
+        for position, key in enumerate(keys):
+            # Distinct timestamps, like time.monotonic() produces in production.
+            await limiter.check(key, now=step * 0.01 + position * 1e-7)
+
+
+def _measure(factory: type[MemoryLimiter], *, keys: list[str], requests: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    limiter = factory(max_requests=requests, window_seconds=60, max_keys=len(keys))
+    asyncio.run(_fill(limiter, keys=keys, requests=requests))
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del limiter
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=120)
+    args = parser.parse_args()
+
+    keys = [f"client-{index}" for index in range(args.keys)]
+    print(f"{'backend':>16}  {'total MiB':>10}  {'bytes/key':>10}")
+    for name, factory in (
+        ("memory", SlidingWindowRateLimiter),
+        ("memory_counter", SlidingWindowCounterRateLimiter),
+    ):
+        used = _measure(factory, keys=keys, requests=args.requests)
+        print(f"{name:>16}  {used / 2**20:>10.1f}  {used / len(keys):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Per-request cost of tenant resolution + rate limiting middleware, by key derivation.
+
+Usage:
+    poetry run python scripts/benchmarks/rate_limit_middleware.py
+    poetry run python scripts/benchmarks/rate_limit_middleware.py --requests 500000 --trust-xff
+
+Drives ``TenantMiddleware -> RateLimitMiddleware -> no-op app`` with pre-built ASGI scopes
+(1,000 client/path combinations, realistic header list) against an in-memory limiter that never
+denies, so the numbers isolate header parsing, key derivation and limiter bookkeeping. The
+``sha256`` row reproduces the previous key derivation for comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import time
+
+from starlette.types import Message, Receive, Scope, Send
+
+from __PROJECT_SLUG__.core.middleware.rate_limit import (
+    RateLimitKeyBuilder,
+    RateLimitMiddleware,
+    SlidingWindowRateLimiter,
+    digest_rate_limit_key,
+    join_rate_limit_key,
+)
+from __PROJECT_SLUG__.core.middleware.tenant import TenantMiddleware
+
+
+def _sha256_key(parts: tuple[str, ...]) -> str:
+    return hashlib.sha256(":".join(parts).encode("utf-8")).hexdigest()
+
+
+async def _noop_app(scope: Scope, receive: Receive, send: Send) -> None:
+    return None
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message: Message) -> None:
+    return None
+
+
+def _scopes(count: int) -> list[Scope]:
+    headers = [
+        (b"host", b"api.example.com"),
+        (b"user-agent", b"bench/1.0"),
+        (b"accept", b"application/json"),
+        (b"x-request-id", b"3f1c0b8e-2d7a-4f0e-9a55-0c1d2e3f4a5b"),
+        (b"x-tenant-id", b"acme-corp"),
+        (b"x-forwarded-for", b"198.51.100.7, 10.0.0.1"),
+    ]
+    return [
+        {
+            "type": "http",
+            "method": "GET",
+            "path": f"/api/v1/items/{index}",
+            "headers": headers,
+            "client": (f"10.0.{index % 250}.1", 50000),
+        }
+        for index in range(count)
+    ]
+
+
+async def _run(key_builder: RateLimitKeyBuilder, *, requests: int, trust_xff: bool) -> float:
+    app = TenantMiddleware(
+        RateLimitMiddleware(
+            _noop_app,
+            limiter=SlidingWindowRateLimiter(
+                max_requests=1_000_000_000,
+                window_seconds=60,
+                max_keys=10_000,
+            ),
+            exempt_paths=["/health"],
+            trust_x_forwarded_for=trust_xff,
+            key_builder=key_builder,
+        )
+    )
+    scopes = _scopes(1000)
+    for scope in scopes:
+        await app(scope, _receive, _send)
+
+    start = time.perf_counter()
+    for index in range(requests):
+        await app(scopes[index % len(scopes)], _receive, _send)
+    elapsed = time.perf_counter() - start
+    return elapsed / requests * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--trust-xff", action="store_true")
+    args = parser.parse_args()
+
+    builders: dict[str, RateLimitKeyBuilder] = {
+        "sha256 (previous)": _sha256_key,
+        "blake2b-128 (redis)": digest_rate_limit_key,
+        "joined (memory/shm)": join_rate_limit_key,
+    }
+    print(f"{'key derivation':>20}  {'us/request':>10}")
+    for name, builder in builders.items():
+        per_request_us = asyncio.run(
+            _run(builder, requests=args.requests, trust_xff=args.trust_xff)
+        )
+        print(f"{name:>20}  {per_request_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Aggregate throughput of the shared-memory limiter vs the Redis backend across worker processes.
+
+Usage:
+    poetry run python scripts/benchmarks/rate_limit_shm.py
+    poetry run python scripts/benchmarks/rate_limit_shm.py --workers 8 --redis-url redis://localhost:6379/0
+
+Each backend is driven by ``--workers`` forked processes (standing in for ``uvicorn --workers``)
+that run ``--checks`` sequential checks over ``--clients`` keys. When ``--redis-url`` is
+unreachable the Redis limiter runs against an in-process ``fakeredis`` client per worker instead
+(``pip install "fakeredis[lua]"``). That row measures the client and Lua script path without a
+network hop or shared counters, so it is not a like-for-like number; point ``--redis-url`` at a
+local ``redis-server`` for that.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from __PROJECT_SLUG__.core.middleware.rate_limit import RateLimiter, build_rate_limiter
+
+
+def _build(backend: str, args: argparse.Namespace, shm_path: str) -> RateLimiter:
+    redis_client = None
+    if backend == "fakeredis":
+        from fakeredis import aioredis
+
+        backend, redis_client = "redis", aioredis.FakeRedis(decode_responses=True)
+    return build_rate_limiter(
+        backend=backend,
+        max_requests=1_000_000,
+        window_seconds=60,
+        memory_max_keys=args.clients,
+        redis_url=args.redis_url,
+        redis_prefix="bench",
+        shm_path=shm_path,
+        redis_client=redis_client,
+    )
+
+
+def _worker(backend: str, args: argparse.Namespace, shm_path: str, worker_id: int) -> None:
+    async def run() -> None:
+        limiter = _build(backend, args, shm_path)
+        for index in range(args.checks):
+            await limiter.check(f"client-{(index * 7919 + worker_id) % args.clients}")
+        await limiter.close()
+
+    asyncio.run(run())
+
+
+async def _reachable(backend: str, args: argparse.Namespace, shm_path: str) -> bool:
+    limiter = _build(backend, args, shm_path)
+    try:
+        await limiter.ping()
+    except Exception:
+        return False
+    finally:
+        await limiter.close()
+    return True
+
+
+def _throughput(backend: str, args: argparse.Namespace, shm_path: str) -> float:
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_worker, args=(backend, args, shm_path, worker_id))
+        for worker_id in range(args.workers)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+        if worker.exitcode != 0:
+            raise RuntimeError(f"{backend} worker exited with {worker.exitcode}")
+    elapsed = time.perf_counter() - start
+    return args.workers * args.checks / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--checks", type=int, default=20_000)
+    parser.add_argument("--clients", type=int, default=10_000)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        shm_path = os.path.join(directory, "rate-limit.shm")
+        redis_backend = "redis"
+        if not asyncio.run(_reachable("redis", args, shm_path)):
+            if importlib.util.find_spec("fakeredis") is None:
+                sys.exit(f"{args.redis_url} is unreachable; install fakeredis[lua] to fall back")
+            redis_backend = "fakeredis"
+        print(f"{'backend':>9}  {'checks/s':>12}")
+        for backend in ("shm", redis_backend):
+            rate = _throughput(backend, args, shm_path)
+            print(f"{backend:>9}  {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""Bulk user provisioning from NDJSON records.
+
+Usage:
+    python -m __PROJECT_SLUG__.api.v1.features.auth.provisioning users.ndjson
+    python -m __PROJECT_SLUG__.api.v1.features.auth.provisioning - --workers 8 < users.ndjson
+
+Each input line is one ``UserImportRecord`` (``{"username": ..., "password": ...,
+"scopes": [...], "is_active": true}``), and each output line is a ``UserImportResult``: the line
+number plus ``created``, ``exists``, ``duplicate`` or ``invalid``. Records are read as a stream
+and handled in batches: usernames that already exist are filtered out first so their
+passwords are never hashed, the remaining passwords are hashed in parallel on a process pool
+(one worker per core by default), and the batch is written with one multi-row ``INSERT``. The
+same code backs ``POST /api/v1/auth/users/import``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from __PROJECT_SLUG__.api.v1.features.auth.repository import AuthRepository
+from __PROJECT_SLUG__.api.v1.features.auth.schemas import UserImportRecord, UserImportResult
+from __PROJECT_SLUG__.api.v1.features.auth.service import scopes_to_csv
+from __PROJECT_SLUG__.core.security.hashing import PasswordHashingExecutor
+from __PROJECT_SLUG__.core.security.passwords import (
+    PasswordHashProfile,
+    get_password_hash_profile,
+    hash_password,
+)
+
+USER_IMPORT_PATH = "/api/v1/auth/users/import"
+
+
+def resolve_hash_workers(configured: int) -> int:
+    return configured or os.cpu_count() or 1
+
+
+class UserImportLimitError(ValueError):
+    """Raised when an import exceeds its line length or record count limit."""
+
+
+async def iter_lines(chunks: AsyncIterable[bytes], *, max_line_bytes: int) -> AsyncIterator[bytes]:
+    """Split a byte stream into lines, buffering at most one partial line.
+
+    Each chunk is scanned once and a partial line is kept as a list of pieces, so a long line is
+    joined once rather than copied on every chunk. A line longer than ``max_line_bytes`` raises
+    ``UserImportLimitError`` as soon as the chunk that crosses the cap arrives.
+    """
+    pending: list[bytes] = []
+    pending_bytes = 0
+    line_number = 0
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            line_number += 1
+            if pending_bytes + end - start > max_line_bytes:
+                raise UserImportLimitError(f"Line {line_number} exceeds {max_line_bytes} bytes.")
+            if pending:
+                pending.append(chunk[start:end])
+                yield b"".join(pending)
+                pending.clear()
+                pending_bytes = 0
+            else:
+                yield chunk[start:end]
+            start = end + 1
+        if start < len(chunk):
+            pending.append(chunk[start:])
+            pending_bytes += len(chunk) - start
+            if pending_bytes > max_line_bytes:
+                raise UserImportLimitError(
+                    f"Line {line_number + 1} exceeds {max_line_bytes} bytes."
+                )
+    if pending:
+        yield b"".join(pending)
+
+
+def _invalid(line: int, exc: ValidationError) -> UserImportResult:
+    error = exc.errors()[0]
+    location = ".".join(str(part) for part in error["loc"])
+    return UserImportResult(
+        line=line,
+        status="invalid",
+        detail=f"{location}: {error['msg']}" if location else error["msg"],
+    )
+
+
+async def _import_batch(
+    batch: list[tuple[int, UserImportRecord]],
+    *,
+    session_factory: async_sessionmaker[AsyncSession],
+    hashing: PasswordHashingExecutor,
+    profile: PasswordHashProfile,
+) -> list[UserImportResult]:
+    async with session_factory() as session:
+        existing = await AuthRepository(session).get_existing_usernames(
+            [record.username for _, record in batch]
+        )
+    fresh = [(line, record) for line, record in batch if record.username not in existing]
+    # The session is closed while hashing, so no connection sits idle in a transaction.
+    password_hashes = await asyncio.gather(
+        *(hashing.run("import", hash_password, record.password, profile) for _, record in fresh)
+    )
+    async with session_factory() as session:
+        created = await AuthRepository(session).create_users(
+            [
+                {
+                    "username": record.username,
+                    "password_hash": password_hash,
+                    "scopes_csv": scopes_to_csv(record.scopes),
+                    "is_active": record.is_active,
+                }
+                for (_, record), password_hash in zip(fresh, password_hashes, strict=True)
+            ]
+        )
+    return [
+        UserImportResult(
+            line=line,
+            username=record.username,
+            status="created" if record.username in created else "exists",
+        )
+        for line, record in batch
+    ]
+
+
+async def import_users(
+    lines: AsyncIterable[bytes],
+    *,
+    session_factory: async_sessionmaker[AsyncSession],
+    hashing: PasswordHashingExecutor,
+    batch_size: int,
+    profile: PasswordHashProfile | None = None,
+    max_records: int | None = None,
+) -> AsyncIterator[UserImportResult]:
+    """Create users from NDJSON ``lines``, yielding one result per non-blank line.
+
+    Invalid and repeated records are reported as soon as they are read; the others when their
+    batch is committed, so results are not in input order (each carries its line number).
+    ``hashing`` must admit at least ``batch_size`` calls at once. A record past ``max_records``
+    raises ``UserImportLimitError`` once the records before it are committed.
+    """
+    profile = profile or get_password_hash_profile()
+    seen: set[str] = set()
+    batch: list[tuple[int, UserImportRecord]] = []
+    line_number = 0
+    records = 0
+    async for raw in lines:
+        line_number += 1
+        if not raw.strip():
+            continue
+        records += 1
+        if max_records is not None and records > max_records:
+            if batch:
+                for result in await _import_batch(
+                    batch, session_factory=session_factory, hashing=hashing, profile=profile
+                ):
+                    yield result
+            raise UserImportLimitError(f"Imports are limited to {max_records} records.")
+        try:
+            record = UserImportRecord.model_validate_json(raw)
+        except ValidationError as exc:
+            yield _invalid(line_number, exc)
+            continue
+        if record.username in seen:
+            yield UserImportResult(line=line_number, username=record.username, status="duplicate")
+            continue
+        seen.add(record.username)
+        batch.append((line_number, record))
+        if len(batch) >= batch_size:
+            for result in await _import_batch(
+                batch, session_factory=session_factory, hashing=hashing, profile=profile
+            ):
+                yield result
+            batch = []
+    if batch:
+        for result in await _import_batch(
+            batch, session_factory=session_factory, hashing=hashing, profile=profile
+        ):
+            yield result
+
+
+async def _read_file(path: str) -> AsyncIterator[bytes]:
+    if path == "-":
+        for line in sys.stdin.buffer:
+            yield line.rstrip(b"\r\n")
+        return
+    with open(path, "rb") as stream:
+        for line in stream:
+            yield line.rstrip(b"\r\n")
+
+
+async def _run(args: argparse.Namespace) -> int:
+    from __PROJECT_SLUG__.core.config import get_settings
+    from __PROJECT_SLUG__.core.db import db_manager
+
+    settings = get_settings()
+    db_manager.configure(settings)
+    batch_size = args.batch_size or settings.auth_user_import_batch_size
+    workers = resolve_hash_workers(args.workers or settings.auth_user_import_hash_workers)
+    hashing = PasswordHashingExecutor(kind="process", max_workers=workers, max_queue=batch_size)
+    statuses: Counter[str] = Counter()
+    started = time.perf_counter()
+    try:
+        async for result in import_users(
+            _read_file(args.path),
+            session_factory=db_manager.session_factory,
+            hashing=hashing,
+            batch_size=batch_size,
+        ):
+            statuses[result.status] += 1
+            if not args.quiet or result.status == "invalid":
+                print(result.model_dump_json(exclude_none=True))
+    finally:
+        hashing.shutdown()
+        await db_manager.dispose()
+    elapsed = time.perf_counter() - started
+    print(
+        f"{sum(statuses.values())} records in {elapsed:.1f}s "
+        f"({statuses['created'] / elapsed if elapsed else 0:.0f} users/s created with "
+        f"{workers} hashing workers): {dict(sorted(statuses.items()))}",
+        file=sys.stderr,
+    )
+    return 1 if statuses["invalid"] else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="NDJSON file with one user per line, or - for stdin")
+    parser.add_argument("--batch-size", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=0, help="hashing processes (default: cores)")
+    parser.add_argument("--quiet", action="store_true", help="only print invalid records")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(_run(args)))
+
+
+if __name__ == "__main__":
+    main()
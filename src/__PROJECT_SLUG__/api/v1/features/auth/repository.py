@@ -1,12 +1,86 @@
 from __future__ import annotations
 
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Select,
+    String,
+    Uuid,
+    delete,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
-from __PROJECT_SLUG__.api.v1.features.auth.models import RefreshToken, User
+from __PROJECT_SLUG__.api.v1.features.auth.models import RefreshToken, RevokedAccessToken, User
+
+
+@dataclass(frozen=True, slots=True)
+class RefreshTokenOwner:
+    user_id: UUID
+    username: str
+    scopes_csv: str
+
+
+def build_rotate_refresh_token_statement(
+    token_hash: str,
+    *,
+    new_token_hash: str,
+    new_expires_at: datetime,
+    now: datetime,
+) -> Select:
+    """Consume a refresh token, look up its active owner and insert the successor in one query.
+
+    PostgreSQL runs every data-modifying CTE exactly once, whether or not the outer query reads
+    its rows: the old token is revoked even when the owner is missing or inactive, and the new
+    token is inserted only for an active owner. ``UPDATE ... WHERE revoked_at IS NULL`` takes the
+    row lock, so concurrent rotations of one token serialize and only the first one returns a row.
+    """
+    consumed = (
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > now,
+        )
+        .values(revoked_at=now)
+        .returning(RefreshToken.user_id)
+        .cte("consumed")
+    )
+    owner = (
+        select(User.id, User.username, User.scopes_csv)
+        .join(consumed, consumed.c.user_id == User.id)
+        .where(User.is_active.is_(True))
+        .cte("owner")
+    )
+    inserted = (
+        insert(RefreshToken)
+        .from_select(
+            ["id", "user_id", "token_hash", "expires_at", "created_at"],
+            select(
+                literal(uuid.uuid4(), Uuid(as_uuid=True)),
+                owner.c.id,
+                literal(new_token_hash, String(64)),
+                literal(new_expires_at, DateTime(timezone=True)),
+                literal(now, DateTime(timezone=True)),
+            ),
+        )
+        .returning(RefreshToken.user_id)
+        .cte("inserted")
+    )
+    return select(owner.c.id, owner.c.username, owner.c.scopes_csv).join(
+        inserted, inserted.c.user_id == owner.c.id
+    )
 
 
 class AuthRepository:
@@ -37,12 +111,63 @@ class AuthRepository:
             is_active=is_active,
         )
         self.session.add(user)
+        # Every column is generated in Python and sessions keep attributes on commit
+        # (expire_on_commit=False), so the flushed object is already complete: no reload.
         await self.session.flush()
         if commit:
             await self.session.commit()
-            await self.session.refresh(user)
         return user
 
+    async def get_existing_usernames(self, usernames: Sequence[str]) -> set[str]:
+        result = await self.session.execute(
+            select(User.username).where(User.username.in_(usernames))
+        )
+        return set(result.scalars())
+
+    async def create_users(
+        self, users: Sequence[dict[str, object]], *, commit: bool = True
+    ) -> set[str]:
+        """Insert ``users`` in one multi-row statement; return the usernames actually created.
+
+        Each mapping holds ``username``, ``password_hash``, ``scopes_csv`` and ``is_active``.
+        Usernames that already exist (including ones created concurrently) are skipped.
+        """
+        if not users:
+            return set()
+        now = datetime.now(UTC)
+        dialect = postgresql if self.session.get_bind().dialect.name == "postgresql" else sqlite
+        statement = (
+            dialect.insert(User)
+            .values([{"id": uuid.uuid4(), "created_at": now, **user} for user in users])
+            .on_conflict_do_nothing(index_elements=[User.username])
+            .returning(User.username)
+        )
+        result = await self.session.execute(statement)
+        created = set(result.scalars())
+        if commit:
+            await self.session.commit()
+        return created
+
+    async def update_password_hash(
+        self,
+        user_id: UUID,
+        *,
+        expected_hash: str,
+        password_hash: str,
+        commit: bool = True,
+    ) -> bool:
+        statement = (
+            update(User)
+            .where(User.id == user_id, User.password_hash == expected_hash)
+            .values(password_hash=password_hash)
+            .returning(User.id)
+        )
+        result = await self.session.execute(statement)
+        changed = result.scalar_one_or_none() is not None
+        if changed and commit:
+            await self.session.commit()
+        return changed
+
     async def create_refresh_token(
         self,
         *,
@@ -60,7 +185,6 @@ class AuthRepository:
         await self.session.flush()
         if commit:
             await self.session.commit()
-            await self.session.refresh(refresh)
         return refresh
 
     async def get_valid_refresh_token(self, token_hash: str) -> RefreshToken | None:
@@ -92,6 +216,55 @@ class AuthRepository:
             await self.session.commit()
         return user_id
 
+    async def rotate_refresh_token(
+        self,
+        token_hash: str,
+        *,
+        new_token_hash: str,
+        new_expires_at: datetime,
+        commit: bool = True,
+    ) -> RefreshTokenOwner | None:
+        """Revoke ``token_hash`` and issue ``new_token_hash`` to its owner if the owner is active.
+
+        The old token is consumed even when no new one is issued (inactive or deleted owner).
+        PostgreSQL does all of it in one statement; other databases run the same steps one
+        statement at a time inside the session's transaction.
+        """
+        now = datetime.now(UTC)
+        if self.session.get_bind().dialect.name == "postgresql":
+            statement = build_rotate_refresh_token_statement(
+                token_hash,
+                new_token_hash=new_token_hash,
+                new_expires_at=new_expires_at,
+                now=now,
+            )
+            row = (await self.session.execute(statement)).one_or_none()
+            owner = None if row is None else RefreshTokenOwner(*row)
+        else:
+            owner = await self._rotate_refresh_token_stepwise(
+                token_hash, new_token_hash=new_token_hash, new_expires_at=new_expires_at
+            )
+        if commit:
+            await self.session.commit()
+        return owner
+
+    async def _rotate_refresh_token_stepwise(
+        self, token_hash: str, *, new_token_hash: str, new_expires_at: datetime
+    ) -> RefreshTokenOwner | None:
+        user_id = await self.consume_refresh_token(token_hash, commit=False)
+        if user_id is None:
+            return None
+        user = await self.get_user_by_id(user_id)
+        if user is None or not user.is_active:
+            return None
+        await self.create_refresh_token(
+            user_id=user.id,
+            token_hash=new_token_hash,
+            expires_at=new_expires_at,
+            commit=False,
+        )
+        return RefreshTokenOwner(user.id, user.username, user.scopes_csv)
+
     async def revoke_refresh_token(self, token_hash: str, *, commit: bool = True) -> bool:
         statement = (
             update(RefreshToken)
@@ -107,3 +280,76 @@ class AuthRepository:
         if changed and commit:
             await self.session.commit()
         return changed
+
+    async def delete_expired_refresh_tokens(
+        self, *, before: datetime, limit: int, commit: bool = True
+    ) -> int:
+        return await self._delete_batch(
+            RefreshToken.id, RefreshToken.expires_at <= before, limit=limit, commit=commit
+        )
+
+    async def delete_revoked_refresh_tokens(self, *, limit: int, commit: bool = True) -> int:
+        return await self._delete_batch(
+            RefreshToken.id, RefreshToken.revoked_at.is_not(None), limit=limit, commit=commit
+        )
+
+    async def revoke_access_token(
+        self, jti: str, *, expires_at: datetime, commit: bool = True
+    ) -> None:
+        dialect = postgresql if self.session.get_bind().dialect.name == "postgresql" else sqlite
+        statement = (
+            dialect.insert(RevokedAccessToken)
+            .values(jti=jti, expires_at=expires_at, revoked_at=datetime.now(UTC))
+            .on_conflict_do_nothing(index_elements=[RevokedAccessToken.jti])
+        )
+        await self.session.execute(statement)
+        if commit:
+            await self.session.commit()
+
+    async def list_access_token_revocations(
+        self, *, since: datetime | None, now: datetime
+    ) -> list[tuple[str, datetime, datetime]]:
+        statement = select(
+            RevokedAccessToken.jti, RevokedAccessToken.expires_at, RevokedAccessToken.revoked_at
+        ).where(RevokedAccessToken.expires_at > now)
+        if since is not None:
+            statement = statement.where(RevokedAccessToken.revoked_at >= since)
+        result = await self.session.execute(statement)
+        return [(jti, expires_at, revoked_at) for jti, expires_at, revoked_at in result]
+
+    async def delete_expired_access_token_revocations(
+        self, *, before: datetime, limit: int, commit: bool = True
+    ) -> int:
+        return await self._delete_batch(
+            RevokedAccessToken.jti,
+            RevokedAccessToken.expires_at <= before,
+            limit=limit,
+            commit=commit,
+        )
+
+    async def _delete_batch(
+        self,
+        key: InstrumentedAttribute,
+        condition: ColumnElement[bool],
+        *,
+        limit: int,
+        commit: bool,
+    ) -> int:
+        """Delete at most ``limit`` rows matching ``condition``; return how many.
+
+        Rows locked by a concurrent writer or by another replica's purge are skipped rather
+        than waited on (``FOR UPDATE SKIP LOCKED``; a no-op on SQLite).
+        """
+        batch = (
+            select(key)
+            .where(condition)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            delete(key.class_).where(key.in_(batch)).execution_options(synchronize_session=False)
+        )
+        if commit:
+            await self.session.commit()
+        return result.rowcount
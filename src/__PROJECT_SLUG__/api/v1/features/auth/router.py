@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from datetime import UTC, datetime
 from json import JSONDecodeError
 from typing import Annotated
 from urllib.parse import parse_qs
@@ -8,18 +11,33 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from __PROJECT_SLUG__.api.v1.features.auth import service
+from __PROJECT_SLUG__.api.v1.features.auth import provisioning, service
 from __PROJECT_SLUG__.api.v1.features.auth.schemas import (
     PasswordGrantRequest,
     RefreshTokenRequest,
     TokenResponse,
+    UserImportResult,
+    UserImportSummary,
 )
 from __PROJECT_SLUG__.core.config import get_settings
-from __PROJECT_SLUG__.core.db import get_db_session
-from __PROJECT_SLUG__.core.security.auth import authenticate_admin_user, create_access_token
+from __PROJECT_SLUG__.core.db import db_manager, get_db_session
+from __PROJECT_SLUG__.core.security.auth import (
+    AuthPrincipal,
+    authenticate_admin_user,
+    create_access_token,
+    decode_access_token,
+    oauth2_scheme,
+    require_scopes,
+)
+from __PROJECT_SLUG__.core.security.hashing import PasswordHashingBusyError, user_import_hashing
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# One import per worker at a time: the import pool admits exactly one batch of hashes.
+_user_import_lock = asyncio.Lock()
+# Only this many duplicate/invalid lines are echoed back; the counts cover the rest.
+USER_IMPORT_MAX_REPORTED_ERRORS = 1000
+
 
 async def parse_password_grant_request(request: Request) -> PasswordGrantRequest:
     content_type = request.headers.get("content-type", "").lower()
@@ -77,11 +95,18 @@ async def issue_access_token(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Database session is required for database-backed authentication.",
             )
-        user = await service.authenticate_database_user(
-            username=form_data.username,
-            password=form_data.password,
-            session=db_session,
-        )
+        try:
+            user = await service.authenticate_database_user(
+                username=form_data.username,
+                password=form_data.password,
+                session=db_session,
+            )
+        except PasswordHashingBusyError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent sign-in attempts. Retry shortly.",
+                headers={"Retry-After": "1"},
+            ) from exc
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -197,7 +222,9 @@ async def refresh_access_token(
 async def revoke_refresh_token(
     payload: RefreshTokenRequest,
     db_session: Annotated[AsyncSession | None, Depends(get_db_session)],
+    access_token: Annotated[str | None, Depends(oauth2_scheme)],
 ) -> None:
+    """Revoke a refresh token and, when sent as the bearer token, the caller's access token."""
     settings = get_settings()
     if not settings.auth_enabled:
         raise HTTPException(
@@ -216,3 +243,75 @@ async def revoke_refresh_token(
         )
 
     await service.revoke_refresh_token(session=db_session, refresh_token=payload.refresh_token)
+
+    if not access_token or not settings.auth_access_token_revocation_enabled:
+        return
+    try:
+        claims = decode_access_token(access_token)
+    except HTTPException:
+        # Revocation stays idempotent: an invalid or expired access token needs no revoking.
+        return
+    jti, expires_at = claims.get("jti"), claims.get("exp")
+    if isinstance(jti, str) and isinstance(expires_at, int):
+        await service.revoke_access_token(
+            session=db_session, jti=jti, expires_at=datetime.fromtimestamp(expires_at, UTC)
+        )
+
+
+@router.post("/users/import", response_model=UserImportSummary)
+async def import_users(
+    request: Request,
+    _principal: Annotated[AuthPrincipal, Depends(require_scopes(["users:write"]))],
+) -> UserImportSummary:
+    """Create users from an NDJSON body; returns counts per status and the rejected lines.
+
+    The body is consumed as it arrives and each batch is committed as soon as it is read. The
+    summary is sent when the import finishes: a streamed response would compete with the body
+    for the ASGI ``receive`` channel. Only counts and the duplicate or invalid lines are kept,
+    so memory does not grow with the size of the import.
+    """
+    settings = get_settings()
+    if not settings.auth_use_database:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User import requires auth_use_database=true.",
+        )
+    if _user_import_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A user import is already running. Retry when it has finished.",
+        )
+
+    statuses: Counter[str] = Counter()
+    errors: list[UserImportResult] = []
+    async with _user_import_lock:
+        try:
+            async for result in provisioning.import_users(
+                provisioning.iter_lines(
+                    request.stream(), max_line_bytes=settings.auth_user_import_max_line_bytes
+                ),
+                session_factory=db_manager.session_factory,
+                hashing=user_import_hashing,
+                batch_size=settings.auth_user_import_batch_size,
+                max_records=settings.auth_user_import_max_records,
+            ):
+                statuses[result.status] += 1
+                if (
+                    result.status in {"duplicate", "invalid"}
+                    and len(errors) < USER_IMPORT_MAX_REPORTED_ERRORS
+                ):
+                    errors.append(result)
+        except provisioning.UserImportLimitError as exc:
+            # Batches before the limit stay committed; re-running reports them as ``exists``.
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=f"{exc} {statuses['created']} users were created before the limit.",
+            ) from exc
+    return UserImportSummary(
+        created=statuses["created"],
+        exists=statuses["exists"],
+        duplicate=statuses["duplicate"],
+        invalid=statuses["invalid"],
+        errors=errors,
+        errors_truncated=statuses["duplicate"] + statuses["invalid"] > len(errors),
+    )
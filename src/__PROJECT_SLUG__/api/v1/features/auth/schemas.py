@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class TokenResponse(BaseModel):
@@ -20,3 +20,30 @@ class PasswordGrantRequest(BaseModel):
 
 class RefreshTokenRequest(BaseModel):
     refresh_token: str
+
+
+class UserImportRecord(BaseModel):
+    """One line of a bulk user import (NDJSON)."""
+
+    username: str = Field(..., min_length=1, max_length=100)
+    password: str = Field(..., min_length=1)
+    scopes: list[str] = Field(default_factory=list)
+    is_active: bool = True
+
+
+class UserImportResult(BaseModel):
+    line: int
+    username: str | None = None
+    status: str
+    detail: str | None = None
+
+
+class UserImportSummary(BaseModel):
+    """Result counts of an API import, with the duplicate and invalid lines up to a cap."""
+
+    created: int = 0
+    exists: int = 0
+    duplicate: int = 0
+    invalid: int = 0
+    errors: list[UserImportResult] = Field(default_factory=list)
+    errors_truncated: bool = False
@@ -1,34 +1,36 @@
 from __future__ import annotations
 
-import base64
-import hashlib
-import hmac
-import os
+import asyncio
+import random
 import secrets
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from hashlib import sha256
 from uuid import UUID
 
-try:
-    from argon2 import PasswordHasher
-    from argon2.exceptions import InvalidHashError, VerifyMismatchError
-
-    _ARGON2_AVAILABLE = True
-except ImportError:  # pragma: no cover - depends on installed runtime deps
-    PasswordHasher = None  # type: ignore[assignment,misc]
-    InvalidHashError = ValueError  # type: ignore[assignment,misc]
-    VerifyMismatchError = ValueError  # type: ignore[assignment,misc]
-    _ARGON2_AVAILABLE = False
+import structlog
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from __PROJECT_SLUG__.api.v1.features.auth.models import User
 from __PROJECT_SLUG__.api.v1.features.auth.repository import AuthRepository
-
-_password_hasher = PasswordHasher() if PasswordHasher is not None else None
-_PBKDF2_SCHEME = "pbkdf2_sha256"
-_PBKDF2_ITERATIONS = 390000
+from __PROJECT_SLUG__.core.config import get_settings
+from __PROJECT_SLUG__.core.metrics.auth import (
+    record_refresh_token_purge_batch,
+    set_revoked_access_tokens,
+)
+from __PROJECT_SLUG__.core.metrics.password_hashing import record_rehash
+from __PROJECT_SLUG__.core.security.hashing import password_hashing
+from __PROJECT_SLUG__.core.security.passwords import (
+    get_password_hash_profile,
+    hash_password,
+    verify_and_update,
+    verify_password,
+)
+from __PROJECT_SLUG__.core.security.revocation import access_token_revocations
+
+log = structlog.get_logger()
 
 
 @dataclass(slots=True)
@@ -52,65 +54,6 @@ def scopes_from_csv(scopes_csv: str) -> list[str]:
     return _normalize_scopes(scopes_csv.split(","))
 
 
-def _b64encode(value: bytes) -> str:
-    return base64.urlsafe_b64encode(value).decode("utf-8").rstrip("=")
-
-
-def _b64decode(value: str) -> bytes:
-    padded = value + "=" * (-len(value) % 4)
-    return base64.urlsafe_b64decode(padded.encode("utf-8"))
-
-
-def _hash_password_pbkdf2(password: str) -> str:
-    salt = os.urandom(16)
-    derived = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt,
-        _PBKDF2_ITERATIONS,
-    )
-    return f"{_PBKDF2_SCHEME}${_PBKDF2_ITERATIONS}${_b64encode(salt)}${_b64encode(derived)}"
-
-
-def _verify_password_pbkdf2(password: str, password_hash: str) -> bool:
-    parts = password_hash.split("$")
-    if len(parts) != 4 or parts[0] != _PBKDF2_SCHEME:
-        return False
-
-    try:
-        iterations = int(parts[1])
-        salt = _b64decode(parts[2])
-        expected = _b64decode(parts[3])
-    except (TypeError, ValueError):
-        return False
-
-    derived = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt,
-        iterations,
-    )
-    return hmac.compare_digest(derived, expected)
-
-
-def hash_password(password: str) -> str:
-    if _password_hasher is not None:
-        return _password_hasher.hash(password)
-    return _hash_password_pbkdf2(password)
-
-
-def verify_password(password: str, password_hash: str) -> bool:
-    if password_hash.startswith(f"{_PBKDF2_SCHEME}$"):
-        return _verify_password_pbkdf2(password, password_hash)
-    if _password_hasher is None:
-        return False
-
-    try:
-        return _password_hasher.verify(password_hash, password)
-    except (VerifyMismatchError, InvalidHashError):
-        return False
-
-
 def hash_refresh_token(token: str) -> str:
     return sha256(token.encode("utf-8")).hexdigest()
 
@@ -125,8 +68,24 @@ async def authenticate_database_user(
     user = await repo.get_user_by_username(username)
     if user is None or not user.is_active:
         return None
-    if not verify_password(password, user.password_hash):
+    profile = get_password_hash_profile()
+    if get_settings().auth_password_rehash_on_login:
+        verified, new_hash = await password_hashing.run(
+            "verify", verify_and_update, password, user.password_hash, profile
+        )
+    else:
+        verified = await password_hashing.run(
+            "verify", verify_password, password, user.password_hash
+        )
+        new_hash = None
+    if not verified:
         return None
+    # An off-profile hash (other scheme or cost) is swapped while the password is known. The
+    # update is a compare-and-set on the old hash so a concurrent password change always wins.
+    if new_hash is not None and await repo.update_password_hash(
+        user.id, expected_hash=user.password_hash, password_hash=new_hash
+    ):
+        record_rehash(profile.effective_scheme)
 
     return AuthenticatedUser(
         user_id=user.id,
@@ -143,10 +102,13 @@ async def ensure_admin_user(
     scopes: list[str],
 ) -> bool:
     repo = AuthRepository(session)
+    password_hash = await password_hashing.run(
+        "hash", hash_password, password, get_password_hash_profile()
+    )
     try:
         await repo.create_user(
             username=username,
-            password_hash=hash_password(password),
+            password_hash=password_hash,
             scopes_csv=scopes_to_csv(scopes),
             is_active=True,
         )
@@ -208,33 +170,26 @@ async def rotate_refresh_token(
     expires_minutes: int,
 ) -> tuple[AuthenticatedUser, str, int] | None:
     repo = AuthRepository(session)
-    token_hash = hash_refresh_token(refresh_token)
-    user_id = await repo.consume_refresh_token(token_hash, commit=False)
-    if user_id is None:
-        return None
-
+    new_refresh_token = secrets.token_urlsafe(48)
+    expires_delta = timedelta(minutes=expires_minutes)
     try:
-        user = await repo.get_user_by_id(user_id)
-        if user is None or not user.is_active:
-            await session.commit()
-            return None
-
-        new_refresh_token, refresh_expires_in = await issue_refresh_token(
-            session=session,
-            user_id=user.id,
-            expires_minutes=expires_minutes,
-            commit=False,
+        owner = await repo.rotate_refresh_token(
+            hash_refresh_token(refresh_token),
+            new_token_hash=hash_refresh_token(new_refresh_token),
+            new_expires_at=datetime.now(UTC) + expires_delta,
         )
-        await session.commit()
-        principal = AuthenticatedUser(
-            user_id=user.id,
-            username=user.username,
-            scopes=scopes_from_csv(user.scopes_csv),
-        )
-        return principal, new_refresh_token, refresh_expires_in
     except Exception:
         await session.rollback()
         raise
+    if owner is None:
+        return None
+
+    principal = AuthenticatedUser(
+        user_id=owner.user_id,
+        username=owner.username,
+        scopes=scopes_from_csv(owner.scopes_csv),
+    )
+    return principal, new_refresh_token, int(expires_delta.total_seconds())
 
 
 async def revoke_refresh_token(*, session: AsyncSession, refresh_token: str) -> bool:
@@ -242,6 +197,128 @@ async def revoke_refresh_token(*, session: AsyncSession, refresh_token: str) ->
     return await repo.revoke_refresh_token(hash_refresh_token(refresh_token))
 
 
+async def purge_refresh_tokens(
+    *,
+    session_factory: async_sessionmaker[AsyncSession],
+    batch_size: int,
+    batch_pause_seconds: float,
+) -> int:
+    """Delete expired, then revoked, refresh tokens in batches; return how many were deleted.
+
+    Every batch is its own short transaction on its own pooled connection, with a pause between
+    batches, so a large backlog never holds locks or a connection away from logins for long.
+    """
+    now = datetime.now(UTC)
+    total = 0
+    for reason in ("expired", "revoked"):
+        while True:
+            started = time.perf_counter()
+            async with session_factory() as session:
+                repo = AuthRepository(session)
+                if reason == "expired":
+                    deleted = await repo.delete_expired_refresh_tokens(before=now, limit=batch_size)
+                else:
+                    deleted = await repo.delete_revoked_refresh_tokens(limit=batch_size)
+            record_refresh_token_purge_batch(reason, deleted, time.perf_counter() - started)
+            total += deleted
+            if deleted < batch_size:
+                break
+            await asyncio.sleep(batch_pause_seconds)
+    return total
+
+
+async def purge_access_token_revocations(
+    *,
+    session_factory: async_sessionmaker[AsyncSession],
+    batch_size: int,
+    batch_pause_seconds: float,
+) -> int:
+    now = datetime.now(UTC)
+    total = 0
+    while True:
+        async with session_factory() as session:
+            deleted = await AuthRepository(session).delete_expired_access_token_revocations(
+                before=now, limit=batch_size
+            )
+        total += deleted
+        if deleted < batch_size:
+            return total
+        await asyncio.sleep(batch_pause_seconds)
+
+
+async def run_refresh_token_purge(
+    *,
+    session_factory: async_sessionmaker[AsyncSession],
+    interval_seconds: float,
+    batch_size: int,
+    batch_pause_seconds: float,
+) -> None:
+    """Purge refresh tokens and expired access token revocations every ``interval_seconds``."""
+    # Replicas restarted together would otherwise purge in lockstep.
+    await asyncio.sleep(random.uniform(0, interval_seconds))
+    while True:
+        try:
+            purged = await purge_refresh_tokens(
+                session_factory=session_factory,
+                batch_size=batch_size,
+                batch_pause_seconds=batch_pause_seconds,
+            )
+            purged += await purge_access_token_revocations(
+                session_factory=session_factory,
+                batch_size=batch_size,
+                batch_pause_seconds=batch_pause_seconds,
+            )
+        except Exception:
+            log.exception("refresh_token_purge_failed")
+        else:
+            if purged:
+                log.info("refresh_token_purge_completed", purged=purged)
+        await asyncio.sleep(interval_seconds)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes even for timezone-aware columns.
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+async def revoke_access_token(*, session: AsyncSession, jti: str, expires_at: datetime) -> None:
+    await AuthRepository(session).revoke_access_token(jti, expires_at=expires_at)
+    # Effective in this worker at once; other workers pick it up on their next sync.
+    access_token_revocations.add(jti, expires_at)
+    set_revoked_access_tokens(len(access_token_revocations))
+
+
+async def sync_access_token_revocations(
+    *, session_factory: async_sessionmaker[AsyncSession]
+) -> int:
+    """Pull revocations newer than the list's watermark and drop entries past their ``exp``."""
+    now = datetime.now(UTC)
+    async with session_factory() as session:
+        rows = await AuthRepository(session).list_access_token_revocations(
+            since=access_token_revocations.sync_from(), now=now
+        )
+    access_token_revocations.apply(
+        (jti, _as_utc(expires_at), _as_utc(revoked_at)) for jti, expires_at, revoked_at in rows
+    )
+    access_token_revocations.prune(now.timestamp())
+    set_revoked_access_tokens(len(access_token_revocations))
+    return len(rows)
+
+
+async def run_access_token_revocation_sync(
+    *,
+    session_factory: async_sessionmaker[AsyncSession],
+    interval_seconds: float,
+) -> None:
+    """Load the revocation list, then sync it every ``interval_seconds`` until cancelled."""
+    while True:
+        try:
+            await sync_access_token_revocations(session_factory=session_factory)
+        except Exception:
+            log.exception("access_token_revocation_sync_failed")
+        await asyncio.sleep(interval_seconds)
+
+
 def user_to_principal(user: User) -> AuthenticatedUser:
     return AuthenticatedUser(
         user_id=user.id,
@@ -0,0 +1,183 @@
+"""Two-tier cache of items by id: a per-worker LRU with TTL, optionally backed by Redis.
+
+Every key includes the tenant, so a lookup can only return an entry stored under the same
+tenant: locally the key is ``(tenant_id, item_id)``, in Redis it is
+``<prefix>:items:<tenant_id>:<item_id>``. A local miss falls through to Redis, and a Redis hit
+is copied into the local tier. Redis errors are counted and logged, and the lookup falls back
+to the database. Entries live for ``ttl_seconds`` in both tiers. That TTL bounds how stale an
+entry in another worker's local tier can be after a write.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Protocol, cast
+from uuid import UUID
+
+import structlog
+
+from __PROJECT_SLUG__.api.v1.features.items.schemas import ItemResponse
+from __PROJECT_SLUG__.core.metrics.items import record_item_cache_redis_error
+
+log = structlog.get_logger()
+
+# Redis is an optimization here: a slow server must not hold up item reads for long.
+REDIS_TIMEOUT_SECONDS = 0.25
+
+
+class ItemCacheRedisClient(Protocol):
+    async def get(self, name: str) -> Any: ...
+
+    async def set(self, name: str, value: str, ex: int | None = None) -> Any: ...
+
+    async def delete(self, *names: str) -> Any: ...
+
+    def pipeline(self, transaction: bool = True) -> Any: ...
+
+
+def build_redis_client(redis_url: str) -> ItemCacheRedisClient:
+    try:
+        from redis import asyncio as redis_asyncio  # type: ignore[import-not-found]
+    except ImportError as exc:
+        raise RuntimeError(
+            "Redis item cache requires 'redis' dependency. Install it with: poetry add redis"
+        ) from exc
+    return cast(
+        ItemCacheRedisClient,
+        redis_asyncio.from_url(
+            redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+            socket_timeout=REDIS_TIMEOUT_SECONDS,
+            socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+        ),
+    )
+
+
+class ItemCache:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.max_entries = 10_000
+        self.ttl_seconds = 60
+        self._entries: OrderedDict[tuple[str, UUID], tuple[float, ItemResponse]] = OrderedDict()
+        self._redis: ItemCacheRedisClient | None = None
+        self._redis_prefix = ""
+
+    def configure(
+        self,
+        *,
+        enabled: bool,
+        max_entries: int,
+        ttl_seconds: int,
+        redis_url: str = "",
+        redis_prefix: str = "",
+        redis_client: ItemCacheRedisClient | None = None,
+    ) -> None:
+        """Set limits and drop all local entries; an empty ``redis_url`` keeps only the LRU."""
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if ttl_seconds < 1:
+            raise ValueError("ttl_seconds must be >= 1")
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._redis = None
+        if enabled and (redis_client is not None or redis_url):
+            self._redis = redis_client or build_redis_client(redis_url)
+        self._redis_prefix = redis_prefix
+        self._entries.clear()
+
+    async def close(self) -> None:
+        redis, self._redis = self._redis, None
+        close = cast(Callable[[], Awaitable[object]] | None, getattr(redis, "aclose", None))
+        if close is not None:
+            await close()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _redis_key(self, tenant_id: str, item_id: UUID) -> str:
+        return f"{self._redis_prefix}:items:{tenant_id}:{item_id}"
+
+    def get_local(
+        self, tenant_id: str, item_id: UUID, *, now: float | None = None
+    ) -> ItemResponse | None:
+        key = (tenant_id, item_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, item = entry
+        if (now if now is not None else time.monotonic()) >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return item
+
+    def put_local(self, item: ItemResponse, *, now: float | None = None) -> None:
+        key = (item.tenant_id, item.id)
+        expires_at = (now if now is not None else time.monotonic()) + self.ttl_seconds
+        self._entries[key] = (expires_at, item)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_redis(self, tenant_id: str, item_id: UUID) -> ItemResponse | None:
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.get(self._redis_key(tenant_id, item_id))
+        except Exception:
+            self._redis_failed("get")
+            return None
+        if raw is None:
+            return None
+        try:
+            item = ItemResponse.model_validate_json(raw)
+        except ValueError:
+            return None
+        # The key already names the tenant; this also rejects a value written under a wrong key.
+        return item if item.tenant_id == tenant_id and item.id == item_id else None
+
+    async def put(self, items: Sequence[ItemResponse]) -> None:
+        """Store (or replace) ``items`` in both tiers; called on every write."""
+        if not self.enabled or not items:
+            return
+        for item in items:
+            self.put_local(item)
+        if self._redis is None:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for item in items:
+                    pipe.set(
+                        self._redis_key(item.tenant_id, item.id),
+                        item.model_dump_json(),
+                        ex=self.ttl_seconds,
+                    )
+                await pipe.execute()
+        except Exception:
+            self._redis_failed("put")
+
+    async def invalidate(self, tenant_id: str, item_ids: Sequence[UUID]) -> None:
+        if not self.enabled or not item_ids:
+            return
+        for item_id in item_ids:
+            self._entries.pop((tenant_id, item_id), None)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.delete(*(self._redis_key(tenant_id, item_id) for item_id in item_ids))
+        except Exception:
+            self._redis_failed("invalidate")
+
+    def _redis_failed(self, operation: str) -> None:
+        record_item_cache_redis_error()
+        log.warning("item_cache_redis_failed", operation=operation, exc_info=True)
+
+
+item_cache = ItemCache()
@@ -0,0 +1,52 @@
+"""NDJSON and CSV encoders for ``GET /items/export``.
+
+Each call encodes one chunk of rows (in ``repository.EXPORT_COLUMNS`` order) into one bytes
+block, so the ASGI server sends one body message per chunk rather than one per row.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Sequence
+from typing import Any, Literal
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+_FIELDS = ("id", "name", "description", "price", "tenant_id", "created_at")
+
+
+def encode_ndjson(rows: Iterable[Sequence[Any]]) -> bytes:
+    return "".join(
+        json.dumps(
+            {
+                "id": str(item_id),
+                "name": name,
+                "description": description,
+                "price": float(price),
+                "tenant_id": tenant_id,
+                "created_at": created_at.isoformat(),
+            },
+            separators=(",", ":"),
+        )
+        + "\n"
+        for item_id, name, description, price, tenant_id, created_at in rows
+    ).encode()
+
+
+def encode_csv(rows: Iterable[Sequence[Any]], *, header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(_FIELDS)
+    writer.writerows(
+        (item_id, name, description or "", price, tenant_id, created_at.isoformat())
+        for item_id, name, description, price, tenant_id, created_at in rows
+    )
+    return buffer.getvalue().encode()
@@ -1,25 +1,133 @@
 from __future__ import annotations
 
-from decimal import Decimal
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
 
+from sqlalchemy import Row, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from __PROJECT_SLUG__.api.v1.features.items.models import Item
 from __PROJECT_SLUG__.api.v1.features.items.schemas import ItemCreate
 
+# Rows per INSERT statement: 6 bind parameters each stays far below the PostgreSQL (32767) and
+# SQLite (32766) limits, and larger statements stop paying off.
+INSERT_CHUNK_SIZE = 500
+
+# Matches the scale of ``Item.price`` (``Numeric(12, 2)``).
+PRICE_QUANTUM = Decimal("0.01")
+
+EXPORT_COLUMNS = (
+    Item.id,
+    Item.name,
+    Item.description,
+    Item.price,
+    Item.tenant_id,
+    Item.created_at,
+)
+
+
+def quantize_price(price: float) -> Decimal:
+    """``price`` rounded the way PostgreSQL stores it in ``Numeric(12, 2)`` (half away from zero).
+
+    Rounding before the insert makes the returned item match the stored row without a reload.
+    """
+    return Decimal(str(price)).quantize(PRICE_QUANTUM, rounding=ROUND_HALF_UP)
+
 
 class ItemRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def create(self, payload: ItemCreate, tenant_id: str) -> Item:
-        item = Item(
-            name=payload.name,
-            description=payload.description,
-            price=Decimal(str(payload.price)),
-            tenant_id=tenant_id,
-        )
-        self.session.add(item)
-        await self.session.commit()
-        await self.session.refresh(item)
+        # One INSERT ... RETURNING, like the batch path, so the item is the row as stored.
+        [item] = await self.create_many([payload], tenant_id)
         return item
+
+    async def get(self, tenant_id: str, item_id: uuid.UUID) -> Item | None:
+        result = await self.session.execute(
+            select(Item).where(Item.id == item_id, Item.tenant_id == tenant_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def create_many(
+        self, payloads: Sequence[ItemCreate], tenant_id: str, *, commit: bool = True
+    ) -> list[Item]:
+        """Insert ``payloads`` with multi-row ``INSERT ... RETURNING`` in one transaction.
+
+        Items are returned in input order. Each row's ``created_at`` is one microsecond after
+        the previous row's, so keyset pages over ``(created_at, id)`` list the batch in input
+        order rather than by random ``id``.
+        """
+        now = datetime.now(UTC)
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "name": payload.name,
+                "description": payload.description,
+                "price": quantize_price(payload.price),
+                "tenant_id": tenant_id,
+                "created_at": now + timedelta(microseconds=index),
+            }
+            for index, payload in enumerate(payloads)
+        ]
+        created: dict[uuid.UUID, Item] = {}
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            statement = insert(Item).values(rows[start : start + INSERT_CHUNK_SIZE]).returning(Item)
+            for item in await self.session.scalars(statement):
+                created[item.id] = item
+        if commit:
+            await self.session.commit()
+        # RETURNING order is not guaranteed to follow VALUES order.
+        return [created[row["id"]] for row in rows]
+
+    async def list_page(
+        self,
+        tenant_id: str,
+        *,
+        after: tuple[datetime, uuid.UUID] | None,
+        limit: int,
+    ) -> Sequence[Item]:
+        """Up to ``limit`` of the tenant's items in ``(created_at, id)`` order, after ``after``.
+
+        The row-value comparison lets PostgreSQL seek into ``ix_items_tenant_created_id`` at
+        the cursor, so a page costs the same at any depth.
+        """
+        statement = select(Item).where(Item.tenant_id == tenant_id)
+        if after is not None:
+            statement = statement.where(tuple_(Item.created_at, Item.id) > after)
+        statement = statement.order_by(Item.created_at, Item.id).limit(limit)
+        result = await self.session.execute(statement)
+        return result.scalars().all()
+
+    async def iter_export_chunks(
+        self, tenant_id: str, *, chunk_size: int
+    ) -> AsyncIterator[Sequence[Row]]:
+        """Yield the tenant's items as plain rows (``EXPORT_COLUMNS``), ``chunk_size`` at a time.
+
+        PostgreSQL streams one query through a server-side cursor, so only the current chunk is
+        held in memory. SQLite reads keyset pages of ``chunk_size`` rows instead.
+        """
+        statement = (
+            select(*EXPORT_COLUMNS)
+            .where(Item.tenant_id == tenant_id)
+            .order_by(Item.created_at, Item.id)
+        )
+        if self.session.get_bind().dialect.name == "postgresql":
+            result = await self.session.stream(statement.execution_options(yield_per=chunk_size))
+            async for rows in result.partitions():
+                yield rows
+            return
+
+        after: tuple[datetime, uuid.UUID] | None = None
+        while True:
+            page = statement
+            if after is not None:
+                page = page.where(tuple_(Item.created_at, Item.id) > after)
+            rows = (await self.session.execute(page.limit(chunk_size))).all()
+            if rows:
+                yield rows
+            if len(rows) < chunk_size:
+                return
+            after = (rows[-1].created_at, rows[-1].id)
@@ -1,16 +1,59 @@
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from __PROJECT_SLUG__.api.v1.features.items import service
-from __PROJECT_SLUG__.api.v1.features.items.schemas import ItemCreate, ItemResponse
+from __PROJECT_SLUG__.api.v1.features.items import export, service
+from __PROJECT_SLUG__.api.v1.features.items.schemas import ItemCreate, ItemPage, ItemResponse
 from __PROJECT_SLUG__.core.db import get_db_session
 from __PROJECT_SLUG__.core.middleware.tenant import get_tenant_id_dependency
+from __PROJECT_SLUG__.core.pagination import InvalidCursorError
 from __PROJECT_SLUG__.core.security.auth import AuthPrincipal, require_scopes
 
 router = APIRouter(prefix="/items", tags=["items"])
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_BATCH_SIZE = 1000
+
+
+@router.get("", response_model=ItemPage)
+async def list_items(
+    tenant_id: Annotated[str, Depends(get_tenant_id_dependency)],
+    db_session: Annotated[AsyncSession, Depends(get_db_session)],
+    _principal: Annotated[AuthPrincipal, Depends(require_scopes(["items:read"]))],
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> ItemPage:
+    try:
+        return await service.list_items(tenant_id, cursor=cursor, limit=limit, session=db_session)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media_type: {} for media_type in export.MEDIA_TYPES.values()}}},
+)
+async def export_items(
+    tenant_id: Annotated[str, Depends(get_tenant_id_dependency)],
+    db_session: Annotated[AsyncSession, Depends(get_db_session)],
+    _principal: Annotated[AuthPrincipal, Depends(require_scopes(["items:read"]))],
+    export_format: Annotated[export.ExportFormat, Query(alias="format")] = "ndjson",
+) -> StreamingResponse:
+    """Stream every item of the tenant as NDJSON (default) or CSV, in creation order.
+
+    The database session stays open until the last chunk is sent.
+    """
+    return StreamingResponse(
+        service.export_items(tenant_id, export_format, db_session),
+        media_type=export.MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="items.{export_format}"'},
+    )
+
 
 @router.post("", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
 async def create_item(
@@ -20,3 +63,30 @@ async def create_item(
     _principal: Annotated[AuthPrincipal, Depends(require_scopes(["items:write"]))],
 ) -> ItemResponse:
     return await service.create_item(payload, tenant_id, db_session)
+
+
+@router.post(
+    ":batch",
+    response_model=list[ItemResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_items(
+    payload: Annotated[list[ItemCreate], Body(min_length=1, max_length=MAX_BATCH_SIZE)],
+    tenant_id: Annotated[str, Depends(get_tenant_id_dependency)],
+    db_session: Annotated[AsyncSession, Depends(get_db_session)],
+    _principal: Annotated[AuthPrincipal, Depends(require_scopes(["items:write"]))],
+) -> list[ItemResponse]:
+    return await service.create_items(payload, tenant_id, db_session)
+
+
+@router.get("/{item_id}", response_model=ItemResponse)
+async def get_item(
+    item_id: UUID,
+    tenant_id: Annotated[str, Depends(get_tenant_id_dependency)],
+    db_session: Annotated[AsyncSession, Depends(get_db_session)],
+    _principal: Annotated[AuthPrincipal, Depends(require_scopes(["items:read"]))],
+) -> ItemResponse:
+    item = await service.get_item(item_id, tenant_id, db_session)
+    if item is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found.")
+    return item
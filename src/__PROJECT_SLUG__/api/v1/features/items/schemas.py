@@ -44,3 +44,11 @@ class ItemResponse(BaseModel):
             }
         }
     }
+
+
+class ItemPage(BaseModel):
+    items: list[ItemResponse]
+    next_cursor: str | None = Field(
+        default=None,
+        description="Pass as `cursor` to fetch the next page; null on the last page.",
+    )
@@ -2,25 +2,35 @@
 
 Primary path persists to the configured database via SQLAlchemy repository.
 An in-memory fallback remains for lightweight unit tests that bypass DI.
+Lookups by id read through ``item_cache``; every write stores the new items in it.
 """
 
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from __PROJECT_SLUG__.api.v1.features.items import repository
-from __PROJECT_SLUG__.api.v1.features.items.schemas import ItemCreate, ItemResponse
+from __PROJECT_SLUG__.api.v1.features.items import export, repository
+from __PROJECT_SLUG__.api.v1.features.items.cache import item_cache
+from __PROJECT_SLUG__.api.v1.features.items.models import Item
+from __PROJECT_SLUG__.api.v1.features.items.schemas import ItemCreate, ItemPage, ItemResponse
+from __PROJECT_SLUG__.core.metrics.items import record_item_cache_lookup
+from __PROJECT_SLUG__.core.pagination import InvalidCursorError, cursor_codec
 
 # Replace with a proper repository / database session in production.
 _store: dict[UUID, ItemResponse] = {}
 
+EXPORT_CHUNK_SIZE = 1000
+
 
 def clear_store() -> None:
     _store.clear()
+    item_cache.clear()
 
 
 async def create_item(
@@ -29,11 +39,121 @@ async def create_item(
     session: AsyncSession | None = None,
 ) -> ItemResponse:
     if session is None:
-        return _create_item_in_memory(payload, tenant_id)
+        item = _create_item_in_memory(payload, tenant_id)
+    else:
+        repo = repository.ItemRepository(session)
+        item = _to_response(await repo.create(payload, tenant_id))
+    await item_cache.put([item])
+    return item
+
+
+async def create_items(
+    payloads: list[ItemCreate],
+    tenant_id: str,
+    session: AsyncSession | None = None,
+) -> list[ItemResponse]:
+    if session is None:
+        items = [_create_item_in_memory(payload, tenant_id) for payload in payloads]
+    else:
+        repo = repository.ItemRepository(session)
+        items = [_to_response(item) for item in await repo.create_many(payloads, tenant_id)]
+    await item_cache.put(items)
+    return items
+
+
+async def get_item(
+    item_id: UUID,
+    tenant_id: str,
+    session: AsyncSession | None = None,
+) -> ItemResponse | None:
+    """The tenant's item ``item_id``, or ``None`` if it does not exist in that tenant."""
+    if item_cache.enabled:
+        item = item_cache.get_local(tenant_id, item_id)
+        if item is not None:
+            record_item_cache_lookup("local_hit")
+            return item
+        item = await item_cache.get_redis(tenant_id, item_id)
+        if item is not None:
+            record_item_cache_lookup("redis_hit")
+            item_cache.put_local(item)
+            return item
+        record_item_cache_lookup("miss")
+
+    if session is None:
+        item = _store.get(item_id)
+        item = item if item is not None and item.tenant_id == tenant_id else None
+    else:
+        repo = repository.ItemRepository(session)
+        row = await repo.get(tenant_id, item_id)
+        item = _to_response(row) if row is not None else None
+    if item is not None:
+        await item_cache.put([item])
+    return item
 
-    repo = repository.ItemRepository(session)
-    item = await repo.create(payload, tenant_id)
 
+async def list_items(
+    tenant_id: str,
+    *,
+    cursor: str | None = None,
+    limit: int,
+    session: AsyncSession | None = None,
+) -> ItemPage:
+    """One page of the tenant's items in creation order; raises ``InvalidCursorError``."""
+    after = decode_cursor(cursor, tenant_id) if cursor else None
+    if session is None:
+        rows = _list_items_in_memory(tenant_id, after=after, limit=limit + 1)
+    else:
+        repo = repository.ItemRepository(session)
+        rows = [
+            _to_response(item)
+            for item in await repo.list_page(tenant_id, after=after, limit=limit + 1)
+        ]
+
+    # The extra row only tells whether another page exists; it is not returned.
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id, tenant_id)
+    return ItemPage(items=items, next_cursor=next_cursor)
+
+
+async def export_items(
+    tenant_id: str,
+    export_format: export.ExportFormat,
+    session: AsyncSession | None = None,
+    *,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yield all of the tenant's items in creation order, one encoded chunk at a time.
+
+    Only one chunk of rows is held at once, so memory stays flat whatever the tenant's size.
+    """
+    if export_format == "csv":
+        # The header goes out even for an empty export.
+        yield export.encode_csv((), header=True)
+    if session is None:
+        chunks = _iter_export_chunks_in_memory(tenant_id, chunk_size)
+    else:
+        repo = repository.ItemRepository(session)
+        chunks = repo.iter_export_chunks(tenant_id, chunk_size=chunk_size)
+    async for rows in chunks:
+        yield export.encode_csv(rows) if export_format == "csv" else export.encode_ndjson(rows)
+
+
+def encode_cursor(created_at: datetime, item_id: UUID, tenant_id: str) -> str:
+    return cursor_codec.encode([created_at.isoformat(), str(item_id)], context=f"items:{tenant_id}")
+
+
+def decode_cursor(cursor: str, tenant_id: str) -> tuple[datetime, UUID]:
+    values = cursor_codec.decode(cursor, context=f"items:{tenant_id}")
+    try:
+        created_at, item_id = values
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except ValueError as exc:
+        raise InvalidCursorError("Invalid pagination cursor.") from exc
+
+
+def _to_response(item: Item) -> ItemResponse:
     return ItemResponse(
         id=item.id,
         name=item.name,
@@ -49,9 +169,32 @@ def _create_item_in_memory(payload: ItemCreate, tenant_id: str) -> ItemResponse:
         id=uuid.uuid4(),
         name=payload.name,
         description=payload.description,
-        price=payload.price,
+        price=float(repository.quantize_price(payload.price)),
         tenant_id=tenant_id,
         created_at=datetime.now(UTC),
     )
     _store[item.id] = item
     return item
+
+
+def _list_items_in_memory(
+    tenant_id: str, *, after: tuple[datetime, UUID] | None, limit: int
+) -> list[ItemResponse]:
+    rows = sorted(
+        (item for item in _store.values() if item.tenant_id == tenant_id),
+        key=lambda item: (item.created_at, item.id),
+    )
+    if after is not None:
+        rows = [item for item in rows if (item.created_at, item.id) > after]
+    return rows[:limit]
+
+
+async def _iter_export_chunks_in_memory(
+    tenant_id: str, chunk_size: int
+) -> AsyncIterator[Sequence[tuple[Any, ...]]]:
+    items = _list_items_in_memory(tenant_id, after=None, limit=len(_store))
+    for start in range(0, len(items), chunk_size):
+        yield [
+            (item.id, item.name, item.description, item.price, item.tenant_id, item.created_at)
+            for item in items[start : start + chunk_size]
+        ]
@@ -2,7 +2,7 @@ from enum import StrEnum
 from functools import lru_cache
 from typing import Annotated
 
-from pydantic import AnyHttpUrl, Field, field_validator, model_validator
+from pydantic import AnyHttpUrl, BaseModel, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
@@ -12,6 +12,29 @@ class Environment(StrEnum):
     PROD = "prod"
 
 
+REDIS_RATE_LIMIT_BACKENDS = frozenset({"redis", "redis_gcra"})
+RATE_LIMIT_BACKENDS = frozenset({"memory", "memory_counter", "shm"}) | REDIS_RATE_LIMIT_BACKENDS
+RATE_LIMIT_KEY_DIMENSIONS = frozenset({"ip", "tenant", "path"})
+JWT_HMAC_ALGORITHMS = ("HS256", "HS384", "HS512")
+JWT_ASYMMETRIC_ALGORITHMS = ("EdDSA", "ES256", "RS256")
+
+
+class RateLimitPolicySettings(BaseModel):
+    """One entry of ``APP_RATE_LIMIT_POLICIES`` (a JSON list)."""
+
+    route: str
+    requests: int
+    window_seconds: int
+    method: str = "*"
+    tenant: str = "*"
+    key_by: list[str] = Field(default_factory=lambda: ["ip", "tenant"])
+
+    @field_validator("method")
+    @classmethod
+    def normalize_method(cls, value: str) -> str:
+        return value.strip().upper()
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -61,6 +84,8 @@ class Settings(BaseSettings):
             "/api/docs",
             "/api/redoc",
             "/api/openapi.json",
+            "/api/v1/items/export",
+            "/api/v1/auth/users/import",
         ],
     )
     request_body_limit_enabled: bool = True
@@ -90,14 +115,34 @@ class Settings(BaseSettings):
     database_connect_on_startup: bool = False
     database_auto_create_schema: bool = True
 
+    # Pagination
+    pagination_cursor_secret: str = ""
+
+    # Item cache (lookups by id)
+    items_cache_enabled: bool = True
+    items_cache_max_entries: int = 10_000
+    items_cache_ttl_seconds: int = 60
+    items_cache_redis_url: str = ""
+    items_cache_redis_prefix: str = "__SERVICE_NAME__"
+
     # Authentication / Authorization
     auth_enabled: bool = False
     auth_jwt_secret: str = "change-me-please-use-a-long-random-secret"
     auth_jwt_additional_secrets: Annotated[list[str], NoDecode] = Field(default_factory=list)
     auth_jwt_algorithm: str = "HS256"
+    auth_jwt_private_key_file: str = ""
+    auth_jwt_additional_public_key_files: Annotated[list[str], NoDecode] = Field(
+        default_factory=list
+    )
+    auth_jwt_accept_legacy_tokens: bool = True
+    auth_jwks_max_age_seconds: int = 300
     auth_access_token_expire_minutes: int = 30
     auth_refresh_token_enabled: bool = True
     auth_refresh_token_expire_minutes: int = 60 * 24 * 7
+    auth_refresh_token_purge_enabled: bool = True
+    auth_refresh_token_purge_interval_seconds: int = 3600
+    auth_refresh_token_purge_batch_size: int = 1000
+    auth_refresh_token_purge_batch_pause_ms: int = 100
     auth_use_database: bool = False
     auth_seed_admin_on_startup: bool = False
     auth_issuer: str = "__SERVICE_NAME__"
@@ -107,6 +152,25 @@ class Settings(BaseSettings):
     auth_admin_scopes: Annotated[list[str], NoDecode] = Field(
         default_factory=lambda: ["items:read", "items:write"],
     )
+    auth_token_cache_enabled: bool = True
+    auth_token_cache_max_entries: int = 10_000
+    auth_access_token_revocation_enabled: bool = True
+    auth_access_token_revocation_sync_seconds: int = 5
+    auth_password_hash_executor: str = "thread"
+    auth_password_hash_workers: int = 2
+    auth_password_hash_max_queue: int = 32
+    auth_password_hash_scheme: str = "argon2"
+    auth_password_hash_argon2_time_cost: int = 3
+    auth_password_hash_argon2_memory_kib: int = 65536
+    auth_password_hash_argon2_parallelism: int = 4
+    auth_password_hash_pbkdf2_iterations: int = 390_000
+    auth_password_rehash_on_login: bool = True
+    auth_user_import_hash_workers: int = 0
+    auth_user_import_batch_size: int = 500
+    # The import route gets its own body limit instead of APP_REQUEST_BODY_MAX_BYTES.
+    auth_user_import_max_body_bytes: int = 67_108_864
+    auth_user_import_max_line_bytes: int = 16_384
+    auth_user_import_max_records: int = 100_000
 
     # Rate limiting
     rate_limit_enabled: bool = True
@@ -114,9 +178,20 @@ class Settings(BaseSettings):
     rate_limit_requests: int = 120
     rate_limit_window_seconds: int = 60
     rate_limit_memory_max_keys: int = 50000
+    rate_limit_burst: int = 1
+    rate_limit_shm_path: str = ""
+    rate_limit_shm_stripes: int = 64
     rate_limit_fail_open: bool = True
     rate_limit_redis_url: str = "redis://localhost:6379/0"
     rate_limit_redis_prefix: str = "__SERVICE_NAME__"
+    rate_limit_redis_lease_size: int = 0
+    rate_limit_breaker_enabled: bool = True
+    rate_limit_breaker_timeout_ms: int = 250
+    rate_limit_breaker_failure_ratio: float = 0.5
+    rate_limit_breaker_min_calls: int = 20
+    rate_limit_breaker_reset_seconds: int = 5
+    rate_limit_breaker_fallback: str = "none"
+    rate_limit_policies: list[RateLimitPolicySettings] = Field(default_factory=list)
     rate_limit_exempt_paths: Annotated[list[str], NoDecode] = Field(
         default_factory=lambda: [
             "/health",
@@ -148,6 +223,7 @@ class Settings(BaseSettings):
         "allowed_hosts",
         "auth_admin_scopes",
         "auth_jwt_additional_secrets",
+        "auth_jwt_additional_public_key_files",
         "rate_limit_exempt_paths",
         "request_timeout_exempt_paths",
         "request_body_limit_exempt_paths",
@@ -203,16 +279,60 @@ class Settings(BaseSettings):
             raise ValueError("rate_limit_window_seconds must be >= 1")
         if self.rate_limit_memory_max_keys < 1:
             raise ValueError("rate_limit_memory_max_keys must be >= 1")
-        if self.rate_limit_backend not in {"memory", "redis"}:
-            raise ValueError("rate_limit_backend must be one of: memory, redis")
-        if self.rate_limit_backend == "redis" and not self.rate_limit_redis_url.strip():
-            raise ValueError("rate_limit_redis_url cannot be empty when rate_limit_backend=redis")
+        if self.rate_limit_backend not in RATE_LIMIT_BACKENDS:
+            raise ValueError(
+                f"rate_limit_backend must be one of: {', '.join(sorted(RATE_LIMIT_BACKENDS))}"
+            )
+        if (
+            self.rate_limit_backend in REDIS_RATE_LIMIT_BACKENDS
+            and not self.rate_limit_redis_url.strip()
+        ):
+            raise ValueError(
+                "rate_limit_redis_url cannot be empty when rate_limit_backend uses redis"
+            )
+        if self.rate_limit_shm_stripes < 1:
+            raise ValueError("rate_limit_shm_stripes must be >= 1")
+        if self.rate_limit_redis_lease_size < 0:
+            raise ValueError("rate_limit_redis_lease_size must be >= 0")
+        if self.rate_limit_breaker_timeout_ms < 1:
+            raise ValueError("rate_limit_breaker_timeout_ms must be >= 1")
+        if not 0 < self.rate_limit_breaker_failure_ratio <= 1:
+            raise ValueError("rate_limit_breaker_failure_ratio must be in (0, 1]")
+        if self.rate_limit_breaker_min_calls < 1:
+            raise ValueError("rate_limit_breaker_min_calls must be >= 1")
+        if self.rate_limit_breaker_reset_seconds < 1:
+            raise ValueError("rate_limit_breaker_reset_seconds must be >= 1")
+        if self.rate_limit_breaker_fallback not in {"none", "memory"}:
+            raise ValueError("rate_limit_breaker_fallback must be one of: none, memory")
+        if self.rate_limit_burst < 1:
+            raise ValueError("rate_limit_burst must be >= 1")
         if not self.rate_limit_redis_prefix.strip():
             raise ValueError("rate_limit_redis_prefix cannot be empty")
+        policy_selectors: set[tuple[str, str, str]] = set()
+        for policy in self.rate_limit_policies:
+            if not policy.route.startswith("/"):
+                raise ValueError("rate_limit_policies route must start with '/'")
+            if policy.requests < 1 or policy.window_seconds < 1:
+                raise ValueError("rate_limit_policies requests and window_seconds must be >= 1")
+            if not policy.key_by or not set(policy.key_by) <= RATE_LIMIT_KEY_DIMENSIONS:
+                raise ValueError(
+                    "rate_limit_policies key_by must use: "
+                    f"{', '.join(sorted(RATE_LIMIT_KEY_DIMENSIONS))}"
+                )
+            selector = (policy.route, policy.method, policy.tenant)
+            if selector in policy_selectors:
+                raise ValueError(f"duplicate rate_limit_policies entry: {' '.join(selector)}")
+            policy_selectors.add(selector)
         if self.auth_access_token_expire_minutes < 1:
             raise ValueError("auth_access_token_expire_minutes must be >= 1")
         if self.auth_refresh_token_expire_minutes < 1:
             raise ValueError("auth_refresh_token_expire_minutes must be >= 1")
+        if self.auth_refresh_token_purge_interval_seconds < 1:
+            raise ValueError("auth_refresh_token_purge_interval_seconds must be >= 1")
+        if self.auth_refresh_token_purge_batch_size < 1:
+            raise ValueError("auth_refresh_token_purge_batch_size must be >= 1")
+        if self.auth_refresh_token_purge_batch_pause_ms < 0:
+            raise ValueError("auth_refresh_token_purge_batch_pause_ms must be >= 0")
         if self.web_concurrency < 1:
             raise ValueError("web_concurrency must be >= 1")
         if self.keepalive_timeout < 1:
@@ -233,16 +353,75 @@ class Settings(BaseSettings):
             raise ValueError("request_timeout_seconds must be >= 1")
         if self.request_body_max_bytes < 1:
             raise ValueError("request_body_max_bytes must be >= 1")
-        if self.auth_enabled and len(self.auth_jwt_secret) < 32:
+        if self.auth_jwt_algorithm not in JWT_HMAC_ALGORITHMS + JWT_ASYMMETRIC_ALGORITHMS:
+            allowed = ", ".join(JWT_HMAC_ALGORITHMS + JWT_ASYMMETRIC_ALGORITHMS)
+            raise ValueError(f"auth_jwt_algorithm must be one of: {allowed}")
+        if (
+            self.auth_enabled
+            and self.auth_jwt_algorithm in JWT_HMAC_ALGORITHMS
+            and len(self.auth_jwt_secret) < 32
+        ):
             raise ValueError(
                 "auth_jwt_secret must be at least 32 characters when auth_enabled=true"
             )
+        if self.auth_jwt_algorithm in JWT_ASYMMETRIC_ALGORITHMS and not (
+            self.auth_jwt_private_key_file
+        ):
+            raise ValueError(
+                "auth_jwt_private_key_file is required when auth_jwt_algorithm is asymmetric"
+            )
+        if self.pagination_cursor_secret and len(self.pagination_cursor_secret) < 32:
+            raise ValueError("pagination_cursor_secret must be at least 32 characters when set")
+        if self.environment == Environment.PROD and not self.pagination_cursor_secret:
+            raise ValueError("pagination_cursor_secret must be set when environment=prod")
+        if self.items_cache_max_entries < 1:
+            raise ValueError("items_cache_max_entries must be >= 1")
+        if self.items_cache_ttl_seconds < 1:
+            raise ValueError("items_cache_ttl_seconds must be >= 1")
+        if self.auth_jwks_max_age_seconds < 0:
+            raise ValueError("auth_jwks_max_age_seconds must be >= 0")
         if self.environment == Environment.PROD and self.auth_admin_password == "change-me":
             raise ValueError("auth_admin_password must be changed in production")
         if self.security_hsts_enabled and self.security_hsts_seconds < 1:
             raise ValueError("security_hsts_seconds must be >= 1 when HSTS is enabled")
         if not self.auth_admin_scopes:
             raise ValueError("auth_admin_scopes cannot be empty")
+        if self.auth_token_cache_max_entries < 1:
+            raise ValueError("auth_token_cache_max_entries must be >= 1")
+        if self.auth_access_token_revocation_sync_seconds < 1:
+            raise ValueError("auth_access_token_revocation_sync_seconds must be >= 1")
+        if self.auth_password_hash_executor not in {"thread", "process"}:
+            raise ValueError("auth_password_hash_executor must be one of: process, thread")
+        if self.auth_password_hash_workers < 1:
+            raise ValueError("auth_password_hash_workers must be >= 1")
+        if self.auth_password_hash_max_queue < 0:
+            raise ValueError("auth_password_hash_max_queue must be >= 0")
+        if self.auth_password_hash_scheme not in {"argon2", "pbkdf2_sha256"}:
+            raise ValueError("auth_password_hash_scheme must be one of: argon2, pbkdf2_sha256")
+        if self.auth_password_hash_argon2_time_cost < 1:
+            raise ValueError("auth_password_hash_argon2_time_cost must be >= 1")
+        if self.auth_password_hash_argon2_parallelism < 1:
+            raise ValueError("auth_password_hash_argon2_parallelism must be >= 1")
+        if (
+            self.auth_password_hash_argon2_memory_kib
+            < 8 * self.auth_password_hash_argon2_parallelism
+        ):
+            raise ValueError(
+                "auth_password_hash_argon2_memory_kib must be >= 8 * "
+                "auth_password_hash_argon2_parallelism"
+            )
+        if self.auth_password_hash_pbkdf2_iterations < 10_000:
+            raise ValueError("auth_password_hash_pbkdf2_iterations must be >= 10000")
+        if self.auth_user_import_hash_workers < 0:
+            raise ValueError("auth_user_import_hash_workers must be >= 0")
+        if self.auth_user_import_batch_size < 1:
+            raise ValueError("auth_user_import_batch_size must be >= 1")
+        if self.auth_user_import_max_body_bytes < 1:
+            raise ValueError("auth_user_import_max_body_bytes must be >= 1")
+        if self.auth_user_import_max_line_bytes < 1:
+            raise ValueError("auth_user_import_max_line_bytes must be >= 1")
+        if self.auth_user_import_max_records < 1:
+            raise ValueError("auth_user_import_max_records must be >= 1")
         return self
 
 
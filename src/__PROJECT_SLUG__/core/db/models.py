@@ -1,5 +1,9 @@
-from __PROJECT_SLUG__.api.v1.features.auth.models import RefreshToken, User
+from __PROJECT_SLUG__.api.v1.features.auth.models import (
+    RefreshToken,
+    RevokedAccessToken,
+    User,
+)
 from __PROJECT_SLUG__.api.v1.features.items.models import Item
 from __PROJECT_SLUG__.core.db.base import Base
 
-__all__ = ["Base", "Item", "User", "RefreshToken"]
+__all__ = ["Base", "Item", "User", "RefreshToken", "RevokedAccessToken"]
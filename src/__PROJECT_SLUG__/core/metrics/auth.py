@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any
+
+AUTH_TOKEN_CACHE_LOOKUPS: Any | None = None
+AUTH_TOKEN_VERIFY_DURATION: Any | None = None
+REFRESH_TOKENS_PURGED: Any | None = None
+REFRESH_TOKEN_PURGE_BATCH_DURATION: Any | None = None
+REVOKED_ACCESS_TOKENS: Any | None = None
+
+try:  # pragma: no cover - availability depends on runtime environment
+    from prometheus_client import Counter, Gauge, Histogram
+except ImportError:  # pragma: no cover - handled explicitly by fallback behavior
+    pass
+else:
+    AUTH_TOKEN_CACHE_LOOKUPS = Counter(
+        "auth_token_cache_lookups_total",
+        "Access token verifications by result (hit, miss or invalid).",
+        labelnames=("result",),
+    )
+    AUTH_TOKEN_VERIFY_DURATION = Histogram(
+        "auth_token_verify_duration_seconds",
+        "Time spent authenticating a bearer token, by cache result.",
+        labelnames=("result",),
+        buckets=(0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.01),
+    )
+    REFRESH_TOKENS_PURGED = Counter(
+        "refresh_tokens_purged_total",
+        "Refresh token rows deleted by the background purge, by reason (expired or revoked).",
+        labelnames=("reason",),
+    )
+    REFRESH_TOKEN_PURGE_BATCH_DURATION = Histogram(
+        "refresh_token_purge_batch_duration_seconds",
+        "Time to delete and commit one refresh token purge batch.",
+        labelnames=("reason",),
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+    REVOKED_ACCESS_TOKENS = Gauge(
+        "auth_revoked_access_tokens",
+        "Unexpired revoked access tokens held in this worker's revocation list.",
+    )
+
+
+# ``labels()`` resolves and locks on every call, which costs more than a token cache hit; the
+# three result children are bound once instead.
+_token_verification_children: dict[str, tuple[Any, Any]] = {}
+
+
+def record_token_verification(result: str, seconds: float) -> None:
+    if AUTH_TOKEN_CACHE_LOOKUPS is None or AUTH_TOKEN_VERIFY_DURATION is None:
+        return
+    children = _token_verification_children.get(result)
+    if children is None:
+        children = _token_verification_children[result] = (
+            AUTH_TOKEN_CACHE_LOOKUPS.labels(result=result),
+            AUTH_TOKEN_VERIFY_DURATION.labels(result=result),
+        )
+    lookups, duration = children
+    lookups.inc()
+    duration.observe(seconds)
+
+
+def record_refresh_token_purge_batch(reason: str, deleted: int, seconds: float) -> None:
+    if REFRESH_TOKENS_PURGED is not None:
+        REFRESH_TOKENS_PURGED.labels(reason=reason).inc(deleted)
+    if REFRESH_TOKEN_PURGE_BATCH_DURATION is not None:
+        REFRESH_TOKEN_PURGE_BATCH_DURATION.labels(reason=reason).observe(seconds)
+
+
+def set_revoked_access_tokens(count: int) -> None:
+    if REVOKED_ACCESS_TOKENS is not None:
+        REVOKED_ACCESS_TOKENS.set(count)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Any
+
+ITEM_CACHE_LOOKUPS: Any | None = None
+ITEM_CACHE_REDIS_ERRORS: Any | None = None
+
+try:  # pragma: no cover - availability depends on runtime environment
+    from prometheus_client import Counter
+except ImportError:  # pragma: no cover - handled explicitly by fallback behavior
+    pass
+else:
+    ITEM_CACHE_LOOKUPS = Counter(
+        "item_cache_lookups_total",
+        "Item lookups by id, by cache result (local_hit, redis_hit or miss).",
+        labelnames=("result",),
+    )
+    ITEM_CACHE_REDIS_ERRORS = Counter(
+        "item_cache_redis_errors_total",
+        "Failed Redis item cache calls; lookups fall back to the database.",
+    )
+
+
+_item_cache_children: dict[str, Any] = {}
+
+
+def record_item_cache_lookup(result: str) -> None:
+    if ITEM_CACHE_LOOKUPS is None:
+        return
+    child = _item_cache_children.get(result)
+    if child is None:
+        child = _item_cache_children[result] = ITEM_CACHE_LOOKUPS.labels(result=result)
+    child.inc()
+
+
+def record_item_cache_redis_error() -> None:
+    if ITEM_CACHE_REDIS_ERRORS is not None:
+        ITEM_CACHE_REDIS_ERRORS.inc()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Any
+
+PASSWORD_HASH_QUEUE_DEPTH: Any | None = None
+PASSWORD_HASH_DURATION: Any | None = None
+PASSWORD_HASH_REJECTIONS: Any | None = None
+PASSWORD_REHASHES: Any | None = None
+
+try:  # pragma: no cover - availability depends on runtime environment
+    from prometheus_client import Counter, Gauge, Histogram
+except ImportError:  # pragma: no cover - handled explicitly by fallback behavior
+    pass
+else:
+    PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+        "password_hash_queue_depth",
+        "Password hashing calls waiting for a free executor worker.",
+    )
+    PASSWORD_HASH_DURATION = Histogram(
+        "password_hash_duration_seconds",
+        "Password hashing call latency, including time queued for a worker.",
+        labelnames=("operation",),
+        buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+    PASSWORD_HASH_REJECTIONS = Counter(
+        "password_hash_rejections_total",
+        "Password hashing calls rejected because the executor queue was full.",
+        labelnames=("operation",),
+    )
+    PASSWORD_REHASHES = Counter(
+        "password_rehashes_total",
+        "Stored password hashes replaced on login to match the configured cost profile.",
+        labelnames=("scheme",),
+    )
+
+
+def set_queue_depth(depth: int) -> None:
+    if PASSWORD_HASH_QUEUE_DEPTH is not None:
+        PASSWORD_HASH_QUEUE_DEPTH.set(depth)
+
+
+def observe_hash_duration(operation: str, seconds: float) -> None:
+    if PASSWORD_HASH_DURATION is not None:
+        PASSWORD_HASH_DURATION.labels(operation=operation).observe(seconds)
+
+
+def record_rejection(operation: str) -> None:
+    if PASSWORD_HASH_REJECTIONS is not None:
+        PASSWORD_HASH_REJECTIONS.labels(operation=operation).inc()
+
+
+def record_rehash(scheme: str) -> None:
+    if PASSWORD_REHASHES is not None:
+        PASSWORD_REHASHES.labels(scheme=scheme).inc()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any
+
+RATE_LIMIT_CIRCUIT_STATE: Any | None = None
+RATE_LIMIT_SHORT_CIRCUITS: Any | None = None
+
+try:  # pragma: no cover - availability depends on runtime environment
+    from prometheus_client import Counter, Gauge
+except ImportError:  # pragma: no cover - handled explicitly by fallback behavior
+    pass
+else:
+    RATE_LIMIT_CIRCUIT_STATE = Gauge(
+        "rate_limit_backend_circuit_state",
+        "Rate limit backend circuit breaker state (0=closed, 1=half_open, 2=open).",
+        labelnames=("limiter",),
+    )
+    RATE_LIMIT_SHORT_CIRCUITS = Counter(
+        "rate_limit_backend_short_circuits_total",
+        "Rate limit checks that skipped the backend because its circuit was open.",
+        labelnames=("limiter", "outcome"),
+    )
+
+CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def set_circuit_state(limiter: str, state: str) -> None:
+    if RATE_LIMIT_CIRCUIT_STATE is not None:
+        RATE_LIMIT_CIRCUIT_STATE.labels(limiter=limiter).set(CIRCUIT_STATE_VALUES[state])
+
+
+def record_short_circuit(limiter: str, outcome: str) -> None:
+    if RATE_LIMIT_SHORT_CIRCUITS is not None:
+        RATE_LIMIT_SHORT_CIRCUITS.labels(limiter=limiter, outcome=outcome).inc()
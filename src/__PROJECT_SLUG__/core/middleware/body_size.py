@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 
 import structlog.contextvars
 from fastapi.responses import JSONResponse
@@ -19,10 +19,12 @@ class RequestBodyLimitMiddleware:
         *,
         max_body_bytes: int,
         exempt_paths: Iterable[str],
+        path_limits: Mapping[str, int] | None = None,
     ) -> None:
         self.app = app
         self.max_body_bytes = max_body_bytes
         self.exempt_paths = set(exempt_paths)
+        self.path_limits = dict(path_limits or {})
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -34,6 +36,7 @@ class RequestBodyLimitMiddleware:
             await self.app(scope, receive, send)
             return
 
+        max_body_bytes = self.path_limits.get(path, self.max_body_bytes)
         total_bytes = 0
 
         async def receive_wrapper() -> Message:
@@ -42,7 +45,7 @@ class RequestBodyLimitMiddleware:
             if message["type"] == "http.request":
                 body = message.get("body", b"")
                 total_bytes += len(body)
-                if total_bytes > self.max_body_bytes:
+                if total_bytes > max_body_bytes:
                     raise RequestBodyTooLarge
             return message
 
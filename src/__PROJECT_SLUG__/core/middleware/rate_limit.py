@@ -2,19 +2,24 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import math
+import re
 import time
 import uuid
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
-from typing import Protocol, cast
+from typing import Any, Protocol, cast
 
 import structlog
 import structlog.contextvars
 from fastapi.responses import JSONResponse
-from starlette.datastructures import Headers
+from starlette.routing import compile_path
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+from __PROJECT_SLUG__.core.metrics.rate_limit import record_short_circuit, set_circuit_state
+from __PROJECT_SLUG__.core.middleware.tenant import get_tenant_id
+
 log = structlog.get_logger()
 
 
@@ -33,63 +38,271 @@ class RateLimiter(Protocol):
 
 
 class RedisClient(Protocol):
-    async def incr(self, key: str) -> int: ...
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: str | int) -> Any: ...
 
-    async def expire(self, key: str, seconds: int) -> object: ...
+    async def eval(self, script: str, numkeys: int, *keys_and_args: str | int) -> Any: ...
 
     async def ping(self) -> object: ...
 
 
+class RedisScript:
+    """Server-side Lua script invoked by SHA, falling back to EVAL on ``NOSCRIPT``.
+
+    EVAL also stores the script in the server's script cache, so after a restart or
+    ``SCRIPT FLUSH`` only one extra round trip is paid before EVALSHA works again.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.sha = hashlib.sha1(source.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    async def __call__(self, client: RedisClient, keys: list[str], args: list[str | int]) -> Any:
+        try:
+            return await client.evalsha(self.sha, len(keys), *keys, *args)
+        except Exception as exc:
+            if not _is_noscript_error(exc):
+                raise
+        return await client.eval(self.source, len(keys), *keys, *args)
+
+
+def build_redis_client(redis_url: str) -> RedisClient:
+    try:
+        from redis import asyncio as redis_asyncio  # type: ignore[import-not-found]
+    except ImportError as exc:
+        raise RuntimeError(
+            "Redis rate limiter backend requires 'redis' dependency. "
+            "Install it with: poetry add redis"
+        ) from exc
+    return cast(
+        RedisClient,
+        redis_asyncio.from_url(redis_url, encoding="utf-8", decode_responses=True),
+    )
+
+
+async def close_redis_client(client: RedisClient) -> None:
+    close = cast(Callable[[], Awaitable[object]] | None, getattr(client, "aclose", None))
+    if close is not None:
+        await close()
+
+
+def _is_noscript_error(exc: Exception) -> bool:
+    return type(exc).__name__ == "NoScriptError" or str(exc).startswith("NOSCRIPT")
+
+
+# KEYS[1] = window counter, ARGV[1] = TTL seconds. Returns {count, ttl_remaining}.
+# The TTL is (re)applied whenever the key has none, so a counter can never outlive its window.
+_FIXED_WINDOW_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+local ttl = redis.call('TTL', KEYS[1])
+if ttl < 0 then
+  redis.call('EXPIRE', KEYS[1], ARGV[1])
+  ttl = tonumber(ARGV[1])
+end
+return {count, ttl}
+"""
+
+# KEYS[1] = window counter, ARGV[1] = lease size, ARGV[2] = window limit, ARGV[3] = TTL seconds.
+# Grants up to ARGV[1] permits without pushing the counter past the limit and returns the
+# number granted.
+_LEASE_SCRIPT = """
+local lease = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local used = tonumber(redis.call('GET', KEYS[1]) or '0')
+local granted = math.min(lease, limit - used)
+if granted < 0 then
+  granted = 0
+end
+if granted > 0 then
+  redis.call('INCRBY', KEYS[1], granted)
+end
+if granted > 0 and redis.call('TTL', KEYS[1]) < 0 then
+  redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+return granted
+"""
+
+# KEYS[1] = theoretical arrival time (TAT, ms), ARGV[1] = emission interval (ms),
+# ARGV[2] = burst capacity (ms). Returns {allowed, retry_after_ms}. Uses the Redis clock so
+# every worker shares one time source.
+_GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + tonumber(clock[2]) / 1000
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+  tat = now
+end
+local new_tat = tat + interval
+local allow_at = new_tat - capacity
+if now < allow_at then
+  return {0, math.ceil(allow_at - now)}
+end
+redis.call('SET', KEYS[1], string.format('%.3f', new_tat), 'PX', math.ceil(new_tat - now))
+return {1, 0}
+"""
+
+
 class SlidingWindowRateLimiter:
+    """In-process sliding window limiter with amortized O(1) bookkeeping per check.
+
+    Two insertion-ordered indexes replace full scans of the key space:
+
+    - ``_events`` is kept in least-recently-checked order, so LRU eviction pops the head.
+    - ``_expiry`` is kept in order of each key's newest admitted event, so stale keys
+      (nothing admitted within the window) always sit at its head.
+
+    Both orders assume a non-decreasing clock, which ``time.monotonic`` guarantees. Each check
+    drops at most ``PRUNE_BATCH_SIZE`` stale keys, so a large population expiring at once is
+    spread over later checks instead of stalling one; in steady state at most one key goes
+    stale per check, so the backlog still drains. The key cap bounds what is left meanwhile.
+    """
+
+    PRUNE_BATCH_SIZE = 2
+
     def __init__(self, max_requests: int, window_seconds: int, max_keys: int = 50000) -> None:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self.max_keys = max_keys
-        self._events: dict[str, deque[float]] = {}
-        self._last_seen: dict[str, float] = {}
-        self._lock = asyncio.Lock()
+        self._events: OrderedDict[str, deque[float]] = OrderedDict()
+        self._expiry: OrderedDict[str, None] = OrderedDict()
 
     def _prune_stale_keys(self, cutoff: float) -> None:
-        stale_keys = [
-            key for key, queue in self._events.items() if not queue or queue[-1] <= cutoff
-        ]
-        for stale_key in stale_keys:
-            self._events.pop(stale_key, None)
-            self._last_seen.pop(stale_key, None)
+        expiry = self._expiry
+        for _ in range(self.PRUNE_BATCH_SIZE):
+            if not expiry:
+                return
+            oldest_key = next(iter(expiry))
+            queue = self._events.get(oldest_key)
+            if queue and queue[-1] > cutoff:
+                return
+            expiry.popitem(last=False)
+            self._events.pop(oldest_key, None)
 
     def _evict_oldest_key(self) -> None:
-        if not self._last_seen:
+        if not self._events:
             return
-        oldest_key = min(self._last_seen, key=lambda item: self._last_seen[item])
-        self._events.pop(oldest_key, None)
-        self._last_seen.pop(oldest_key, None)
+        oldest_key, _ = self._events.popitem(last=False)
+        self._expiry.pop(oldest_key, None)
 
     async def check(self, key: str, now: float | None = None) -> RateLimitDecision:
         current = now if now is not None else time.monotonic()
         cutoff = current - self.window_seconds
+        # No lock: nothing in a check awaits, so each one runs atomically on the event loop.
+        self._prune_stale_keys(cutoff)
+
+        queue = self._events.get(key)
+        if queue is None:
+            if len(self._events) >= self.max_keys:
+                self._evict_oldest_key()
+            queue = deque()
+            self._events[key] = queue
+        else:
+            self._events.move_to_end(key)
+
+        while queue and queue[0] <= cutoff:
+            queue.popleft()
+
+        if len(queue) >= self.max_requests:
+            retry_after = max(1, int((queue[0] + self.window_seconds) - current))
+            return RateLimitDecision(allowed=False, retry_after_seconds=retry_after)
+
+        queue.append(current)
+        self._expiry[key] = None
+        self._expiry.move_to_end(key)
+        return RateLimitDecision(allowed=True)
+
+    async def allow(self, key: str, now: float | None = None) -> bool:
+        return (await self.check(key=key, now=now)).allowed
+
+    async def close(self) -> None:
+        return None
 
-        async with self._lock:
-            self._prune_stale_keys(cutoff)
+    async def ping(self) -> None:
+        return None
 
-            queue = self._events.get(key)
-            if queue is None:
-                if len(self._events) >= self.max_keys:
-                    self._evict_oldest_key()
-                queue = deque()
-                self._events[key] = queue
 
-            while queue and queue[0] <= cutoff:
-                queue.popleft()
+@dataclass(slots=True)
+class CounterWindow:
+    """Admitted counts of the current and previous fixed windows for one key."""
+
+    window: int
+    current: int = 0
+    previous: int = 0
 
-            if len(queue) >= self.max_requests:
-                retry_after = max(1, int((queue[0] + self.window_seconds) - current))
-                self._last_seen[key] = current
-                return RateLimitDecision(allowed=False, retry_after_seconds=retry_after)
+    def roll(self, window: int) -> None:
+        if window == self.window:
+            return
+        self.previous = self.current if window == self.window + 1 else 0
+        self.current = 0
+        self.window = window
 
-            queue.append(current)
-            self._last_seen[key] = current
+    def admit(self, *, max_requests: int, window_seconds: int, now: float) -> RateLimitDecision:
+        """Weight the previous window by its overlap with the sliding window and admit if room."""
+        self.roll(int(now // window_seconds))
+        window_start = self.window * window_seconds
+        elapsed = (now - window_start) / window_seconds
+        estimate = self.previous * (1 - elapsed) + self.current
+        if estimate + 1 <= max_requests:
+            self.current += 1
             return RateLimitDecision(allowed=True)
 
+        budget = max_requests - 1
+        if self.current <= budget:
+            wait_until = window_start + window_seconds * (
+                1 - (budget - self.current) / self.previous
+            )
+        else:
+            wait_until = window_start + window_seconds * (2 - budget / self.current)
+        return RateLimitDecision(
+            allowed=False,
+            retry_after_seconds=max(1, math.ceil(wait_until - now)),
+        )
+
+
+class SlidingWindowCounterRateLimiter:
+    """Approximate sliding window with a fixed footprint per key.
+
+    Each key keeps only the admitted counts of the current and previous fixed windows.
+    The previous count is weighted by how much of it still overlaps the sliding window,
+    so memory per key does not depend on ``max_requests``.
+    """
+
+    def __init__(self, max_requests: int, window_seconds: int, max_keys: int = 50000) -> None:
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._counters: OrderedDict[str, CounterWindow] = OrderedDict()
+
+    def _prune_stale_keys(self, window: int) -> None:
+        counters = self._counters
+        while counters:
+            oldest = next(iter(counters.values()))
+            if oldest.window >= window - 1:
+                return
+            counters.popitem(last=False)
+
+    async def check(self, key: str, now: float | None = None) -> RateLimitDecision:
+        current = now if now is not None else time.monotonic()
+        window = int(current // self.window_seconds)
+        # No lock: nothing in a check awaits, so each one runs atomically on the event loop.
+        self._prune_stale_keys(window)
+
+        counter = self._counters.get(key)
+        if counter is None:
+            if len(self._counters) >= self.max_keys:
+                self._counters.popitem(last=False)
+            counter = CounterWindow(window=window)
+            self._counters[key] = counter
+        else:
+            self._counters.move_to_end(key)
+
+        return counter.admit(
+            max_requests=self.max_requests,
+            window_seconds=self.window_seconds,
+            now=current,
+        )
+
     async def allow(self, key: str, now: float | None = None) -> bool:
         return (await self.check(key=key, now=now)).allowed
 
@@ -113,21 +326,10 @@ class RedisFixedWindowRateLimiter:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self.key_prefix = key_prefix
-        self._redis = redis_client or self._build_client(redis_url)
-
-    @staticmethod
-    def _build_client(redis_url: str) -> RedisClient:
-        try:
-            from redis import asyncio as redis_asyncio  # type: ignore[import-not-found]
-        except ImportError as exc:
-            raise RuntimeError(
-                "Redis rate limiter backend requires 'redis' dependency. "
-                "Install it with: poetry add redis"
-            ) from exc
-        return cast(
-            RedisClient,
-            redis_asyncio.from_url(redis_url, encoding="utf-8", decode_responses=True),
-        )
+        # A client passed in is shared with other limiters and closed by its owner.
+        self._owns_redis = redis_client is None
+        self._redis = redis_client or build_redis_client(redis_url)
+        self._script = RedisScript(_FIXED_WINDOW_SCRIPT)
 
     def _window_key(self, key: str, now: float) -> str:
         bucket = int(now // self.window_seconds)
@@ -141,27 +343,329 @@ class RedisFixedWindowRateLimiter:
         now = time.time()
         window_key = self._window_key(key, now)
 
-        count = await self._redis.incr(window_key)
-        if count == 1:
-            await self._redis.expire(window_key, self.window_seconds * 2)
+        count, ttl = await self._script(self._redis, [window_key], [self.window_seconds * 2])
 
-        if count > self.max_requests:
+        if int(count) > self.max_requests:
+            retry_after = self._retry_after_seconds(now)
+            if int(ttl) > 0:
+                retry_after = min(retry_after, int(ttl))
+            return RateLimitDecision(allowed=False, retry_after_seconds=retry_after)
+
+        return RateLimitDecision(allowed=True)
+
+    async def close(self) -> None:
+        if self._owns_redis:
+            await close_redis_client(self._redis)
+
+    async def ping(self) -> None:
+        await self._redis.ping()
+
+
+@dataclass(slots=True)
+class _Lease:
+    window: int
+    remaining: int = 0
+    denied: bool = False
+
+
+class LeasedRedisRateLimiter:
+    """Fixed window limiter that leases blocks of permits from Redis and spends them locally.
+
+    A hot key costs one Redis call per ``lease_size`` admitted requests, and once Redis reports
+    the window exhausted the denial is served from memory until the window rolls over. Leases
+    never push the shared counter past ``max_requests``, so there is no over-admission; the cost
+    is that each worker may strand up to ``lease_size - 1`` unspent permits per key and window.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_requests: int,
+        window_seconds: int,
+        redis_url: str,
+        key_prefix: str,
+        lease_size: int,
+        max_keys: int = 50000,
+        redis_client: RedisClient | None = None,
+    ) -> None:
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.key_prefix = key_prefix
+        self.lease_size = min(lease_size, max_requests)
+        self.max_keys = max_keys
+        self._leases: OrderedDict[str, _Lease] = OrderedDict()
+        # A client passed in is shared with other limiters and closed by its owner.
+        self._owns_redis = redis_client is None
+        self._redis = redis_client or build_redis_client(redis_url)
+        self._script = RedisScript(_LEASE_SCRIPT)
+
+    def _retry_after_seconds(self, window: int, now: float) -> int:
+        return max(1, math.ceil((window + 1) * self.window_seconds - now))
+
+    def _local_lease(self, key: str, window: int) -> _Lease | None:
+        lease = self._leases.get(key)
+        if lease is None:
+            return None
+        if lease.window != window:
+            del self._leases[key]
+            return None
+        self._leases.move_to_end(key)
+        return lease
+
+    def _store_lease(self, key: str, lease: _Lease) -> None:
+        if key not in self._leases and len(self._leases) >= self.max_keys:
+            self._leases.popitem(last=False)
+        self._leases[key] = lease
+
+    async def check(self, key: str) -> RateLimitDecision:
+        now = time.time()
+        window = int(now // self.window_seconds)
+
+        lease = self._local_lease(key, window)
+        if lease is not None and lease.remaining > 0:
+            lease.remaining -= 1
+            return RateLimitDecision(allowed=True)
+        if lease is not None and lease.denied:
             return RateLimitDecision(
                 allowed=False,
-                retry_after_seconds=self._retry_after_seconds(now),
+                retry_after_seconds=self._retry_after_seconds(window, now),
             )
 
-        return RateLimitDecision(allowed=True)
+        granted = int(
+            await self._script(
+                self._redis,
+                [f"{self.key_prefix}:{window}:{key}"],
+                [self.lease_size, self.max_requests, self.window_seconds * 2],
+            )
+        )
+
+        # Another coroutine may have stored a lease for this window while we awaited Redis.
+        lease = self._local_lease(key, window)
+        if lease is None:
+            lease = _Lease(window=window)
+            self._store_lease(key, lease)
+        if granted > 0:
+            lease.remaining += granted - 1
+            return RateLimitDecision(allowed=True)
+        if lease.remaining > 0:
+            lease.remaining -= 1
+            return RateLimitDecision(allowed=True)
+
+        lease.denied = True
+        return RateLimitDecision(
+            allowed=False,
+            retry_after_seconds=self._retry_after_seconds(window, now),
+        )
+
+    async def close(self) -> None:
+        if self._owns_redis:
+            await close_redis_client(self._redis)
+
+    async def ping(self) -> None:
+        await self._redis.ping()
+
+
+class RedisGCRARateLimiter:
+    """Generic cell rate algorithm over Redis: one small TAT value per key.
+
+    Requests are spaced ``window_seconds / max_requests`` apart and up to ``burst`` of them may
+    arrive back to back, so any ``window_seconds`` span admits at most
+    ``max_requests + burst - 1`` requests. The default ``burst=1`` is strict spacing, which
+    never exceeds ``max_requests``. ``retry_after_seconds`` is exact.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_requests: int,
+        window_seconds: int,
+        redis_url: str,
+        key_prefix: str,
+        burst: int = 1,
+        redis_client: RedisClient | None = None,
+    ) -> None:
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.burst = burst
+        self.key_prefix = key_prefix
+        self._emission_interval_ms = window_seconds * 1000 / max_requests
+        self._capacity_ms = self._emission_interval_ms * self.burst
+        # A client passed in is shared with other limiters and closed by its owner.
+        self._owns_redis = redis_client is None
+        self._redis = redis_client or build_redis_client(redis_url)
+        self._script = RedisScript(_GCRA_SCRIPT)
+
+    async def check(self, key: str) -> RateLimitDecision:
+        allowed, retry_after_ms = await self._script(
+            self._redis,
+            [f"{self.key_prefix}:gcra:{key}"],
+            [f"{self._emission_interval_ms:.3f}", f"{self._capacity_ms:.3f}"],
+        )
+        if int(allowed):
+            return RateLimitDecision(allowed=True)
+        return RateLimitDecision(
+            allowed=False,
+            retry_after_seconds=max(1, math.ceil(int(retry_after_ms) / 1000)),
+        )
 
     async def close(self) -> None:
-        close = cast(Callable[[], Awaitable[object]] | None, getattr(self._redis, "aclose", None))
-        if close is not None:
-            await close()
+        if self._owns_redis:
+            await close_redis_client(self._redis)
 
     async def ping(self) -> None:
         await self._redis.ping()
 
 
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+@dataclass(slots=True)
+class CircuitBreakerPolicy:
+    call_timeout_seconds: float = 0.25
+    failure_ratio: float = 0.5
+    min_calls: int = 20
+    reset_seconds: float = 5.0
+    degrade_to_memory: bool = False
+
+
+class CircuitBreaker:
+    """Health state of one rate limit backend, shared by every limiter that calls it.
+
+    The breaker opens once at least ``failure_ratio`` of the last ``min_calls`` calls failed
+    or timed out. After ``reset_seconds`` a single half-open probe decides whether to close
+    again. ``name`` labels the state and short-circuit metrics.
+    """
+
+    def __init__(self, policy: CircuitBreakerPolicy, *, name: str = "default") -> None:
+        self.policy = policy
+        self.name = name
+        self.state = "closed"
+        self._outcomes: deque[bool] = deque(maxlen=policy.min_calls)
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        set_circuit_state(name, self.state)
+
+    def _transition(self, state: str) -> None:
+        if state == self.state:
+            return
+        log.warning(
+            "rate_limit_circuit_state_changed", limiter=self.name, previous=self.state, state=state
+        )
+        self.state = state
+        set_circuit_state(self.name, state)
+        if state == "open":
+            self._opened_at = time.monotonic()
+        if state == "closed":
+            self._outcomes.clear()
+            self._failures = 0
+
+    def acquire(self) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self.policy.reset_seconds:
+                return False
+            self._transition("half_open")
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def release_probe(self) -> None:
+        self._probe_in_flight = False
+
+    def record(self, success: bool) -> None:
+        if self.state == "half_open":
+            self._transition("closed" if success else "open")
+            return
+        if len(self._outcomes) == self._outcomes.maxlen and not self._outcomes[0]:
+            self._failures -= 1
+        self._outcomes.append(success)
+        if not success:
+            self._failures += 1
+        if len(
+            self._outcomes
+        ) >= self.policy.min_calls and self._failures >= self.policy.failure_ratio * len(
+            self._outcomes
+        ):
+            self._transition("open")
+
+
+class CircuitBreakerRateLimiter:
+    """Bound every backend call by a deadline and stop calling a failing backend.
+
+    While ``breaker`` is open, checks skip the backend instantly: they are served by the
+    in-memory ``fallback`` limiter when one is configured, otherwise they raise
+    ``CircuitOpenError`` so ``RateLimitMiddleware`` applies its fail-open/closed policy.
+    Limiters on the same backend share one breaker, so they open and close together.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimiter,
+        *,
+        breaker: CircuitBreaker,
+        fallback: RateLimiter | None = None,
+    ) -> None:
+        self.backend = backend
+        self.breaker = breaker
+        self.fallback = fallback
+
+    @property
+    def policy(self) -> CircuitBreakerPolicy:
+        return self.breaker.policy
+
+    @property
+    def state(self) -> str:
+        return self.breaker.state
+
+    async def check(self, key: str) -> RateLimitDecision:
+        breaker = self.breaker
+        if not breaker.acquire():
+            if self.fallback is None:
+                record_short_circuit(breaker.name, "rejected")
+                raise CircuitOpenError("rate limit backend circuit is open")
+            record_short_circuit(breaker.name, "fallback")
+            return await self.fallback.check(key)
+
+        is_probe = breaker.state == "half_open"
+        try:
+            decision = await asyncio.wait_for(
+                self.backend.check(key),
+                timeout=breaker.policy.call_timeout_seconds,
+            )
+        except Exception:
+            breaker.record(success=False)
+            if self.fallback is None:
+                raise
+            log.warning("rate_limit_backend_degraded_to_memory", exc_info=True)
+            return await self.fallback.check(key)
+        finally:
+            if is_probe:
+                breaker.release_probe()
+
+        breaker.record(success=True)
+        return decision
+
+    async def ping(self) -> None:
+        if self.breaker.state == "open":
+            if self.fallback is None:
+                raise CircuitOpenError("rate limit backend circuit is open")
+            return
+        await asyncio.wait_for(
+            self.backend.ping(), timeout=self.breaker.policy.call_timeout_seconds
+        )
+
+    async def close(self) -> None:
+        await self.backend.close()
+        if self.fallback is not None:
+            await self.fallback.close()
+
+
 def build_rate_limiter(
     *,
     backend: str,
@@ -170,6 +674,67 @@ def build_rate_limiter(
     memory_max_keys: int,
     redis_url: str,
     redis_prefix: str,
+    burst: int = 1,
+    redis_lease_size: int = 0,
+    shm_path: str = "",
+    shm_stripes: int = 64,
+    shm_suffix: str = "",
+    circuit_breaker: CircuitBreakerPolicy | CircuitBreaker | None = None,
+    redis_client: RedisClient | None = None,
+    name: str = "default",
+) -> RateLimiter:
+    """Build the limiter for ``backend``, wrapped in a circuit breaker for Redis backends.
+
+    Pass a shared ``redis_client`` and ``CircuitBreaker`` when several limiters (per-route
+    policies) use one backend; a ``CircuitBreakerPolicy`` gets a new breaker labelled ``name``.
+    """
+    limiter = _build_backend(
+        backend=backend,
+        max_requests=max_requests,
+        window_seconds=window_seconds,
+        memory_max_keys=memory_max_keys,
+        redis_url=redis_url,
+        redis_prefix=redis_prefix,
+        burst=burst,
+        redis_lease_size=redis_lease_size,
+        shm_path=shm_path,
+        shm_stripes=shm_stripes,
+        shm_suffix=shm_suffix,
+        redis_client=redis_client,
+    )
+    if circuit_breaker is None or backend not in {"redis", "redis_gcra"}:
+        return limiter
+
+    breaker = (
+        circuit_breaker
+        if isinstance(circuit_breaker, CircuitBreaker)
+        else CircuitBreaker(circuit_breaker, name=name)
+    )
+
+    fallback: RateLimiter | None = None
+    if breaker.policy.degrade_to_memory:
+        fallback = SlidingWindowRateLimiter(
+            max_requests=max_requests,
+            window_seconds=window_seconds,
+            max_keys=memory_max_keys,
+        )
+    return CircuitBreakerRateLimiter(limiter, breaker=breaker, fallback=fallback)
+
+
+def _build_backend(
+    *,
+    backend: str,
+    max_requests: int,
+    window_seconds: int,
+    memory_max_keys: int,
+    redis_url: str,
+    redis_prefix: str,
+    burst: int,
+    redis_lease_size: int,
+    shm_path: str,
+    shm_stripes: int,
+    shm_suffix: str,
+    redis_client: RedisClient | None,
 ) -> RateLimiter:
     if backend == "memory":
         return SlidingWindowRateLimiter(
@@ -177,31 +742,229 @@ def build_rate_limiter(
             window_seconds=window_seconds,
             max_keys=memory_max_keys,
         )
+    if backend == "memory_counter":
+        return SlidingWindowCounterRateLimiter(
+            max_requests=max_requests,
+            window_seconds=window_seconds,
+            max_keys=memory_max_keys,
+        )
+    if backend == "shm":
+        from __PROJECT_SLUG__.core.middleware.rate_limit_shm import (
+            SharedMemoryRateLimiter,
+            default_shm_path,
+        )
+
+        # Each policy gets its own table; the limiter adds the layout to the file name.
+        path = shm_path or default_shm_path()
+        return SharedMemoryRateLimiter(
+            max_requests=max_requests,
+            window_seconds=window_seconds,
+            max_keys=memory_max_keys,
+            stripes=shm_stripes,
+            path=f"{path}.{shm_suffix}" if shm_suffix else path,
+        )
+    if backend == "redis" and redis_lease_size > 0:
+        return LeasedRedisRateLimiter(
+            max_requests=max_requests,
+            window_seconds=window_seconds,
+            redis_url=redis_url,
+            key_prefix=redis_prefix,
+            lease_size=redis_lease_size,
+            max_keys=memory_max_keys,
+            redis_client=redis_client,
+        )
     if backend == "redis":
         return RedisFixedWindowRateLimiter(
             max_requests=max_requests,
             window_seconds=window_seconds,
             redis_url=redis_url,
             key_prefix=redis_prefix,
+            redis_client=redis_client,
+        )
+    if backend == "redis_gcra":
+        return RedisGCRARateLimiter(
+            max_requests=max_requests,
+            window_seconds=window_seconds,
+            redis_url=redis_url,
+            key_prefix=redis_prefix,
+            burst=burst,
+            redis_client=redis_client,
         )
     raise ValueError(f"Unsupported rate limit backend: {backend}")
 
 
-def resolve_client_ip(headers: Headers, scope: Scope, trust_x_forwarded_for: bool) -> str:
+_FORWARDED_FOR_HEADER = b"x-forwarded-for"
+_KEY_SEPARATOR = "\x1f"
+# Raw keys above this length are digested so oversized paths cannot inflate local key storage.
+_MAX_RAW_KEY_LENGTH = 256
+
+RateLimitKeyBuilder = Callable[[tuple[str, ...]], str]
+
+
+def resolve_client_ip(scope: Scope, trust_x_forwarded_for: bool) -> str:
     if trust_x_forwarded_for:
-        forwarded_for = headers.get("X-Forwarded-For")
-        if forwarded_for:
-            first_hop = forwarded_for.split(",")[0].strip()
-            if first_hop:
-                return first_hop
+        for name, value in scope.get("headers", ()):
+            if name == _FORWARDED_FOR_HEADER:
+                first_hop = value.decode("latin-1").split(",", 1)[0].strip()
+                if first_hop:
+                    return first_hop
+                break
 
     client = scope.get("client")
     return client[0] if client else "unknown"
 
 
-def build_rate_limit_key(*, client_ip: str, tenant_id: str, path: str) -> str:
-    raw_key = f"{client_ip}:{tenant_id}:{path}"
-    return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+def digest_rate_limit_key(parts: tuple[str, ...]) -> str:
+    raw_key = _KEY_SEPARATOR.join(parts)
+    return hashlib.blake2b(raw_key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def join_rate_limit_key(parts: tuple[str, ...]) -> str:
+    raw_key = _KEY_SEPARATOR.join(parts)
+    if len(raw_key) > _MAX_RAW_KEY_LENGTH:
+        return digest_rate_limit_key(parts)
+    return raw_key
+
+
+def rate_limit_key_builder(backend: str) -> RateLimitKeyBuilder:
+    """Return the key derivation for ``backend``.
+
+    Process-local stores key on the joined parts directly; Redis keys are a fixed 32-character
+    digest so they stay short and do not expose client IPs in the keyspace.
+    """
+    if backend in {"redis", "redis_gcra"}:
+        return digest_rate_limit_key
+    return join_rate_limit_key
+
+
+ANY = "*"
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitPolicy:
+    """Limit for one route template, optionally narrowed to a method and a tenant.
+
+    ``key_by`` picks the request dimensions (``ip``, ``tenant``, ``path``) that identify a
+    client within the policy; the route template itself is always part of the key.
+    """
+
+    route: str
+    max_requests: int
+    window_seconds: int
+    method: str = ANY
+    tenant: str = ANY
+    key_by: tuple[str, ...] = ("ip", "tenant")
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable id of the policy's selector, independent of its position in the settings."""
+        selector = "\0".join((self.route, self.method.upper(), self.tenant))
+        return hashlib.blake2b(selector.encode(), digest_size=6).hexdigest()
+
+
+@dataclass(slots=True)
+class CompiledRateLimitPolicy:
+    policy: RateLimitPolicy
+    limiter: RateLimiter
+    by_ip: bool
+    by_tenant: bool
+    by_path: bool
+
+    def key_parts(self, *, client_ip: str, tenant_id: str, path: str) -> tuple[str, ...]:
+        return (
+            self.policy.route,
+            client_ip if self.by_ip else ANY,
+            tenant_id if self.by_tenant else ANY,
+            path if self.by_path else ANY,
+        )
+
+
+_PolicyEntry = dict[tuple[str, str], CompiledRateLimitPolicy]
+
+
+class RateLimitPolicyTable:
+    """Policy lookup compiled once at startup.
+
+    ``bind_routes`` hands the table every route template in router order, so a path resolves to
+    the template the router would pick, and to no policy when that template has none. Static
+    templates resolve with one dict lookup on the raw path. Parameterised templates are folded
+    into a single alternation regex whose matched group names the template, so resolution costs
+    one ``re.match`` no matter how many routes there are. Within a template, the most specific
+    ``(method, tenant)`` pair wins.
+    """
+
+    def __init__(self, policies: Iterable[tuple[RateLimitPolicy, RateLimiter]]) -> None:
+        self._entries: dict[str, _PolicyEntry] = {}
+        self.limiters: list[RateLimiter] = []
+        for policy, limiter in policies:
+            entry = self._entries.setdefault(policy.route, {})
+            selector = (policy.method.upper(), policy.tenant)
+            if selector in entry:
+                raise ValueError(
+                    f"Duplicate rate limit policy for {policy.method} {policy.route} "
+                    f"(tenant {policy.tenant})"
+                )
+            entry[selector] = CompiledRateLimitPolicy(
+                policy=policy,
+                limiter=limiter,
+                by_ip="ip" in policy.key_by,
+                by_tenant="tenant" in policy.key_by,
+                by_path="path" in policy.key_by,
+            )
+            self.limiters.append(limiter)
+        # Until routes are bound, only templates with policies take part, static ones first.
+        self._compile(sorted(self._entries, key=lambda template: "{" in template))
+
+    def bind_routes(self, route_templates: Iterable[str]) -> None:
+        """Match against all ``route_templates`` (in router order); reject unknown policy routes."""
+        templates = list(dict.fromkeys(route_templates))
+        unknown = set(self._entries) - set(templates)
+        if unknown:
+            raise ValueError(f"Rate limit policies reference unknown routes: {sorted(unknown)}")
+        self._compile(templates)
+
+    def _compile(self, templates: Iterable[str]) -> None:
+        self._static: dict[str, _PolicyEntry] = {}
+        self._dynamic: list[_PolicyEntry] = []
+        alternatives: list[str] = []
+        earlier: list[re.Pattern[str]] = []
+        for template in templates:
+            entry = self._entries.get(template, {})
+            regex, _, convertors = compile_path(template)
+            if convertors:
+                # Inner groups become non-capturing so ``lastgroup`` names the template.
+                pattern = re.sub(r"\(\?P<\w+>", "(?:", regex.pattern[1:-1])
+                alternatives.append(f"(?P<t{len(self._dynamic)}>{pattern})")
+                self._dynamic.append(entry)
+                earlier.append(regex)
+            elif not any(regex.match(template) for regex in earlier):
+                # A static template after a parameterised one that matches it is never routed.
+                self._static[template] = entry
+        self._pattern = re.compile(f"(?:{'|'.join(alternatives)})$") if alternatives else None
+
+    def resolve(self, path: str, method: str, tenant_id: str) -> CompiledRateLimitPolicy | None:
+        entry = self._static.get(path)
+        if entry is None:
+            if self._pattern is None:
+                return None
+            match = self._pattern.match(path)
+            if match is None or match.lastgroup is None:
+                return None
+            entry = self._dynamic[int(match.lastgroup[1:])]
+        return (
+            entry.get((method, tenant_id))
+            or entry.get((method, ANY))
+            or entry.get((ANY, tenant_id))
+            or entry.get((ANY, ANY))
+        )
+
+    async def ping(self) -> None:
+        for limiter in self.limiters:
+            await limiter.ping()
+
+    async def close(self) -> None:
+        for limiter in self.limiters:
+            await limiter.close()
 
 
 class RateLimitMiddleware:
@@ -213,12 +976,16 @@ class RateLimitMiddleware:
         exempt_paths: Iterable[str],
         fail_open: bool = True,
         trust_x_forwarded_for: bool = False,
+        policies: RateLimitPolicyTable | None = None,
+        key_builder: RateLimitKeyBuilder = digest_rate_limit_key,
     ) -> None:
         self.app = app
         self.limiter = limiter
         self.exempt_paths = set(exempt_paths)
         self.fail_open = fail_open
         self.trust_x_forwarded_for = trust_x_forwarded_for
+        self.policies = policies
+        self.key_builder = key_builder
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -230,16 +997,30 @@ class RateLimitMiddleware:
             await self.app(scope, receive, send)
             return
 
-        headers = Headers(scope=scope)
-        tenant_id = headers.get("X-Tenant-ID", "public")
-        client_ip = resolve_client_ip(headers, scope, self.trust_x_forwarded_for)
-        key = build_rate_limit_key(client_ip=client_ip, tenant_id=tenant_id, path=path)
+        # TenantMiddleware runs first and has already parsed X-Tenant-ID for this request.
+        tenant_id = get_tenant_id()
+        client_ip = resolve_client_ip(scope, self.trust_x_forwarded_for)
+        policy = (
+            self.policies.resolve(path, scope.get("method", "GET"), tenant_id)
+            if self.policies is not None
+            else None
+        )
+        if policy is None:
+            limiter = self.limiter
+            key = self.key_builder((client_ip, tenant_id, path))
+        else:
+            limiter = policy.limiter
+            key = self.key_builder(
+                policy.key_parts(client_ip=client_ip, tenant_id=tenant_id, path=path)
+            )
 
         try:
-            decision = await self.limiter.check(key)
-        except Exception:
+            decision = await limiter.check(key)
+        except Exception as exc:
             if self.fail_open:
-                log.exception("rate_limit_backend_failed_open", path=path, client_ip=client_ip)
+                # An open circuit already logged its transition; don't log a traceback per request.
+                if not isinstance(exc, CircuitOpenError):
+                    log.exception("rate_limit_backend_failed_open", path=path, client_ip=client_ip)
                 await self.app(scope, receive, send)
                 return
             request_id = str(
@@ -0,0 +1,170 @@
+"""Host-wide rate limiter shared by every worker process through a memory-mapped file.
+
+``uvicorn --workers N`` gives each worker its own in-process limiter, so the effective limit
+becomes N times the configured one. This backend keeps one fixed-size open-addressing hash
+table in a memory-mapped file that every worker on the host maps, so limits are global to the
+host without a network hop.
+
+Layout: a 64-byte header followed by ``stripes`` equally sized regions of 24-byte slots
+(key fingerprint, window index, current count, previous count). A key hashes to one stripe and
+a home slot inside it; updates hold a POSIX byte-range lock (``fcntl.lockf``) on that stripe
+only, so workers touching different stripes never contend. Counting uses the same sliding
+window counter estimate as the ``memory_counter`` backend.
+
+The layout (window, stripes, slots per stripe) is part of the file name, so a worker started
+with a different configuration maps its own file instead of resizing one that other live workers
+still have mapped. POSIX only (``fcntl``).
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import time
+
+from __PROJECT_SLUG__.core.middleware.rate_limit import CounterWindow, RateLimitDecision
+
+_MAGIC = b"RLSHM001"
+_HEADER = struct.Struct("<8sIII")
+_HEADER_SIZE = 64
+_SLOT = struct.Struct("<QqII")
+_PROBE_LENGTH = 8
+
+
+def default_shm_path() -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "__SERVICE_NAME__-rate-limit.shm")
+
+
+def layout_path(path: str, *, window_seconds: int, stripes: int, slots_per_stripe: int) -> str:
+    return f"{path}.{window_seconds}s-{stripes}x{slots_per_stripe}"
+
+
+def _fingerprint(key: str) -> tuple[int, int]:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    fingerprint = int.from_bytes(digest[:8], "little") or 1
+    return fingerprint, int.from_bytes(digest[8:], "little")
+
+
+class SharedMemoryRateLimiter:
+    def __init__(
+        self,
+        *,
+        max_requests: int,
+        window_seconds: int,
+        max_keys: int = 50000,
+        stripes: int = 64,
+        path: str | None = None,
+    ) -> None:
+        if stripes < 1:
+            raise ValueError("stripes must be >= 1")
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.stripes = stripes
+        # Keep the load factor at or below 0.5 so short probe sequences find free slots.
+        self.slots_per_stripe = max(_PROBE_LENGTH, -(-2 * max_keys // stripes))
+        self.stripe_bytes = self.slots_per_stripe * _SLOT.size
+        self.path = layout_path(
+            path or default_shm_path(),
+            window_seconds=window_seconds,
+            stripes=stripes,
+            slots_per_stripe=self.slots_per_stripe,
+        )
+        self._size = _HEADER_SIZE + stripes * self.stripe_bytes
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._initialize()
+            self._map = mmap.mmap(self._fd, self._size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _initialize(self) -> None:
+        expected = _HEADER.pack(_MAGIC, self.stripes, self.slots_per_stripe, self.window_seconds)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, _HEADER_SIZE, 0)
+        try:
+            current = os.pread(self._fd, _HEADER.size, 0)
+            size = os.fstat(self._fd).st_size
+            if current == expected and size == self._size:
+                return
+            # Workers map the file only after the header is written, so a file without one has
+            # no readers yet. Anything else may be mapped elsewhere and must not be resized.
+            if current.strip(b"\0") or size not in {0, self._size}:
+                raise RuntimeError(
+                    f"Rate limit table {self.path} has an unexpected layout; "
+                    "remove it or configure a different path"
+                )
+            os.ftruncate(self._fd, self._size)
+            os.pwrite(self._fd, expected, 0)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, _HEADER_SIZE, 0)
+
+    def _locate(self, fingerprint: int, home: int, base: int, window: int) -> tuple[int, bool]:
+        """Return the slot offset for ``fingerprint`` and whether it already holds the key.
+
+        Empty slots and slots whose counts can no longer affect the estimate are reusable;
+        when the whole probe sequence is live, the slot with the oldest window is evicted.
+        """
+        reusable: int | None = None
+        oldest_offset = base + home * _SLOT.size
+        oldest_window: int | None = None
+        for step in range(_PROBE_LENGTH):
+            offset = base + ((home + step) % self.slots_per_stripe) * _SLOT.size
+            slot_fingerprint, slot_window, _, _ = _SLOT.unpack_from(self._map, offset)
+            if slot_fingerprint == fingerprint:
+                return offset, True
+            if reusable is None and (slot_fingerprint == 0 or slot_window < window - 1):
+                reusable = offset
+            if oldest_window is None or slot_window < oldest_window:
+                oldest_offset, oldest_window = offset, slot_window
+        return (reusable if reusable is not None else oldest_offset), False
+
+    async def check(self, key: str, now: float | None = None) -> RateLimitDecision:
+        current = now if now is not None else time.time()
+        window = int(current // self.window_seconds)
+        fingerprint, position = _fingerprint(key)
+        stripe = position % self.stripes
+        home = (position // self.stripes) % self.slots_per_stripe
+        base = _HEADER_SIZE + stripe * self.stripe_bytes
+
+        # The critical section never awaits, so the byte-range lock is held for microseconds.
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self.stripe_bytes, base)
+        try:
+            offset, found = self._locate(fingerprint, home, base, window)
+            if found:
+                _, slot_window, slot_current, slot_previous = _SLOT.unpack_from(self._map, offset)
+                counter = CounterWindow(slot_window, slot_current, slot_previous)
+            else:
+                counter = CounterWindow(window)
+            decision = counter.admit(
+                max_requests=self.max_requests,
+                window_seconds=self.window_seconds,
+                now=current,
+            )
+            _SLOT.pack_into(
+                self._map,
+                offset,
+                fingerprint,
+                counter.window,
+                counter.current,
+                counter.previous,
+            )
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self.stripe_bytes, base)
+        return decision
+
+    async def allow(self, key: str, now: float | None = None) -> bool:
+        return (await self.check(key=key, now=now)).allowed
+
+    async def ping(self) -> None:
+        if self._map.closed:
+            raise RuntimeError("shared memory rate limiter is closed")
+
+    async def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+            os.close(self._fd)
@@ -0,0 +1,73 @@
+"""Opaque, signed cursors for keyset pagination.
+
+A cursor carries the sort key of the last row a client has seen, so the next page is a range
+read that starts right after it (``WHERE (created_at, id) > (:created_at, :id)``) instead of an
+``OFFSET`` that scans and discards every earlier row. Cursors are base64url JSON plus an
+HMAC-SHA256 tag: clients can decode them but cannot forge them, and a cursor is only accepted
+in the ``context`` it was issued for (for example one tenant's item listing).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+from collections.abc import Sequence
+
+_TAG_BYTES = 16
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class CursorCodec:
+    def __init__(self) -> None:
+        self._key: bytes | None = None
+
+    def configure(self, secret: str) -> None:
+        # Derive a dedicated key so the cursor MAC never reuses a signing secret directly.
+        self._key = hmac.new(secret.encode(), b"pagination-cursor", hashlib.sha256).digest()
+
+    def _get_key(self) -> bytes:
+        if self._key is None:
+            from __PROJECT_SLUG__.core.config import get_settings
+
+            settings = get_settings()
+            self.configure(settings.pagination_cursor_secret or settings.auth_jwt_secret)
+        assert self._key is not None
+        return self._key
+
+    def _tag(self, payload: str, context: str) -> bytes:
+        message = f"{context}\x00{payload}".encode()
+        return hmac.new(self._get_key(), message, hashlib.sha256).digest()[:_TAG_BYTES]
+
+    def encode(self, values: Sequence[str], *, context: str) -> str:
+        payload = _b64encode(json.dumps(list(values), separators=(",", ":")).encode())
+        return f"{payload}.{_b64encode(self._tag(payload, context))}"
+
+    def decode(self, cursor: str, *, context: str) -> list[str]:
+        payload, _, tag = cursor.partition(".")
+        try:
+            valid = hmac.compare_digest(_b64decode(tag), self._tag(payload, context))
+            values = json.loads(_b64decode(payload)) if valid else None
+        except (binascii.Error, UnicodeError, ValueError):
+            valid, values = False, None
+        if not valid or not isinstance(values, list):
+            raise InvalidCursorError("Invalid pagination cursor.")
+        if not all(isinstance(value, str) for value in values):
+            raise InvalidCursorError("Invalid pagination cursor.")
+        return values
+
+
+cursor_codec = CursorCodec()
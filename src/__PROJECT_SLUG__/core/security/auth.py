@@ -1,30 +1,51 @@
 from __future__ import annotations
 
 import secrets
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
+from functools import cache
 from typing import Annotated, Any
 
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, SecurityScopes
-from pydantic import BaseModel, Field
 
 from __PROJECT_SLUG__.core.config import get_settings
+from __PROJECT_SLUG__.core.metrics.auth import record_token_verification
+from __PROJECT_SLUG__.core.security.keyring import VerificationKey, get_jwt_keyring
+from __PROJECT_SLUG__.core.security.revocation import access_token_revocations
+from __PROJECT_SLUG__.core.security.scopes import ScopeRegistry
+from __PROJECT_SLUG__.core.security.token_cache import verified_token_cache
+
+OAUTH2_SCOPES = {
+    "items:read": "Read items",
+    "items:write": "Create and mutate items",
+    "users:write": "Provision user accounts",
+}
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/api/v1/auth/token",
-    scopes={
-        "items:read": "Read items",
-        "items:write": "Create and mutate items",
-    },
+    scopes=OAUTH2_SCOPES,
     auto_error=False,
 )
 
+scope_registry = ScopeRegistry(OAUTH2_SCOPES)
 
-class AuthPrincipal(BaseModel):
-    username: str
-    scopes: list[str] = Field(default_factory=list)
+
+class AuthPrincipal:
+    __slots__ = ("username", "scopes", "scope_mask")
+
+    def __init__(self, username: str, scopes: list[str], scope_mask: int | None = None) -> None:
+        self.username = username
+        self.scopes = scopes
+        self.scope_mask = scope_registry.mask(scopes) if scope_mask is None else scope_mask
+
+    def __repr__(self) -> str:
+        return f"AuthPrincipal(username={self.username!r}, scopes={self.scopes!r})"
+
+    def has_scopes(self, required_mask: int) -> bool:
+        return self.scope_mask & required_mask == required_mask
 
 
 def authenticate_admin_user(username: str, password: str) -> bool:
@@ -57,24 +78,63 @@ def create_access_token(
         "iat": int(datetime.now(UTC).timestamp()),
         "exp": int(expires_at.timestamp()),
     }
-    token = jwt.encode(payload, settings.auth_jwt_secret, algorithm=settings.auth_jwt_algorithm)
+    keyring = get_jwt_keyring()
+    token = jwt.encode(
+        payload,
+        keyring.signing_key,
+        algorithm=keyring.algorithm,
+        headers={"kid": keyring.signing_kid},
+    )
     return token, int(expires_delta.total_seconds())
 
 
+def _candidate_keys(token: str, *, accept_legacy: bool) -> tuple[VerificationKey, ...]:
+    keyring = get_jwt_keyring()
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+    except jwt.InvalidTokenError:
+        return ()
+    if kid is None:
+        return keyring.legacy_keys if accept_legacy else ()
+    if not isinstance(kid, str):
+        return ()
+    key = keyring.get(kid)
+    return (key,) if key is not None else ()
+
+
 def decode_access_token(token: str) -> dict[str, Any]:
+    started = time.perf_counter()
     settings = get_settings()
-    secrets_to_try = [settings.auth_jwt_secret, *settings.auth_jwt_additional_secrets]
-    for secret in secrets_to_try:
+    verifier = None
+    if settings.auth_token_cache_enabled:
+        verifier = (
+            get_jwt_keyring(),
+            settings.auth_jwt_accept_legacy_tokens,
+            settings.auth_audience,
+            settings.auth_issuer,
+        )
+        cached = verified_token_cache.get(token, verifier=verifier)
+        if cached is not None:
+            record_token_verification("hit", time.perf_counter() - started)
+            return cached
+
+    # At most one verification for tokens with a ``kid``; unknown key IDs never reach jwt.decode.
+    for key in _candidate_keys(token, accept_legacy=settings.auth_jwt_accept_legacy_tokens):
         try:
-            return jwt.decode(
+            payload = jwt.decode(
                 token,
-                secret,
-                algorithms=[settings.auth_jwt_algorithm],
+                key.key,
+                algorithms=key.algorithms,
                 audience=settings.auth_audience,
                 issuer=settings.auth_issuer,
             )
         except jwt.InvalidTokenError:
             continue
+        if verifier is not None:
+            verified_token_cache.put(token, payload, verifier=verifier)
+        record_token_verification("miss", time.perf_counter() - started)
+        return payload
+    record_token_verification("invalid", time.perf_counter() - started)
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication token.",
@@ -82,10 +142,15 @@ def decode_access_token(token: str) -> dict[str, Any]:
     )
 
 
-async def get_current_principal(
-    security_scopes: SecurityScopes,
-    token: Annotated[str | None, Depends(oauth2_scheme)],
-) -> AuthPrincipal:
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _authorize(token: str | None, required: list[str], required_mask: int) -> AuthPrincipal:
     settings = get_settings()
 
     if not settings.auth_enabled:
@@ -95,54 +160,61 @@ async def get_current_principal(
         )
 
     if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _unauthorized("Not authenticated.")
 
     payload = decode_access_token(token)
     token_type = str(payload.get("typ", ""))
     if token_type and token_type != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication token type.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _unauthorized("Invalid authentication token type.")
 
-    username = str(payload.get("username", payload.get("sub", "")))
-    token_scopes = payload.get("scopes", [])
+    jti = payload.get("jti")
+    if isinstance(jti, str) and access_token_revocations.is_revoked(jti):
+        raise _unauthorized("Authentication token has been revoked.")
 
-    if not isinstance(token_scopes, list) or not all(
-        isinstance(scope, str) for scope in token_scopes
-    ):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token scopes.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    token_scopes = payload.get("scopes", [])
+    scope_mask = scope_registry.mask(token_scopes) if isinstance(token_scopes, list) else None
+    if scope_mask is None:
+        raise _unauthorized("Invalid token scopes.")
 
-    missing_scopes = [scope for scope in security_scopes.scopes if scope not in token_scopes]
-    if missing_scopes:
+    if scope_mask & required_mask != required_mask:
+        missing_scopes = scope_registry.names(required_mask & ~scope_mask, order=required)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Missing required scopes: {', '.join(missing_scopes)}",
         )
 
+    username = str(payload.get("username", payload.get("sub", "")))
     if not username:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication token subject.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _unauthorized("Invalid authentication token subject.")
 
-    return AuthPrincipal(username=username, scopes=list(token_scopes))
+    return AuthPrincipal(username=username, scopes=token_scopes, scope_mask=scope_mask)
+
+
+@cache
+def _required_mask(required: tuple[str, ...]) -> int:
+    # A scope keeps its bit once registered, so each route's mask is compiled only once.
+    return scope_registry.compile(required)
+
+
+async def get_current_principal(
+    security_scopes: SecurityScopes,
+    token: Annotated[str | None, Depends(oauth2_scheme)],
+) -> AuthPrincipal:
+    required = security_scopes.scopes
+    return _authorize(token, required, _required_mask(tuple(required)))
 
 
 def require_scopes(scopes: list[str]):
+    """Dependency that authenticates the bearer token and requires all of ``scopes``.
+
+    The scopes are compiled to a mask here, when the route is declared, not per request.
+    """
+    required = list(scopes)
+    required_mask = scope_registry.compile(required)
+
     async def dependency(
         token: Annotated[str | None, Depends(oauth2_scheme)],
     ) -> AuthPrincipal:
-        return await get_current_principal(SecurityScopes(scopes=scopes), token)
+        return _authorize(token, required, required_mask)
 
     return dependency
@@ -0,0 +1,114 @@
+"""Bounded executor for password hashing and verification.
+
+argon2 and PBKDF2 spend tens to hundreds of milliseconds of CPU per call. Run on the event loop,
+one login stalls every other request on the worker, so calls go to a small thread or process
+pool instead. Admission is capped at ``max_workers + max_queue`` calls in flight; beyond that
+``run`` raises ``PasswordHashingBusyError`` immediately instead of letting logins queue without
+bound.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TypeVar
+
+from __PROJECT_SLUG__.core.metrics.password_hashing import (
+    observe_hash_duration,
+    record_rejection,
+    set_queue_depth,
+)
+
+T = TypeVar("T")
+
+PASSWORD_HASH_EXECUTORS = frozenset({"thread", "process"})
+
+
+class PasswordHashingBusyError(RuntimeError):
+    """Raised when the password hashing queue is full."""
+
+
+class PasswordHashingExecutor:
+    def __init__(self, *, kind: str = "thread", max_workers: int = 2, max_queue: int = 32) -> None:
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        self.configure(kind=kind, max_workers=max_workers, max_queue=max_queue)
+
+    def configure(self, *, kind: str, max_workers: int, max_queue: int) -> None:
+        if kind not in PASSWORD_HASH_EXECUTORS:
+            raise ValueError(f"Unsupported password hash executor: {kind}")
+        if max_workers < 1 or max_queue < 0:
+            raise ValueError("max_workers must be >= 1 and max_queue must be >= 0")
+        self.shutdown()
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                # Forking from a running event loop copies locks held by other threads into
+                # the child, which can deadlock it; start workers from a clean interpreter.
+                method = (
+                    "forkserver"
+                    if "forkserver" in multiprocessing.get_all_start_methods()
+                    else "spawn"
+                )
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(method),
+                )
+            else:
+                # argon2-cffi and hashlib.pbkdf2_hmac release the GIL, so threads run in parallel.
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash",
+                )
+        return self._executor
+
+    def _publish_queue_depth(self) -> None:
+        set_queue_depth(max(0, self._in_flight - self.max_workers))
+
+    async def run(self, operation: str, func: Callable[..., T], *args: object) -> T:
+        if self._in_flight >= self.max_workers + self.max_queue:
+            record_rejection(operation)
+            raise PasswordHashingBusyError("password hashing queue is full")
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        future: Future[T] = self._get_executor().submit(func, *args)
+        self._in_flight += 1
+        self._publish_queue_depth()
+
+        def _finished() -> None:
+            self._in_flight -= 1
+            self._publish_queue_depth()
+            observe_hash_duration(operation, time.perf_counter() - started)
+
+        def _on_done(_: Future[T]) -> None:
+            try:
+                loop.call_soon_threadsafe(_finished)
+            except RuntimeError:  # event loop already closed (shutdown)
+                self._in_flight -= 1
+
+        # Release the slot when the work finishes, not when the caller stops waiting: a cancelled
+        # request does not stop the worker, so the slot must stay taken until it really is free.
+        future.add_done_callback(_on_done)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hashing = PasswordHashingExecutor()
+# Bulk user imports hash on their own pool so an import never takes login capacity.
+user_import_hashing = PasswordHashingExecutor(kind="process")
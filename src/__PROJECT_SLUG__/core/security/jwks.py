@@ -0,0 +1,37 @@
+"""``/.well-known/jwks.json``: public signing keys for local token verification.
+
+The body is serialized once when the keyring is built, so a request only compares ETags and
+writes cached bytes. Gateways and downstream services revalidate with ``If-None-Match`` and get
+a bodyless 304 until the key set changes.
+"""
+
+from __future__ import annotations
+
+from fastapi import Request, Response
+
+from __PROJECT_SLUG__.core.config import get_settings
+from __PROJECT_SLUG__.core.security.keyring import get_jwt_keyring
+
+JWKS_PATH = "/.well-known/jwks.json"
+JWKS_MEDIA_TYPE = "application/jwk-set+json"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison (RFC 9110 section 13.1.2).
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def jwks_endpoint(request: Request) -> Response:
+    """Async so the cached document is served on the event loop, not through the threadpool."""
+    document = get_jwt_keyring().jwks
+    if document is None:
+        return Response(status_code=404)
+    headers = {
+        "ETag": document.etag,
+        "Cache-Control": f"public, max-age={get_settings().auth_jwks_max_age_seconds}",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, document.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=document.body, media_type=JWKS_MEDIA_TYPE, headers=headers)
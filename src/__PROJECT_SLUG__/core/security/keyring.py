@@ -0,0 +1,194 @@
+"""JWT signing keys indexed by key ID (``kid``).
+
+Access tokens carry the ``kid`` of the key that signed them, so verification looks the key up in
+a dict instead of trying every configured key in turn. Key IDs are derived from the keys, so
+every worker and every replica computes the same IDs without extra configuration, and rotating
+a key rotates its ID:
+
+- HMAC secrets get an HMAC fingerprint (never the secret itself).
+- Asymmetric keys (EdDSA, ES256, RS256) get their RFC 7638 JWK thumbprint, and their public
+  halves are published as a JWKS document so other services can verify tokens locally.
+
+PEM files are read and parsed once per process, and the JWKS body is serialized once with them.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import jwt
+
+from __PROJECT_SLUG__.core.config import (
+    JWT_ASYMMETRIC_ALGORITHMS,
+    JWT_HMAC_ALGORITHMS,
+    get_settings,
+)
+
+_KEY_ID_CONTEXT = b"jwt-kid/v1"
+# RFC 7638 section 3.2: the members that identify a public key, per key type.
+_THUMBPRINT_MEMBERS = {
+    "EC": ("crv", "kty", "x", "y"),
+    "OKP": ("crv", "kty", "x"),
+    "RSA": ("e", "kty", "n"),
+}
+
+
+def derive_key_id(secret: str) -> str:
+    return hmac.new(secret.encode("utf-8"), _KEY_ID_CONTEXT, hashlib.sha256).hexdigest()[:16]
+
+
+def jwk_thumbprint(jwk: dict[str, Any]) -> str:
+    members = {name: jwk[name] for name in _THUMBPRINT_MEMBERS[jwk["kty"]]}
+    canonical = json.dumps(members, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(hashlib.sha256(canonical).digest()).rstrip(b"=").decode()
+
+
+@dataclass(frozen=True, slots=True)
+class VerificationKey:
+    kid: str
+    key: Any  # HMAC secret or public key object
+    algorithms: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class JWKSDocument:
+    body: bytes
+    etag: str
+
+
+class JWTKeyring:
+    def __init__(
+        self,
+        *,
+        algorithm: str,
+        signing_key: Any,
+        signing_kid: str,
+        verification_keys: Sequence[VerificationKey],
+        jwks: JWKSDocument | None = None,
+    ) -> None:
+        self.algorithm = algorithm
+        self.signing_key = signing_key
+        self.signing_kid = signing_kid
+        self.jwks = jwks
+        self._by_kid: dict[str, VerificationKey] = {}
+        for key in verification_keys:
+            self._by_kid.setdefault(key.kid, key)
+        # Tokens issued before ``kid`` headers existed: try the keys in configured order.
+        self.legacy_keys: tuple[VerificationKey, ...] = tuple(self._by_kid.values())
+
+    def get(self, kid: str) -> VerificationKey | None:
+        return self._by_kid.get(kid)
+
+    @property
+    def key_ids(self) -> tuple[str, ...]:
+        return tuple(self._by_kid)
+
+
+def _hmac_keys(secrets: Sequence[str], algorithms: tuple[str, ...]) -> list[VerificationKey]:
+    return [
+        VerificationKey(kid=derive_key_id(secret), key=secret, algorithms=algorithms)
+        for secret in secrets
+    ]
+
+
+def hmac_keyring(
+    *, secret: str, additional_secrets: Sequence[str] = (), algorithm: str = "HS256"
+) -> JWTKeyring:
+    if algorithm not in JWT_HMAC_ALGORITHMS:
+        raise ValueError(f"Unsupported HMAC JWT algorithm: {algorithm}")
+    return JWTKeyring(
+        algorithm=algorithm,
+        signing_key=secret,
+        signing_kid=derive_key_id(secret),
+        verification_keys=_hmac_keys([secret, *additional_secrets], (algorithm,)),
+    )
+
+
+def asymmetric_keyring(
+    *,
+    private_key_pem: bytes,
+    additional_public_key_pems: Sequence[bytes] = (),
+    algorithm: str,
+    additional_secrets: Sequence[str] = (),
+) -> JWTKeyring:
+    """Build a keyring that signs with ``private_key_pem``.
+
+    ``additional_public_key_pems`` are previous signing keys: they still verify and stay in the
+    JWKS until removed. ``additional_secrets`` keep HMAC tokens issued before switching to an
+    asymmetric algorithm valid; they are never published.
+    """
+    if algorithm not in JWT_ASYMMETRIC_ALGORITHMS:
+        raise ValueError(f"Unsupported asymmetric JWT algorithm: {algorithm}")
+    implementation = jwt.get_algorithm_by_name(algorithm)
+    try:
+        private_key = implementation.prepare_key(private_key_pem)
+        public_keys = [private_key.public_key()]
+        public_keys.extend(implementation.prepare_key(pem) for pem in additional_public_key_pems)
+        # Fail at startup, not on the first login, when the key does not fit the algorithm.
+        probe = jwt.encode({}, private_key, algorithm=algorithm)
+        jwt.decode(probe, public_keys[0], algorithms=[algorithm])
+    except (AttributeError, TypeError, ValueError, jwt.PyJWTError) as exc:
+        raise ValueError(f"JWT keys are not valid {algorithm} PEM keys: {exc}") from exc
+
+    verification_keys: list[VerificationKey] = []
+    published: list[dict[str, Any]] = []
+    for public_key in public_keys:
+        jwk = implementation.to_jwk(public_key, as_dict=True)
+        jwk.pop("key_ops", None)
+        kid = jwk_thumbprint(jwk)
+        verification_keys.append(VerificationKey(kid=kid, key=public_key, algorithms=(algorithm,)))
+        published.append({**jwk, "kid": kid, "alg": algorithm, "use": "sig"})
+    verification_keys.extend(_hmac_keys(additional_secrets, JWT_HMAC_ALGORITHMS))
+
+    body = json.dumps({"keys": published}, separators=(",", ":")).encode("utf-8")
+    return JWTKeyring(
+        algorithm=algorithm,
+        signing_key=private_key,
+        signing_kid=verification_keys[0].kid,
+        verification_keys=verification_keys,
+        jwks=JWKSDocument(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"'),
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_keyring(
+    algorithm: str,
+    secret: str,
+    additional_secrets: tuple[str, ...],
+    private_key_file: str,
+    additional_public_key_files: tuple[str, ...],
+) -> JWTKeyring:
+    if algorithm in JWT_HMAC_ALGORITHMS:
+        return hmac_keyring(
+            secret=secret,
+            additional_secrets=additional_secrets,
+            algorithm=algorithm,
+        )
+    return asymmetric_keyring(
+        private_key_pem=Path(private_key_file).read_bytes(),
+        additional_public_key_pems=[
+            Path(path).read_bytes() for path in additional_public_key_files
+        ],
+        algorithm=algorithm,
+        additional_secrets=additional_secrets,
+    )
+
+
+def get_jwt_keyring() -> JWTKeyring:
+    """Return the keyring for the current settings, building it once per key set."""
+    settings = get_settings()
+    return _build_keyring(
+        settings.auth_jwt_algorithm,
+        settings.auth_jwt_secret,
+        tuple(settings.auth_jwt_additional_secrets),
+        settings.auth_jwt_private_key_file,
+        tuple(settings.auth_jwt_additional_public_key_files),
+    )
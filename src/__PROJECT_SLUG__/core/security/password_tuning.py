@@ -0,0 +1,151 @@
+"""Measure password hashing cost on this machine and recommend a profile for a target latency.
+
+Usage:
+    python -m __PROJECT_SLUG__.core.security.password_tuning
+    python -m __PROJECT_SLUG__.core.security.password_tuning --target-ms 150 --scheme pbkdf2_sha256
+
+Run it where the service runs (same CPU model and container CPU quota): hashing cost is all CPU,
+so numbers from a laptop do not transfer. It times the configured profile, then searches for
+the highest cost whose hash time stays under ``--target-ms`` and prints the matching
+``APP_AUTH_PASSWORD_HASH_*`` settings. For argon2 the memory and parallelism come from the
+current settings (or ``--memory-kib`` / ``--parallelism``) and the time cost is searched; memory
+is halved only when even ``t=1`` is too slow.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import replace
+
+from __PROJECT_SLUG__.core.config import get_settings
+from __PROJECT_SLUG__.core.security.passwords import (
+    ARGON2_SCHEME,
+    PBKDF2_SCHEME,
+    PasswordHashProfile,
+    get_password_hash_profile,
+    hash_password,
+    verify_password,
+)
+
+_PASSWORD = "correct horse battery staple"
+_PBKDF2_STEP = 10_000
+_ARGON2_MAX_TIME_COST = 32
+
+
+def _median_ms(func: Callable[[], object], samples: int) -> float:
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def measure(profile: PasswordHashProfile, samples: int) -> tuple[float, float]:
+    """Median hash and verify time in milliseconds for ``profile``."""
+    password_hash = hash_password(_PASSWORD, profile)
+    hash_ms = _median_ms(lambda: hash_password(_PASSWORD, profile), samples)
+    verify_ms = _median_ms(lambda: verify_password(_PASSWORD, password_hash), samples)
+    return hash_ms, verify_ms
+
+
+def recommend_pbkdf2(
+    profile: PasswordHashProfile, *, target_ms: float, samples: int
+) -> PasswordHashProfile:
+    probe = replace(profile, scheme=PBKDF2_SCHEME, pbkdf2_iterations=100_000)
+    probe_ms, _ = measure(probe, samples)
+    iterations = int(target_ms / probe_ms * probe.pbkdf2_iterations) // _PBKDF2_STEP * _PBKDF2_STEP
+    return replace(probe, pbkdf2_iterations=max(_PBKDF2_STEP, iterations))
+
+
+def recommend_argon2(
+    profile: PasswordHashProfile, *, target_ms: float, samples: int, verbose: bool = True
+) -> PasswordHashProfile:
+    candidate = replace(profile, scheme=ARGON2_SCHEME, argon2_time_cost=1)
+    floor_kib = 8 * candidate.argon2_parallelism
+    while True:
+        hash_ms, _ = measure(candidate, samples)
+        if verbose:
+            print(f"  {candidate.describe():<40} hash {hash_ms:8.1f} ms")
+        if hash_ms <= target_ms or candidate.argon2_memory_kib <= floor_kib:
+            break
+        candidate = replace(
+            candidate, argon2_memory_kib=max(floor_kib, candidate.argon2_memory_kib // 2)
+        )
+
+    best = candidate
+    while best.argon2_time_cost < _ARGON2_MAX_TIME_COST:
+        candidate = replace(best, argon2_time_cost=best.argon2_time_cost + 1)
+        hash_ms, _ = measure(candidate, samples)
+        if verbose:
+            print(f"  {candidate.describe():<40} hash {hash_ms:8.1f} ms")
+        if hash_ms > target_ms:
+            break
+        best = candidate
+    return best
+
+
+def _settings_lines(profile: PasswordHashProfile) -> list[str]:
+    lines = [f"APP_AUTH_PASSWORD_HASH_SCHEME={profile.effective_scheme}"]
+    if profile.effective_scheme == ARGON2_SCHEME:
+        lines += [
+            f"APP_AUTH_PASSWORD_HASH_ARGON2_TIME_COST={profile.argon2_time_cost}",
+            f"APP_AUTH_PASSWORD_HASH_ARGON2_MEMORY_KIB={profile.argon2_memory_kib}",
+            f"APP_AUTH_PASSWORD_HASH_ARGON2_PARALLELISM={profile.argon2_parallelism}",
+        ]
+    else:
+        lines.append(f"APP_AUTH_PASSWORD_HASH_PBKDF2_ITERATIONS={profile.pbkdf2_iterations}")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--scheme", choices=[ARGON2_SCHEME, PBKDF2_SCHEME])
+    parser.add_argument("--memory-kib", type=int)
+    parser.add_argument("--parallelism", type=int)
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    current = get_password_hash_profile()
+    hash_ms, verify_ms = measure(current, args.samples)
+    print(
+        f"configured: {current.describe():<40} hash {hash_ms:8.1f} ms  verify {verify_ms:8.1f} ms"
+    )
+
+    base = replace(
+        current,
+        scheme=args.scheme or current.effective_scheme,
+        argon2_memory_kib=args.memory_kib or current.argon2_memory_kib,
+        argon2_parallelism=args.parallelism or current.argon2_parallelism,
+    )
+    print(f"searching for hash time <= {args.target_ms:.0f} ms")
+    if base.effective_scheme == ARGON2_SCHEME:
+        recommended = recommend_argon2(base, target_ms=args.target_ms, samples=args.samples)
+    else:
+        recommended = recommend_pbkdf2(base, target_ms=args.target_ms, samples=args.samples)
+
+    hash_ms, verify_ms = measure(recommended, args.samples)
+    workers = settings.auth_password_hash_workers
+    print(
+        f"recommended: {recommended.describe():<39} hash {hash_ms:8.1f} ms  "
+        f"verify {verify_ms:8.1f} ms"
+    )
+    print(
+        f"capacity: ~{workers * 1000 / verify_ms:.0f} logins/s per app worker with "
+        f"APP_AUTH_PASSWORD_HASH_WORKERS={workers} (one core per hashing worker)"
+    )
+    print()
+    print("\n".join(_settings_lines(recommended)))
+    if recommended != current:
+        print(
+            "# existing hashes are upgraded on next login while APP_AUTH_PASSWORD_REHASH_ON_LOGIN=true"
+        )
+
+
+if __name__ == "__main__":
+    main()
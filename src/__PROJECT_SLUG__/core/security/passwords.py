@@ -0,0 +1,181 @@
+"""Password hashing with configurable cost profiles.
+
+A ``PasswordHashProfile`` holds the scheme and cost parameters new hashes are created with.
+Stored hashes keep the parameters they were created with, so ``verify_and_update`` also reports
+when a hash no longer matches the profile and returns a replacement computed from the password
+the user just proved. That lets cost go up (or down) on the next login, without password resets.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerifyMismatchError
+
+    _ARGON2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on installed runtime deps
+    PasswordHasher = None  # type: ignore[assignment,misc]
+    InvalidHashError = ValueError  # type: ignore[assignment,misc]
+    VerifyMismatchError = ValueError  # type: ignore[assignment,misc]
+    _ARGON2_AVAILABLE = False
+
+from __PROJECT_SLUG__.core.config import get_settings
+
+PBKDF2_SCHEME = "pbkdf2_sha256"
+ARGON2_SCHEME = "argon2"
+
+
+@dataclass(frozen=True, slots=True)
+class PasswordHashProfile:
+    scheme: str = ARGON2_SCHEME
+    argon2_time_cost: int = 3
+    argon2_memory_kib: int = 65536
+    argon2_parallelism: int = 4
+    pbkdf2_iterations: int = 390_000
+
+    @property
+    def effective_scheme(self) -> str:
+        # Without argon2-cffi installed, new hashes fall back to PBKDF2.
+        return self.scheme if self.scheme != ARGON2_SCHEME or _ARGON2_AVAILABLE else PBKDF2_SCHEME
+
+    def describe(self) -> str:
+        if self.effective_scheme == ARGON2_SCHEME:
+            return (
+                f"argon2id t={self.argon2_time_cost} m={self.argon2_memory_kib}KiB "
+                f"p={self.argon2_parallelism}"
+            )
+        return f"pbkdf2_sha256 iterations={self.pbkdf2_iterations}"
+
+
+_DEFAULT_PROFILE = PasswordHashProfile()
+
+
+def get_password_hash_profile() -> PasswordHashProfile:
+    settings = get_settings()
+    return PasswordHashProfile(
+        scheme=settings.auth_password_hash_scheme,
+        argon2_time_cost=settings.auth_password_hash_argon2_time_cost,
+        argon2_memory_kib=settings.auth_password_hash_argon2_memory_kib,
+        argon2_parallelism=settings.auth_password_hash_argon2_parallelism,
+        pbkdf2_iterations=settings.auth_password_hash_pbkdf2_iterations,
+    )
+
+
+@lru_cache(maxsize=8)
+def _argon2_hasher(time_cost: int, memory_kib: int, parallelism: int) -> PasswordHasher:
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_kib, parallelism=parallelism)
+
+
+def _argon2_for(profile: PasswordHashProfile) -> PasswordHasher:
+    return _argon2_hasher(
+        profile.argon2_time_cost, profile.argon2_memory_kib, profile.argon2_parallelism
+    )
+
+
+def _b64encode(value: bytes) -> str:
+    return base64.urlsafe_b64encode(value).decode("utf-8").rstrip("=")
+
+
+def _b64decode(value: str) -> bytes:
+    padded = value + "=" * (-len(value) % 4)
+    return base64.urlsafe_b64decode(padded.encode("utf-8"))
+
+
+def _hash_password_pbkdf2(password: str, iterations: int) -> str:
+    salt = os.urandom(16)
+    derived = hashlib.pbkdf2_hmac(
+        "sha256",
+        password.encode("utf-8"),
+        salt,
+        iterations,
+    )
+    return f"{PBKDF2_SCHEME}${iterations}${_b64encode(salt)}${_b64encode(derived)}"
+
+
+def _pbkdf2_iterations(password_hash: str) -> int | None:
+    parts = password_hash.split("$")
+    if len(parts) != 4 or parts[0] != PBKDF2_SCHEME:
+        return None
+    try:
+        return int(parts[1])
+    except ValueError:
+        return None
+
+
+def _verify_password_pbkdf2(password: str, password_hash: str) -> bool:
+    parts = password_hash.split("$")
+    if len(parts) != 4 or parts[0] != PBKDF2_SCHEME:
+        return False
+
+    try:
+        iterations = int(parts[1])
+        salt = _b64decode(parts[2])
+        expected = _b64decode(parts[3])
+    except (TypeError, ValueError):
+        return False
+
+    derived = hashlib.pbkdf2_hmac(
+        "sha256",
+        password.encode("utf-8"),
+        salt,
+        iterations,
+    )
+    return hmac.compare_digest(derived, expected)
+
+
+def hash_password(password: str, profile: PasswordHashProfile | None = None) -> str:
+    profile = profile or get_password_hash_profile()
+    if profile.effective_scheme == ARGON2_SCHEME:
+        return _argon2_for(profile).hash(password)
+    return _hash_password_pbkdf2(password, profile.pbkdf2_iterations)
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    if password_hash.startswith(f"{PBKDF2_SCHEME}$"):
+        return _verify_password_pbkdf2(password, password_hash)
+    if not _ARGON2_AVAILABLE:
+        return False
+
+    try:
+        # Parameters are read from the hash itself, so any profile's hasher verifies any hash.
+        return _argon2_for(_DEFAULT_PROFILE).verify(password_hash, password)
+    except (VerifyMismatchError, InvalidHashError):
+        return False
+
+
+def needs_rehash(password_hash: str, profile: PasswordHashProfile | None = None) -> bool:
+    """Whether ``password_hash`` was created with a different scheme or cost than ``profile``."""
+    profile = profile or get_password_hash_profile()
+    iterations = _pbkdf2_iterations(password_hash)
+    if profile.effective_scheme == PBKDF2_SCHEME:
+        return iterations != profile.pbkdf2_iterations
+    if iterations is not None:
+        return True
+    try:
+        return _argon2_for(profile).check_needs_rehash(password_hash)
+    except InvalidHashError:
+        return True
+
+
+def verify_and_update(
+    password: str, password_hash: str, profile: PasswordHashProfile | None = None
+) -> tuple[bool, str | None]:
+    """Verify ``password`` and, if the stored hash is off-profile, return a replacement hash.
+
+    Returns ``(verified, new_hash)``; ``new_hash`` is ``None`` when the password is wrong or the
+    stored hash already matches ``profile``. Runs hash and verify in one call so the executor
+    admits a login once.
+    """
+    profile = profile or get_password_hash_profile()
+    if not verify_password(password, password_hash):
+        return False, None
+    if not needs_rehash(password_hash, profile):
+        return True, None
+    return True, hash_password(password, profile)
@@ -0,0 +1,60 @@
+"""In-process list of revoked access tokens, keyed by ``jti``.
+
+Revocations are stored in the database and copied into every worker, so checking a request's
+token is one dict lookup instead of a query. Workers pull new revocations incrementally: each
+sync reads only rows revoked since the last watermark (minus a small overlap for transactions
+that committed late). A revocation only matters until the token's own ``exp``; after that
+PyJWT rejects the token anyway, so entries are dropped then.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+# Rows are re-read this far behind the watermark: a revocation whose transaction commits after
+# a sync already passed its ``revoked_at`` is still picked up by the next one.
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class AccessTokenRevocationList:
+    def __init__(self) -> None:
+        self._expires_at: dict[str, float] = {}
+        self.watermark: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def clear(self) -> None:
+        self._expires_at.clear()
+        self.watermark = None
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._expires_at
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        self._expires_at[jti] = expires_at.timestamp()
+
+    def apply(self, revocations: Iterable[tuple[str, datetime, datetime]]) -> None:
+        """Merge ``(jti, expires_at, revoked_at)`` rows and advance the watermark."""
+        watermark = self.watermark
+        for jti, expires_at, revoked_at in revocations:
+            self._expires_at[jti] = expires_at.timestamp()
+            if watermark is None or revoked_at > watermark:
+                watermark = revoked_at
+        self.watermark = watermark
+
+    def sync_from(self) -> datetime | None:
+        """Lower bound of ``revoked_at`` for the next incremental read (``None``: read all)."""
+        return None if self.watermark is None else self.watermark - SYNC_OVERLAP
+
+    def prune(self, now: float | None = None) -> int:
+        now = now if now is not None else time.time()
+        expired = [jti for jti, expires_at in self._expires_at.items() if expires_at <= now]
+        for jti in expired:
+            del self._expires_at[jti]
+        return len(expired)
+
+
+access_token_revocations = AccessTokenRevocationList()
@@ -0,0 +1,49 @@
+"""OAuth2 scopes compiled to bit flags.
+
+Every scope gets one bit the first time it is registered: the scopes declared on the OAuth2
+scheme at import time, and each scope a route requires when ``require_scopes`` declares it. A
+route's requirement is therefore a precomputed mask, and checking a token is one ``AND`` against
+the mask of the token's scopes. Scopes a token carries that no route requires get no bit; they
+cannot satisfy any requirement, so they do not need one.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+
+class ScopeRegistry:
+    def __init__(self, scopes: Iterable[str] = ()) -> None:
+        self._bits: dict[str, int] = {}
+        for scope in scopes:
+            self.register(scope)
+
+    def __contains__(self, scope: object) -> bool:
+        return scope in self._bits
+
+    def register(self, scope: str) -> int:
+        bit = self._bits.get(scope)
+        if bit is None:
+            bit = self._bits[scope] = 1 << len(self._bits)
+        return bit
+
+    def compile(self, scopes: Iterable[str]) -> int:
+        """Mask for ``scopes``, registering any that are new (for route requirements)."""
+        mask = 0
+        for scope in scopes:
+            mask |= self.register(scope)
+        return mask
+
+    def mask(self, scopes: Iterable[object]) -> int | None:
+        """Mask of the registered ``scopes`` from a token; ``None`` if any scope is not a string."""
+        bits = self._bits
+        mask = 0
+        for scope in scopes:
+            if not isinstance(scope, str):
+                return None
+            mask |= bits.get(scope, 0)
+        return mask
+
+    def names(self, mask: int, *, order: Iterable[str]) -> list[str]:
+        """The scopes from ``order`` whose bits are set in ``mask``."""
+        return [scope for scope in order if self._bits.get(scope, 0) & mask]
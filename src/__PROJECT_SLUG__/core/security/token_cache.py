@@ -0,0 +1,72 @@
+"""Bounded LRU of verified access tokens.
+
+Clients resend the same bearer token on every request, so a hit here returns the claims of a
+token whose signature, audience and issuer were already checked, without parsing the JWT
+again. Entries are keyed by a digest of the token, so raw tokens are never held as keys. An
+entry stops matching at the token's ``exp``, and the whole cache is dropped when the verification
+inputs (secrets, algorithm, audience, issuer) change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+class VerifiedTokenCache:
+    def __init__(self, *, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._verifier: Hashable | None = None
+
+    def configure(self, *, max_entries: int) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.clear()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, token: str, *, verifier: Hashable, now: float | None = None
+    ) -> dict[str, Any] | None:
+        if verifier != self._verifier:
+            self._entries.clear()
+            self._verifier = verifier
+            return None
+
+        key = _token_key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, claims = entry
+        # PyJWT rejects a token once ``exp <= now``; a cached entry must stop matching then too.
+        if (now if now is not None else time.time()) >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return dict(claims)
+
+    def put(self, token: str, claims: dict[str, Any], *, verifier: Hashable) -> None:
+        expires_at = claims.get("exp")
+        if verifier != self._verifier or not isinstance(expires_at, int | float):
+            return
+        key = _token_key(token)
+        self._entries[key] = (float(expires_at), dict(claims))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+verified_token_cache = VerifiedTokenCache()
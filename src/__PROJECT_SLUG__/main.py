@@ -1,32 +1,56 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
+from starlette.routing import Route
 
-from __PROJECT_SLUG__.api.v1.features.auth.service import seed_admin_user_if_enabled
+from __PROJECT_SLUG__.api.v1.features.auth.provisioning import (
+    USER_IMPORT_PATH,
+    resolve_hash_workers,
+)
+from __PROJECT_SLUG__.api.v1.features.auth.service import (
+    run_access_token_revocation_sync,
+    run_refresh_token_purge,
+    seed_admin_user_if_enabled,
+)
+from __PROJECT_SLUG__.api.v1.features.items.cache import item_cache
 from __PROJECT_SLUG__.api.v1.router import v1_router
-from __PROJECT_SLUG__.core.config import get_settings
+from __PROJECT_SLUG__.core.config import REDIS_RATE_LIMIT_BACKENDS, get_settings
 from __PROJECT_SLUG__.core.db import db_manager
 from __PROJECT_SLUG__.core.errors import register_exception_handlers
 from __PROJECT_SLUG__.core.logging import configure_logging
 from __PROJECT_SLUG__.core.metrics import MetricsMiddleware, metrics_endpoint
 from __PROJECT_SLUG__.core.middleware.body_size import RequestBodyLimitMiddleware
 from __PROJECT_SLUG__.core.middleware.rate_limit import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
     RateLimiter,
     RateLimitMiddleware,
+    RateLimitPolicy,
+    RateLimitPolicyTable,
+    RedisClient,
     build_rate_limiter,
+    build_redis_client,
+    close_redis_client,
+    rate_limit_key_builder,
 )
 from __PROJECT_SLUG__.core.middleware.request_id import RequestIDMiddleware
 from __PROJECT_SLUG__.core.middleware.security_headers import SecurityHeadersMiddleware
 from __PROJECT_SLUG__.core.middleware.tenant import TenantMiddleware
 from __PROJECT_SLUG__.core.middleware.timeout import RequestTimeoutMiddleware
+from __PROJECT_SLUG__.core.pagination import cursor_codec
 from __PROJECT_SLUG__.core.readiness import (
     STARTUP_COMPLETE_STATE_KEY,
     configure_readiness,
     register_readiness_check,
 )
+from __PROJECT_SLUG__.core.security.hashing import password_hashing, user_import_hashing
+from __PROJECT_SLUG__.core.security.jwks import JWKS_PATH, jwks_endpoint
+from __PROJECT_SLUG__.core.security.keyring import get_jwt_keyring
+from __PROJECT_SLUG__.core.security.token_cache import verified_token_cache
 from __PROJECT_SLUG__.health.router import health_router
 
 
@@ -34,6 +58,27 @@ def create_app() -> FastAPI:
     settings = get_settings()
     configure_logging(debug=settings.debug, level=settings.log_level)
     db_manager.configure(settings)
+    password_hashing.configure(
+        kind=settings.auth_password_hash_executor,
+        max_workers=settings.auth_password_hash_workers,
+        max_queue=settings.auth_password_hash_max_queue,
+    )
+    user_import_hashing.configure(
+        kind="process",
+        max_workers=resolve_hash_workers(settings.auth_user_import_hash_workers),
+        max_queue=settings.auth_user_import_batch_size,
+    )
+    verified_token_cache.configure(max_entries=settings.auth_token_cache_max_entries)
+    cursor_codec.configure(settings.pagination_cursor_secret or settings.auth_jwt_secret)
+    item_cache.configure(
+        enabled=settings.items_cache_enabled,
+        max_entries=settings.items_cache_max_entries,
+        ttl_seconds=settings.items_cache_ttl_seconds,
+        redis_url=settings.items_cache_redis_url,
+        redis_prefix=settings.items_cache_redis_prefix,
+    )
+    # Parse keys and derive key IDs at startup, not on the first request.
+    jwt_keyring = get_jwt_keyring()
     rate_limit_exempt_paths = set(settings.rate_limit_exempt_paths)
     request_timeout_exempt_paths = set(settings.request_timeout_exempt_paths)
     request_body_limit_exempt_paths = set(settings.request_body_limit_exempt_paths)
@@ -41,17 +86,78 @@ def create_app() -> FastAPI:
         rate_limit_exempt_paths.add(settings.metrics_path)
         request_timeout_exempt_paths.add(settings.metrics_path)
         request_body_limit_exempt_paths.add(settings.metrics_path)
+    if jwt_keyring.jwks is not None:
+        rate_limit_exempt_paths.add(JWKS_PATH)
 
-    limiter: RateLimiter | None = None
-    if settings.rate_limit_enabled:
-        limiter = build_rate_limiter(
+    # The default limiter and every per-route policy share one Redis connection pool and
+    # one circuit breaker: they call the same backend, so they fail and recover together.
+    rate_limit_redis: RedisClient | None = None
+    rate_limit_breaker: CircuitBreaker | None = None
+    if settings.rate_limit_enabled and settings.rate_limit_backend in REDIS_RATE_LIMIT_BACKENDS:
+        rate_limit_redis = build_redis_client(settings.rate_limit_redis_url)
+        if settings.rate_limit_breaker_enabled:
+            rate_limit_breaker = CircuitBreaker(
+                CircuitBreakerPolicy(
+                    call_timeout_seconds=settings.rate_limit_breaker_timeout_ms / 1000,
+                    failure_ratio=settings.rate_limit_breaker_failure_ratio,
+                    min_calls=settings.rate_limit_breaker_min_calls,
+                    reset_seconds=settings.rate_limit_breaker_reset_seconds,
+                    degrade_to_memory=settings.rate_limit_breaker_fallback == "memory",
+                ),
+                name=settings.rate_limit_backend,
+            )
+
+    def build_limiter(
+        *, max_requests: int, window_seconds: int, shm_suffix: str = ""
+    ) -> RateLimiter:
+        return build_rate_limiter(
             backend=settings.rate_limit_backend,
-            max_requests=settings.rate_limit_requests,
-            window_seconds=settings.rate_limit_window_seconds,
+            max_requests=max_requests,
+            window_seconds=window_seconds,
             memory_max_keys=settings.rate_limit_memory_max_keys,
+            burst=settings.rate_limit_burst,
+            redis_lease_size=settings.rate_limit_redis_lease_size,
+            shm_path=settings.rate_limit_shm_path,
+            shm_stripes=settings.rate_limit_shm_stripes,
+            shm_suffix=shm_suffix,
             redis_url=settings.rate_limit_redis_url,
             redis_prefix=settings.rate_limit_redis_prefix,
+            redis_client=rate_limit_redis,
+            circuit_breaker=rate_limit_breaker,
+        )
+
+    limiter: RateLimiter | None = None
+    rate_limit_policies: RateLimitPolicyTable | None = None
+    if settings.rate_limit_enabled:
+        limiter = build_limiter(
+            max_requests=settings.rate_limit_requests,
+            window_seconds=settings.rate_limit_window_seconds,
         )
+        if settings.rate_limit_policies:
+            policies = [
+                RateLimitPolicy(
+                    route=policy.route,
+                    max_requests=policy.requests,
+                    window_seconds=policy.window_seconds,
+                    method=policy.method,
+                    tenant=policy.tenant,
+                    key_by=tuple(policy.key_by),
+                )
+                for policy in settings.rate_limit_policies
+            ]
+            # The suffix names the policy rather than its index, so reordering
+            # APP_RATE_LIMIT_POLICIES keeps each policy on its own shm table.
+            rate_limit_policies = RateLimitPolicyTable(
+                (
+                    policy,
+                    build_limiter(
+                        max_requests=policy.max_requests,
+                        window_seconds=policy.window_seconds,
+                        shm_suffix=f"policy-{policy.fingerprint}",
+                    ),
+                )
+                for policy in policies
+            )
 
     async def database_readiness_check(_app: FastAPI) -> None:
         await db_manager.ping()
@@ -59,6 +165,8 @@ def create_app() -> FastAPI:
     async def rate_limit_backend_readiness_check(_app: FastAPI) -> None:
         if limiter is not None:
             await limiter.ping()
+        if rate_limit_policies is not None:
+            await rate_limit_policies.ping()
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
@@ -75,6 +183,29 @@ def create_app() -> FastAPI:
                 password=settings.auth_admin_password,
                 scopes=settings.auth_admin_scopes,
             )
+        background_tasks: list[asyncio.Task[None]] = []
+        if settings.auth_use_database and settings.auth_access_token_revocation_enabled:
+            background_tasks.append(
+                asyncio.create_task(
+                    run_access_token_revocation_sync(
+                        session_factory=db_manager.session_factory,
+                        interval_seconds=settings.auth_access_token_revocation_sync_seconds,
+                    ),
+                    name="access-token-revocation-sync",
+                )
+            )
+        if settings.auth_use_database and settings.auth_refresh_token_purge_enabled:
+            background_tasks.append(
+                asyncio.create_task(
+                    run_refresh_token_purge(
+                        session_factory=db_manager.session_factory,
+                        interval_seconds=settings.auth_refresh_token_purge_interval_seconds,
+                        batch_size=settings.auth_refresh_token_purge_batch_size,
+                        batch_pause_seconds=settings.auth_refresh_token_purge_batch_pause_ms / 1000,
+                    ),
+                    name="refresh-token-purge",
+                )
+            )
         if settings.otel_enabled:
             from __PROJECT_SLUG__.core.otel import setup_otel
 
@@ -84,9 +215,20 @@ def create_app() -> FastAPI:
             yield
         finally:
             setattr(app.state, STARTUP_COMPLETE_STATE_KEY, False)
+            for task in background_tasks:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
             if limiter is not None:
                 await limiter.close()
+            if rate_limit_policies is not None:
+                await rate_limit_policies.close()
+            if rate_limit_redis is not None:
+                await close_redis_client(rate_limit_redis)
+            await item_cache.close()
             await db_manager.dispose()
+            password_hashing.shutdown()
+            user_import_hashing.shutdown()
 
     app = FastAPI(
         title=settings.app_name,
@@ -108,9 +250,17 @@ def create_app() -> FastAPI:
             include_in_schema=False,
         )
 
+    if jwt_keyring.jwks is not None:
+        app.add_api_route(
+            JWKS_PATH,
+            jwks_endpoint,
+            methods=["GET"],
+            include_in_schema=False,
+        )
+
     configure_readiness(app)
     register_readiness_check(app, "database", database_readiness_check)
-    if settings.rate_limit_enabled and settings.rate_limit_backend == "redis":
+    if settings.rate_limit_enabled and settings.rate_limit_backend in REDIS_RATE_LIMIT_BACKENDS:
         register_readiness_check(app, "rate_limit_backend", rate_limit_backend_readiness_check)
 
     if settings.cors_origins:
@@ -143,6 +293,8 @@ def create_app() -> FastAPI:
             exempt_paths=rate_limit_exempt_paths,
             fail_open=settings.rate_limit_fail_open,
             trust_x_forwarded_for=settings.trust_x_forwarded_for,
+            policies=rate_limit_policies,
+            key_builder=rate_limit_key_builder(settings.rate_limit_backend),
         )
 
     if settings.request_timeout_enabled:
@@ -157,6 +309,7 @@ def create_app() -> FastAPI:
             RequestBodyLimitMiddleware,
             max_body_bytes=settings.request_body_max_bytes,
             exempt_paths=request_body_limit_exempt_paths,
+            path_limits={USER_IMPORT_PATH: settings.auth_user_import_max_body_bytes},
         )
 
     if settings.security_headers_enabled:
@@ -182,6 +335,15 @@ def create_app() -> FastAPI:
     app.include_router(health_router)  # /health  /ready  (root, no versioning)
     app.include_router(v1_router, prefix="/api/v1")  # /api/v1/...
 
+    if rate_limit_policies is not None:
+        # Policies key on route templates; fail startup on typos instead of silently not matching.
+        # The table needs every template in router order, so a static route never picks up the
+        # policy of a parameterised sibling. Newer FastAPI releases include routers lazily, so
+        # nested templates are only listed (in route order) in the OpenAPI schema.
+        route_templates = [route.path for route in app.routes if isinstance(route, Route)]
+        route_templates += app.openapi()["paths"]
+        rate_limit_policies.bind_routes(route_templates)
+
     return app
 
 
@@ -8,6 +8,7 @@ from __PROJECT_SLUG__.api.v1.features.auth import service as auth_service
 from __PROJECT_SLUG__.api.v1.features.auth.models import User
 from __PROJECT_SLUG__.api.v1.features.auth.repository import AuthRepository
 from __PROJECT_SLUG__.core.db import db_manager
+from __PROJECT_SLUG__.core.security.passwords import PasswordHashProfile, needs_rehash
 
 
 async def test_create_and_authenticate_database_user() -> None:
@@ -123,3 +124,48 @@ async def test_ensure_admin_user_is_idempotent_under_concurrency() -> None:
         count = count_result.scalar_one()
 
     assert count == 1
+
+
+async def test_login_upgrades_off_profile_password_hash() -> None:
+    legacy_hash = auth_service.hash_password(
+        "super-secret", PasswordHashProfile(scheme="pbkdf2_sha256", pbkdf2_iterations=10_000)
+    )
+    async with db_manager.session_factory() as session:
+        repo = AuthRepository(session)
+        user = await repo.create_user(
+            username="legacy-hash",
+            password_hash=legacy_hash,
+            scopes_csv=auth_service.scopes_to_csv(["items:read"]),
+            is_active=True,
+        )
+
+    async with db_manager.session_factory() as session:
+        principal = await auth_service.authenticate_database_user(
+            username="legacy-hash",
+            password="super-secret",
+            session=session,
+        )
+
+    assert principal is not None
+    async with db_manager.session_factory() as session:
+        stored = await AuthRepository(session).get_user_by_id(user.id)
+    assert stored is not None
+    assert stored.password_hash != legacy_hash
+    assert not needs_rehash(stored.password_hash)
+
+
+async def test_update_password_hash_is_compare_and_set() -> None:
+    async with db_manager.session_factory() as session:
+        repo = AuthRepository(session)
+        user = await repo.create_user(
+            username="cas-user",
+            password_hash="current-hash",
+            scopes_csv="",
+            is_active=True,
+        )
+        assert not await repo.update_password_hash(
+            user.id, expected_hash="stale-hash", password_hash="new-hash"
+        )
+        assert await repo.update_password_hash(
+            user.id, expected_hash="current-hash", password_hash="new-hash"
+        )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from __PROJECT_SLUG__.api.v1.features.items.models import Item
 from __PROJECT_SLUG__.api.v1.features.items.repository import ItemRepository
@@ -43,3 +43,65 @@ async def test_create_item_service_uses_database_session_when_provided() -> None
 
     assert response.tenant_id == "tenant-x"
     assert float(persisted.price) == 9.99
+
+
+async def test_item_repository_list_page_seeks_past_the_cursor() -> None:
+    async with db_manager.session_factory() as session:
+        repo = ItemRepository(session)
+        for index in range(5):
+            await repo.create(ItemCreate(name=f"Item {index}", price=1.0), tenant_id="acme")
+        await repo.create(ItemCreate(name="Other", price=1.0), tenant_id="other")
+
+    async with db_manager.session_factory() as session:
+        repo = ItemRepository(session)
+        first = await repo.list_page("acme", after=None, limit=2)
+        rest = await repo.list_page("acme", after=(first[-1].created_at, first[-1].id), limit=10)
+
+    assert [item.name for item in first + list(rest)] == [f"Item {index}" for index in range(5)]
+
+
+async def test_item_repository_create_many_returns_rows_in_input_order() -> None:
+    payloads = [ItemCreate(name=f"Bulk {index}", price=index + 1.0) for index in range(1200)]
+    async with db_manager.session_factory() as session:
+        created = await ItemRepository(session).create_many(payloads, tenant_id="acme")
+
+    async with db_manager.session_factory() as session:
+        result = await session.execute(select(func.count(Item.id)).where(Item.tenant_id == "acme"))
+        persisted = result.scalar_one()
+
+    assert [item.name for item in created] == [payload.name for payload in payloads]
+    assert persisted == 1200
+
+
+async def test_item_repository_get_is_scoped_to_the_tenant() -> None:
+    async with db_manager.session_factory() as session:
+        created = await ItemRepository(session).create(
+            ItemCreate(name="Scoped", price=1.0), tenant_id="acme"
+        )
+
+    async with db_manager.session_factory() as session:
+        repo = ItemRepository(session)
+        found = await repo.get("acme", created.id)
+        other = await repo.get("other", created.id)
+
+    assert found is not None and found.name == "Scoped"
+    assert other is None
+
+
+async def test_item_repository_create_paths_return_the_rounded_stored_price() -> None:
+    payloads = [ItemCreate(name="Rounded", price=9.999), ItemCreate(name="Half", price=1.005)]
+    async with db_manager.session_factory() as session:
+        repo = ItemRepository(session)
+        single = await repo.create(payloads[0], tenant_id="acme")
+        batch = await repo.create_many(payloads, tenant_id="acme")
+
+    async with db_manager.session_factory() as session:
+        for item in [single, *batch]:
+            stored = await session.scalar(select(Item.price).where(Item.id == item.id))
+            assert item.price == stored
+
+    assert [single.price, *(item.price for item in batch)] == [
+        Decimal("10.00"),
+        Decimal("10.00"),
+        Decimal("1.01"),
+    ]
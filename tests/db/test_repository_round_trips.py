@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from __PROJECT_SLUG__.api.v1.features.auth.repository import AuthRepository
+from __PROJECT_SLUG__.api.v1.features.items.repository import ItemRepository
+from __PROJECT_SLUG__.api.v1.features.items.schemas import ItemCreate
+from __PROJECT_SLUG__.core.db import db_manager
+
+
+@contextmanager
+def _count_statements(session: AsyncSession) -> Iterator[list[str]]:
+    engine = session.get_bind()
+    statements: list[str] = []
+
+    def capture(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+        statements.append(statement.split(None, 1)[0].upper())
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+async def test_create_item_is_a_single_insert() -> None:
+    async with db_manager.session_factory() as session:
+        with _count_statements(session) as statements:
+            item = await ItemRepository(session).create(
+                ItemCreate(name="Counted", price=1.5), tenant_id="acme"
+            )
+            # Reading the attributes after commit must not reload the row.
+            assert (item.name, item.tenant_id) == ("Counted", "acme")
+            assert item.id is not None and item.created_at is not None
+
+    assert statements == ["INSERT"]
+
+
+async def test_create_user_and_refresh_token_are_single_inserts() -> None:
+    async with db_manager.session_factory() as session:
+        repo = AuthRepository(session)
+        with _count_statements(session) as statements:
+            user = await repo.create_user(
+                username="counted", password_hash="x", scopes_csv="", is_active=True
+            )
+            token = await repo.create_refresh_token(
+                user_id=user.id,
+                token_hash="counted-token",
+                expires_at=datetime.now(UTC) + timedelta(hours=1),
+            )
+            assert user.username == "counted" and user.created_at is not None
+            assert token.user_id == user.id and token.revoked_at is None
+
+    assert statements == ["INSERT", "INSERT"]
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
 import httpx
+import jwt
 import pytest
 import pytest_asyncio
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
 
+from __PROJECT_SLUG__.api.v1.features.auth import provisioning
 from __PROJECT_SLUG__.core.config import get_settings
 from __PROJECT_SLUG__.core.db import get_db_session
 from __PROJECT_SLUG__.core.readiness import register_readiness_check
+from __PROJECT_SLUG__.core.security.auth import create_access_token
+from __PROJECT_SLUG__.core.security.hashing import PasswordHashingBusyError
+from __PROJECT_SLUG__.core.security.revocation import access_token_revocations
 from __PROJECT_SLUG__.main import create_app
 
 
@@ -67,6 +79,39 @@ async def auth_dbmode_client(monkeypatch: pytest.MonkeyPatch) -> httpx.AsyncClie
     get_settings.cache_clear()
 
 
+@pytest_asyncio.fixture
+async def es256_auth_client(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> httpx.AsyncClient:
+    private_key_file = tmp_path / "jwt-signing.pem"
+    private_key_file.write_bytes(
+        ec.generate_private_key(ec.SECP256R1()).private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    monkeypatch.setenv("APP_AUTH_ENABLED", "true")
+    monkeypatch.setenv("APP_AUTH_JWT_ALGORITHM", "ES256")
+    monkeypatch.setenv("APP_AUTH_JWT_PRIVATE_KEY_FILE", str(private_key_file))
+    monkeypatch.setenv("APP_AUTH_ADMIN_PASSWORD", "super-secret-password")
+    get_settings.cache_clear()
+
+    app = create_app()
+
+    async def _no_db_session():
+        yield None
+
+    app.dependency_overrides[get_db_session] = _no_db_session
+
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://testserver") as client,
+    ):
+        yield client
+
+    get_settings.cache_clear()
+
+
 async def test_issue_token_with_form_payload(auth_client: httpx.AsyncClient) -> None:
     response = await auth_client.post(
         "/api/v1/auth/token",
@@ -142,3 +187,252 @@ async def test_revoke_endpoint_is_idempotent(
     )
 
     assert response.status_code == 204
+
+
+async def test_revoke_with_bearer_token_revokes_the_access_token(
+    auth_dbmode_client: httpx.AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _not_found(*, session: object, refresh_token: str) -> bool:
+        return False
+
+    async def _revoke_in_memory(*, session: object, jti: str, expires_at: datetime) -> None:
+        access_token_revocations.add(jti, expires_at)
+
+    monkeypatch.setattr(
+        "__PROJECT_SLUG__.api.v1.features.auth.router.service.revoke_refresh_token", _not_found
+    )
+    monkeypatch.setattr(
+        "__PROJECT_SLUG__.api.v1.features.auth.router.service.revoke_access_token",
+        _revoke_in_memory,
+    )
+    access_token, _ = create_access_token(username="admin", scopes=["items:write"])
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    try:
+        response = await auth_dbmode_client.post(
+            "/api/v1/auth/revoke", json={"refresh_token": "nope"}, headers=headers
+        )
+        items_response = await auth_dbmode_client.post(
+            "/api/v1/items", json={"name": "Widget", "price": 9.99}, headers=headers
+        )
+    finally:
+        access_token_revocations.clear()
+
+    assert response.status_code == 204
+    assert items_response.status_code == 401
+    assert items_response.json()["error"]["message"] == "Authentication token has been revoked."
+
+
+async def test_issue_token_returns_503_when_password_hashing_is_saturated(
+    auth_dbmode_client: httpx.AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _busy(**_: object) -> None:
+        raise PasswordHashingBusyError("password hashing queue is full")
+
+    monkeypatch.setattr(
+        "__PROJECT_SLUG__.api.v1.features.auth.router.service.authenticate_database_user",
+        _busy,
+    )
+
+    response = await auth_dbmode_client.post(
+        "/api/v1/auth/token",
+        data={"username": "admin", "password": "secret", "grant_type": "password"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["error"]["code"] == "HTTP_503"
+
+
+async def test_jwks_lets_clients_verify_es256_tokens_locally(
+    es256_auth_client: httpx.AsyncClient,
+) -> None:
+    token_response = await es256_auth_client.post(
+        "/api/v1/auth/token",
+        data={"username": "admin", "password": "super-secret-password", "grant_type": "password"},
+    )
+    assert token_response.status_code == 200
+    access_token = token_response.json()["access_token"]
+
+    jwks_response = await es256_auth_client.get("/.well-known/jwks.json")
+    assert jwks_response.status_code == 200
+    assert jwks_response.headers["content-type"] == "application/jwk-set+json"
+    assert jwks_response.headers["cache-control"] == "public, max-age=300"
+
+    jwk_set = jwt.PyJWKSet.from_dict(jwks_response.json())
+    signing_key = jwk_set[jwt.get_unverified_header(access_token)["kid"]]
+    claims = jwt.decode(
+        access_token,
+        signing_key.key,
+        algorithms=["ES256"],
+        audience=get_settings().auth_audience,
+    )
+    assert claims["username"] == "admin"
+
+    items_response = await es256_auth_client.post(
+        "/api/v1/items",
+        json={"name": "Item", "price": 1.0},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert items_response.status_code == 201
+
+
+async def test_jwks_revalidation_returns_304(es256_auth_client: httpx.AsyncClient) -> None:
+    first = await es256_auth_client.get("/.well-known/jwks.json")
+    etag = first.headers["etag"]
+
+    revalidated = await es256_auth_client.get(
+        "/.well-known/jwks.json", headers={"If-None-Match": f"W/{etag}"}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+
+async def test_jwks_is_not_served_for_hmac_tokens(auth_client: httpx.AsyncClient) -> None:
+    response = await auth_client.get("/.well-known/jwks.json")
+    assert response.status_code == 404
+
+
+@pytest_asyncio.fixture
+async def user_import_client(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> httpx.AsyncClient:
+    monkeypatch.setenv("APP_DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    monkeypatch.setenv("APP_DATABASE_AUTO_CREATE_SCHEMA", "true")
+    monkeypatch.setenv("APP_AUTH_ENABLED", "true")
+    monkeypatch.setenv("APP_AUTH_USE_DATABASE", "true")
+    monkeypatch.setenv("APP_AUTH_JWT_SECRET", "x" * 40)
+    monkeypatch.setenv("APP_AUTH_PASSWORD_HASH_SCHEME", "pbkdf2_sha256")
+    monkeypatch.setenv("APP_AUTH_PASSWORD_HASH_PBKDF2_ITERATIONS", "10000")
+    monkeypatch.setenv("APP_AUTH_USER_IMPORT_HASH_WORKERS", "1")
+    get_settings.cache_clear()
+
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://testserver") as client,
+    ):
+        yield client
+
+    get_settings.cache_clear()
+
+
+async def test_user_import_returns_summary_and_created_users_can_sign_in(
+    user_import_client: httpx.AsyncClient,
+) -> None:
+    admin_token, _ = create_access_token(username="admin", scopes=["users:write"])
+    body = "\n".join(
+        [
+            '{"username": "alice", "password": "alice-password", "scopes": ["items:read"]}',
+            '{"username": "alice", "password": "other"}',
+            "not json",
+        ]
+    )
+
+    response = await user_import_client.post(
+        "/api/v1/auth/users/import",
+        content=body,
+        headers={
+            "Authorization": f"Bearer {admin_token}",
+            "Content-Type": "application/x-ndjson",
+        },
+    )
+
+    assert response.status_code == 200
+    summary = response.json()
+    assert {key: summary[key] for key in ("created", "exists", "duplicate", "invalid")} == {
+        "created": 1,
+        "exists": 0,
+        "duplicate": 1,
+        "invalid": 1,
+    }
+    assert [(error["line"], error["status"]) for error in summary["errors"]] == [
+        (2, "duplicate"),
+        (3, "invalid"),
+    ]
+    assert summary["errors_truncated"] is False
+
+    token_response = await user_import_client.post(
+        "/api/v1/auth/token",
+        data={"username": "alice", "password": "alice-password", "grant_type": "password"},
+    )
+    assert token_response.status_code == 200
+
+
+async def test_user_import_requires_users_write_scope(
+    user_import_client: httpx.AsyncClient,
+) -> None:
+    token, _ = create_access_token(username="admin", scopes=["items:write"])
+
+    response = await user_import_client.post(
+        "/api/v1/auth/users/import",
+        content=b'{"username": "mallory", "password": "pw"}',
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.fixture
+def slow_user_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Three one-record batches take longer than the timeout, and the body exceeds the global
+    # limit but not the import route's own.
+    monkeypatch.setenv("APP_REQUEST_TIMEOUT_SECONDS", "1")
+    monkeypatch.setenv("APP_REQUEST_BODY_MAX_BYTES", "64")
+    monkeypatch.setenv("APP_AUTH_USER_IMPORT_BATCH_SIZE", "1")
+    import_batch = provisioning._import_batch
+
+    async def slow_import_batch(*args: Any, **kwargs: Any) -> Any:
+        await asyncio.sleep(0.5)
+        return await import_batch(*args, **kwargs)
+
+    monkeypatch.setattr(provisioning, "_import_batch", slow_import_batch)
+
+
+async def test_user_import_outlives_request_timeout_and_has_its_own_body_limit(
+    slow_user_import: None, user_import_client: httpx.AsyncClient
+) -> None:
+    token, _ = create_access_token(username="admin", scopes=["users:write"])
+    body = "\n".join(
+        f'{{"username": "user{index}", "password": "user-password"}}' for index in range(3)
+    )
+
+    response = await user_import_client.post(
+        "/api/v1/auth/users/import",
+        content=body,
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["created"] == 3
+
+
+@pytest.fixture
+def user_import_limit(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    setting, value = request.param
+    monkeypatch.setenv(setting, value)
+
+
+@pytest.mark.parametrize(
+    ("user_import_limit", "body"),
+    [
+        (("APP_AUTH_USER_IMPORT_MAX_BODY_BYTES", "80"), "\n" * 40),
+        (("APP_AUTH_USER_IMPORT_MAX_LINE_BYTES", "64"), "x" * 65),
+        (("APP_AUTH_USER_IMPORT_MAX_RECORDS", "1"), '{"username": "bob", "password": "pw"}'),
+    ],
+    indirect=["user_import_limit"],
+)
+async def test_user_import_enforces_body_line_and_record_limits(
+    user_import_limit: None, user_import_client: httpx.AsyncClient, body: str
+) -> None:
+    token, _ = create_access_token(username="admin", scopes=["users:write"])
+
+    response = await user_import_client.post(
+        "/api/v1/auth/users/import",
+        content='{"username": "alice", "password": "alice-password"}\n' + body,
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 413
@@ -1,3 +1,5 @@
+import json
+
 import httpx
 
 
@@ -15,6 +17,14 @@ async def test_create_item_returns_201_with_payload(client: httpx.AsyncClient) -
     assert "created_at" in data
 
 
+async def test_create_item_rounds_price_to_cents(client: httpx.AsyncClient) -> None:
+    single = await client.post("/api/v1/items", json={"name": "Widget", "price": 9.999})
+    batch = await client.post("/api/v1/items:batch", json=[{"name": "Widget", "price": 9.999}])
+
+    assert single.json()["price"] == 10.0
+    assert batch.json()[0]["price"] == 10.0
+
+
 async def test_create_item_stamps_default_tenant(client: httpx.AsyncClient) -> None:
     response = await client.post("/api/v1/items", json={"name": "Item A", "price": 1.0})
 
@@ -53,3 +63,125 @@ async def test_create_item_rejects_missing_required_field(client: httpx.AsyncCli
     response = await client.post("/api/v1/items", json={"name": "No price"})
 
     assert response.status_code == 422
+
+
+async def test_list_items_pages_with_cursor(client: httpx.AsyncClient) -> None:
+    for index in range(3):
+        await client.post("/api/v1/items", json={"name": f"Item {index}", "price": 1.0})
+
+    first = await client.get("/api/v1/items", params={"limit": 2})
+    assert first.status_code == 200
+    body = first.json()
+    assert [item["name"] for item in body["items"]] == ["Item 0", "Item 1"]
+    assert body["next_cursor"]
+
+    second = await client.get("/api/v1/items", params={"limit": 2, "cursor": body["next_cursor"]})
+    assert second.status_code == 200
+    assert [item["name"] for item in second.json()["items"]] == ["Item 2"]
+    assert second.json()["next_cursor"] is None
+
+
+async def test_list_items_rejects_cursor_from_another_tenant(client: httpx.AsyncClient) -> None:
+    for index in range(2):
+        await client.post("/api/v1/items", json={"name": f"Item {index}", "price": 1.0})
+    cursor = (await client.get("/api/v1/items", params={"limit": 1})).json()["next_cursor"]
+
+    response = await client.get(
+        "/api/v1/items", params={"cursor": cursor}, headers={"X-Tenant-ID": "acme"}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "HTTP_400"
+
+
+async def test_list_items_rejects_forged_cursor_and_oversized_limit(
+    client: httpx.AsyncClient,
+) -> None:
+    forged = await client.get("/api/v1/items", params={"cursor": "eyJ9.AAAA"})
+    oversized = await client.get("/api/v1/items", params={"limit": 10_000})
+
+    assert forged.status_code == 400
+    assert oversized.status_code == 422
+
+
+async def test_create_items_batch_returns_all_items_in_order(client: httpx.AsyncClient) -> None:
+    payload = [{"name": f"Item {index}", "price": index + 1.0} for index in range(3)]
+
+    response = await client.post("/api/v1/items:batch", json=payload)
+
+    assert response.status_code == 201
+    body = response.json()
+    assert [item["name"] for item in body] == ["Item 0", "Item 1", "Item 2"]
+    assert len({item["id"] for item in body}) == 3
+    assert {item["tenant_id"] for item in body} == {"public"}
+
+
+async def test_create_items_batch_rejects_empty_and_invalid_batches(
+    client: httpx.AsyncClient,
+) -> None:
+    empty = await client.post("/api/v1/items:batch", json=[])
+    invalid = await client.post(
+        "/api/v1/items:batch", json=[{"name": "Ok", "price": 1.0}, {"name": "Bad", "price": -1}]
+    )
+
+    assert empty.status_code == 422
+    assert invalid.status_code == 422
+    assert (await client.get("/api/v1/items")).json()["items"] == []
+
+
+async def test_export_items_streams_ndjson_and_csv(client: httpx.AsyncClient) -> None:
+    for index in range(3):
+        await client.post("/api/v1/items", json={"name": f"Item {index}", "price": 1.0})
+    await client.post(
+        "/api/v1/items", json={"name": "Other", "price": 1.0}, headers={"X-Tenant-ID": "acme"}
+    )
+
+    ndjson = await client.get("/api/v1/items/export")
+    csv_export = await client.get("/api/v1/items/export", params={"format": "csv"})
+
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line)["name"] for line in ndjson.text.splitlines()] == [
+        "Item 0",
+        "Item 1",
+        "Item 2",
+    ]
+    assert csv_export.status_code == 200
+    assert csv_export.headers["content-type"] == "text/csv; charset=utf-8"
+    assert 'filename="items.csv"' in csv_export.headers["content-disposition"]
+    assert csv_export.text.splitlines()[0] == "id,name,description,price,tenant_id,created_at"
+    assert len(csv_export.text.splitlines()) == 4
+
+
+async def test_export_items_is_gzip_compressed_when_accepted(client: httpx.AsyncClient) -> None:
+    await client.post("/api/v1/items:batch", json=[{"name": "x" * 200, "price": 1.0}] * 20)
+
+    response = await client.get("/api/v1/items/export", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.text.splitlines()) == 20
+
+
+async def test_export_items_rejects_unknown_format(client: httpx.AsyncClient) -> None:
+    response = await client.get("/api/v1/items/export", params={"format": "xml"})
+
+    assert response.status_code == 422
+
+
+async def test_get_item_by_id_is_scoped_to_the_tenant(client: httpx.AsyncClient) -> None:
+    created = (await client.post("/api/v1/items", json={"name": "Widget", "price": 1.0})).json()
+
+    found = await client.get(f"/api/v1/items/{created['id']}")
+    other_tenant = await client.get(
+        f"/api/v1/items/{created['id']}", headers={"X-Tenant-ID": "acme"}
+    )
+    unknown = await client.get("/api/v1/items/00000000-0000-0000-0000-000000000000")
+    malformed = await client.get("/api/v1/items/not-a-uuid")
+
+    assert found.status_code == 200
+    assert found.json() == created
+    assert other_tenant.status_code == 404
+    assert other_tenant.json()["error"]["code"] == "HTTP_404"
+    assert unknown.status_code == 404
+    assert malformed.status_code == 422
@@ -1,4 +1,10 @@
+import uuid
+
 import httpx
+import pytest
+
+from __PROJECT_SLUG__.core.config import get_settings
+from __PROJECT_SLUG__.core.db import get_db_session
 
 
 async def test_request_id_generated_when_header_absent(client: httpx.AsyncClient) -> None:
@@ -30,3 +36,74 @@ async def test_custom_tenant_header_propagated_to_response(client: httpx.AsyncCl
 
     assert response.status_code == 201
     assert response.json()["tenant_id"] == "acme-corp"
+
+
+async def test_rate_limit_policy_applies_to_route_template(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from __PROJECT_SLUG__.main import create_app
+
+    monkeypatch.setenv(
+        "APP_RATE_LIMIT_POLICIES",
+        '[{"route": "/api/v1/ping", "method": "GET", "requests": 1, "window_seconds": 60}]',
+    )
+    get_settings.cache_clear()
+    try:
+        app = create_app()
+    finally:
+        get_settings.cache_clear()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as c:
+        assert (await c.get("/api/v1/ping")).status_code == 200
+        limited = await c.get("/api/v1/ping")
+        assert limited.status_code == 429
+        assert limited.json()["error"]["code"] == "RATE_LIMITED"
+        assert (await c.get("/health")).status_code == 200
+
+
+async def test_rate_limit_policy_does_not_match_static_sibling_route(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from __PROJECT_SLUG__.main import create_app
+
+    monkeypatch.setenv(
+        "APP_RATE_LIMIT_POLICIES",
+        '[{"route": "/api/v1/items/{item_id}", "method": "GET", "requests": 1, '
+        '"window_seconds": 60}]',
+    )
+    get_settings.cache_clear()
+    try:
+        app = create_app()
+    finally:
+        get_settings.cache_clear()
+
+    async def _no_db_session():
+        yield None
+
+    app.dependency_overrides[get_db_session] = _no_db_session
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as c:
+        # /items/export is declared before /items/{item_id}, so the router never sends it there.
+        assert (await c.get("/api/v1/items/export")).status_code == 200
+        assert (await c.get("/api/v1/items/export")).status_code == 200
+        item_path = f"/api/v1/items/{uuid.uuid4()}"
+        assert (await c.get(item_path)).status_code == 404
+        assert (await c.get(item_path)).status_code == 429
+
+
+def test_rate_limit_policy_with_unknown_route_fails_startup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from __PROJECT_SLUG__.main import create_app
+
+    monkeypatch.setenv(
+        "APP_RATE_LIMIT_POLICIES",
+        '[{"route": "/api/v1/pong", "requests": 1, "window_seconds": 60}]',
+    )
+    get_settings.cache_clear()
+    try:
+        with pytest.raises(ValueError, match="/api/v1/pong"):
+            create_app()
+    finally:
+        get_settings.cache_clear()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from __PROJECT_SLUG__.api.v1.features.auth import service
+from __PROJECT_SLUG__.core.security.revocation import (
+    SYNC_OVERLAP,
+    AccessTokenRevocationList,
+    access_token_revocations,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_revocations() -> Generator[None]:
+    access_token_revocations.clear()
+    yield
+    access_token_revocations.clear()
+
+
+def test_revocation_list_advances_watermark_and_prunes_expired_entries() -> None:
+    revocations = AccessTokenRevocationList()
+    now = datetime.now(UTC)
+    assert revocations.sync_from() is None
+
+    revocations.apply(
+        [
+            ("live", now + timedelta(minutes=5), now - timedelta(seconds=2)),
+            ("stale", now - timedelta(seconds=1), now - timedelta(seconds=1)),
+        ]
+    )
+
+    assert revocations.sync_from() == now - timedelta(seconds=1) - SYNC_OVERLAP
+    assert revocations.is_revoked("live") and revocations.is_revoked("stale")
+    assert revocations.prune(now.timestamp()) == 1
+    assert revocations.is_revoked("live")
+    assert not revocations.is_revoked("stale")
+    assert len(revocations) == 1
+
+
+async def test_revocations_reach_other_workers_on_sync(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    expires_at = datetime.now(UTC) + timedelta(minutes=30)
+    async with sqlite_sessions() as session:
+        await service.revoke_access_token(session=session, jti="first", expires_at=expires_at)
+        await service.revoke_access_token(session=session, jti="first", expires_at=expires_at)
+    assert access_token_revocations.is_revoked("first")
+
+    # A worker that never saw the revocation loads it from the database.
+    access_token_revocations.clear()
+    assert await service.sync_access_token_revocations(session_factory=sqlite_sessions) == 1
+    assert access_token_revocations.is_revoked("first")
+    assert access_token_revocations.watermark is not None
+
+    async with sqlite_sessions() as session:
+        await service.revoke_access_token(session=session, jti="second", expires_at=expires_at)
+    access_token_revocations.clear()
+    access_token_revocations.apply([("first", expires_at, datetime.now(UTC))])
+    await service.sync_access_token_revocations(session_factory=sqlite_sessions)
+    assert access_token_revocations.is_revoked("second")
+
+
+async def test_expired_revocations_are_not_loaded_and_are_purged(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    now = datetime.now(UTC)
+    async with sqlite_sessions() as session:
+        await service.revoke_access_token(
+            session=session, jti="expired", expires_at=now - timedelta(seconds=1)
+        )
+        await service.revoke_access_token(
+            session=session, jti="live", expires_at=now + timedelta(minutes=5)
+        )
+    access_token_revocations.clear()
+
+    assert await service.sync_access_token_revocations(session_factory=sqlite_sessions) == 1
+    assert not access_token_revocations.is_revoked("expired")
+    purged = await service.purge_access_token_revocations(
+        session_factory=sqlite_sessions, batch_size=10, batch_pause_seconds=0
+    )
+    assert purged == 1
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime
+
+import jwt
 import pytest
 from fastapi import HTTPException
 from fastapi.security import SecurityScopes
@@ -10,7 +13,11 @@ from __PROJECT_SLUG__.core.security.auth import (
     create_access_token,
     decode_access_token,
     get_current_principal,
+    scope_registry,
 )
+from __PROJECT_SLUG__.core.security.keyring import derive_key_id, get_jwt_keyring
+from __PROJECT_SLUG__.core.security.revocation import access_token_revocations
+from __PROJECT_SLUG__.core.security.token_cache import verified_token_cache
 
 
 def _set_auth_env(monkeypatch: pytest.MonkeyPatch, *, enabled: bool = True) -> None:
@@ -70,6 +77,135 @@ def test_decode_access_token_accepts_additional_secret(monkeypatch: pytest.Monke
         _clear_auth_cache()
 
 
+def test_decode_access_token_skips_verification_on_cache_hit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _set_auth_env(monkeypatch)
+    verified_token_cache.clear()
+    calls = 0
+    original_decode = jwt.decode
+
+    def counting_decode(*args: object, **kwargs: object) -> dict:
+        nonlocal calls
+        calls += 1
+        return original_decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+    try:
+        token, _ = create_access_token(username="admin", scopes=["items:read"])
+        first = decode_access_token(token)
+        second = decode_access_token(token)
+
+        assert first == second
+        assert calls == 1
+    finally:
+        _clear_auth_cache()
+
+
+def test_decode_access_token_cache_invalidated_when_secret_rotates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _set_auth_env(monkeypatch)
+    try:
+        token, _ = create_access_token(username="admin", scopes=["items:read"])
+        assert decode_access_token(token)["username"] == "admin"
+
+        monkeypatch.setenv("APP_AUTH_JWT_SECRET", "r" * 48)
+        get_settings.cache_clear()
+        with pytest.raises(HTTPException) as exc:
+            decode_access_token(token)
+        assert exc.value.status_code == 401
+    finally:
+        _clear_auth_cache()
+
+
+def _legacy_token(secret: str) -> str:
+    settings = get_settings()
+    return jwt.encode(
+        {
+            "sub": "admin",
+            "username": "admin",
+            "scopes": ["items:read"],
+            "typ": "access",
+            "iss": settings.auth_issuer,
+            "aud": settings.auth_audience,
+            "exp": 4_102_444_800,
+        },
+        secret,
+        algorithm="HS256",
+    )
+
+
+def test_create_access_token_stamps_signing_key_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    _set_auth_env(monkeypatch)
+    try:
+        token, _ = create_access_token(username="admin", scopes=["items:read"])
+        kid = jwt.get_unverified_header(token)["kid"]
+        assert kid == derive_key_id("x" * 48)
+        assert kid == get_jwt_keyring().signing_kid
+        assert "x" * 48 not in kid
+    finally:
+        _clear_auth_cache()
+
+
+def test_decode_access_token_rejects_unknown_kid_without_verifying(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _set_auth_env(monkeypatch)
+    monkeypatch.setenv("APP_AUTH_JWT_ADDITIONAL_SECRETS", ",".join(["a" * 48, "b" * 48]))
+    get_settings.cache_clear()
+    verified_token_cache.clear()
+    calls = 0
+    original_decode = jwt.decode
+
+    def counting_decode(*args: object, **kwargs: object) -> dict:
+        nonlocal calls
+        calls += 1
+        return original_decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+    try:
+        settings = get_settings()
+        forged = jwt.encode(
+            {"sub": "admin", "iss": settings.auth_issuer, "aud": settings.auth_audience},
+            "c" * 48,
+            algorithm="HS256",
+            headers={"kid": "not-a-known-kid"},
+        )
+        with pytest.raises(HTTPException) as exc:
+            decode_access_token(forged)
+        assert exc.value.status_code == 401
+        assert calls == 0
+    finally:
+        _clear_auth_cache()
+
+
+def test_decode_access_token_accepts_legacy_token_without_kid(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _set_auth_env(monkeypatch)
+    monkeypatch.setenv("APP_AUTH_JWT_ADDITIONAL_SECRETS", "o" * 48)
+    get_settings.cache_clear()
+    try:
+        assert decode_access_token(_legacy_token("o" * 48))["username"] == "admin"
+    finally:
+        _clear_auth_cache()
+
+
+def test_decode_access_token_rejects_legacy_token_when_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _set_auth_env(monkeypatch)
+    monkeypatch.setenv("APP_AUTH_JWT_ACCEPT_LEGACY_TOKENS", "false")
+    get_settings.cache_clear()
+    try:
+        with pytest.raises(HTTPException) as exc:
+            decode_access_token(_legacy_token("x" * 48))
+        assert exc.value.status_code == 401
+    finally:
+        _clear_auth_cache()
+
+
 async def test_get_current_principal_bypasses_when_auth_disabled(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -93,3 +229,40 @@ async def test_get_current_principal_rejects_missing_scope(
         assert exc.value.status_code == 403
     finally:
         _clear_auth_cache()
+
+
+async def test_get_current_principal_compiles_required_scopes_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _set_auth_env(monkeypatch, enabled=True)
+    try:
+        token, _ = create_access_token(username="admin", scopes=["items:read", "items:write"])
+        scopes = SecurityScopes(scopes=["items:read", "items:write"])
+        await get_current_principal(scopes, token=token)
+
+        def fail_compile(_scopes: object) -> int:
+            raise AssertionError("required scopes compiled per request")
+
+        monkeypatch.setattr(scope_registry, "compile", fail_compile)
+        principal = await get_current_principal(scopes, token=token)
+        assert principal.username == "admin"
+    finally:
+        _clear_auth_cache()
+
+
+async def test_get_current_principal_rejects_revoked_token(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _set_auth_env(monkeypatch, enabled=True)
+    try:
+        token, _ = create_access_token(username="admin", scopes=["items:write"])
+        claims = decode_access_token(token)
+        access_token_revocations.add(claims["jti"], datetime.fromtimestamp(claims["exp"], UTC))
+
+        with pytest.raises(HTTPException) as exc:
+            await get_current_principal(SecurityScopes(scopes=["items:write"]), token=token)
+        assert exc.value.status_code == 401
+        assert exc.value.detail == "Authentication token has been revoked."
+    finally:
+        access_token_revocations.clear()
+        _clear_auth_cache()
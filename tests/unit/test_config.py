@@ -85,6 +85,24 @@ def test_settings_require_long_jwt_secret_when_auth_enabled() -> None:
         Settings(auth_enabled=True, auth_jwt_secret="short-secret")
 
 
+def test_settings_reject_unknown_jwt_algorithm() -> None:
+    with pytest.raises(ValidationError):
+        Settings(auth_jwt_algorithm="none")
+
+
+def test_settings_require_private_key_for_asymmetric_jwt() -> None:
+    with pytest.raises(ValidationError):
+        Settings(auth_enabled=True, auth_jwt_algorithm="ES256")
+
+    settings = Settings(
+        auth_enabled=True,
+        auth_jwt_algorithm="EdDSA",
+        auth_jwt_secret="unused",
+        auth_jwt_private_key_file="/run/secrets/jwt.pem",
+    )
+    assert settings.auth_jwt_private_key_file == "/run/secrets/jwt.pem"
+
+
 def test_settings_parse_csv_list_fields() -> None:
     settings = Settings(
         cors_origins="https://api.example.com,https://admin.example.com",
@@ -117,11 +135,153 @@ def test_settings_require_redis_url_when_redis_backend() -> None:
         Settings(rate_limit_backend="redis", rate_limit_redis_url="  ")
 
 
+def test_settings_require_redis_url_when_redis_gcra_backend() -> None:
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_backend="redis_gcra", rate_limit_redis_url="")
+
+
+def test_settings_reject_negative_rate_limit_redis_lease_size() -> None:
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_redis_lease_size=-1)
+
+
+def test_settings_reject_invalid_rate_limit_breaker_values() -> None:
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_breaker_timeout_ms=0)
+
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_breaker_failure_ratio=0)
+
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_breaker_min_calls=0)
+
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_breaker_fallback="disk")
+
+
+def test_settings_reject_non_positive_rate_limit_burst() -> None:
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_burst=0)
+
+
 def test_settings_reject_non_positive_rate_limit_memory_max_keys() -> None:
     with pytest.raises(ValidationError):
         Settings(rate_limit_memory_max_keys=0)
 
 
+def test_settings_reject_non_positive_rate_limit_shm_stripes() -> None:
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_shm_stripes=0)
+
+
+def test_settings_parse_rate_limit_policies_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(
+        "APP_RATE_LIMIT_POLICIES",
+        '[{"route": "/api/v1/auth/token", "method": "post", "requests": 5, '
+        '"window_seconds": 60, "key_by": ["ip"]}]',
+    )
+
+    (policy,) = Settings().rate_limit_policies
+
+    assert policy.route == "/api/v1/auth/token"
+    assert policy.method == "POST"
+    assert policy.tenant == "*"
+    assert policy.key_by == ["ip"]
+
+
+def test_settings_reject_invalid_rate_limit_policies() -> None:
+    valid = {"route": "/api/v1/ping", "requests": 1, "window_seconds": 60}
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_policies=[{**valid, "route": "api/v1/ping"}])
+
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_policies=[{**valid, "requests": 0}])
+
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_policies=[{**valid, "key_by": ["user"]}])
+
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_policies=[valid, {**valid, "requests": 2}])
+
+
+def test_settings_reject_non_positive_auth_token_cache_size() -> None:
+    with pytest.raises(ValidationError):
+        Settings(auth_token_cache_max_entries=0)
+
+
+def test_settings_reject_invalid_password_hash_profile() -> None:
+    with pytest.raises(ValidationError):
+        Settings(auth_password_hash_scheme="bcrypt")
+    with pytest.raises(ValidationError):
+        Settings(auth_password_hash_argon2_memory_kib=16, auth_password_hash_argon2_parallelism=4)
+    with pytest.raises(ValidationError):
+        Settings(auth_password_hash_pbkdf2_iterations=1000)
+
+
+def test_settings_reject_invalid_refresh_token_purge_values() -> None:
+    with pytest.raises(ValidationError):
+        Settings(auth_refresh_token_purge_interval_seconds=0)
+    with pytest.raises(ValidationError):
+        Settings(auth_refresh_token_purge_batch_size=0)
+    with pytest.raises(ValidationError):
+        Settings(auth_refresh_token_purge_batch_pause_ms=-1)
+
+
+def test_settings_reject_invalid_user_import_values() -> None:
+    with pytest.raises(ValidationError):
+        Settings(auth_user_import_hash_workers=-1)
+    with pytest.raises(ValidationError):
+        Settings(auth_user_import_batch_size=0)
+    with pytest.raises(ValidationError):
+        Settings(auth_user_import_max_body_bytes=0)
+    with pytest.raises(ValidationError):
+        Settings(auth_user_import_max_line_bytes=0)
+    with pytest.raises(ValidationError):
+        Settings(auth_user_import_max_records=0)
+
+
+def test_settings_reject_short_pagination_cursor_secret() -> None:
+    assert Settings(pagination_cursor_secret="").pagination_cursor_secret == ""
+    with pytest.raises(ValidationError):
+        Settings(pagination_cursor_secret="too-short")
+
+
+def test_settings_require_pagination_cursor_secret_in_prod() -> None:
+    prod = {
+        "environment": Environment.PROD,
+        "database_url": "postgresql+asyncpg://app@db/app",
+        "auth_enabled": True,
+        "auth_use_database": True,
+        "auth_jwt_secret": "x" * 40,
+        "auth_admin_password": "secure-password",
+        "database_auto_create_schema": False,
+        "allowed_hosts": ["api.example.com"],
+        "api_docs_enabled": False,
+    }
+    with pytest.raises(ValidationError, match="pagination_cursor_secret"):
+        Settings(**prod)
+
+    assert Settings(**prod, pagination_cursor_secret="c" * 40).pagination_cursor_secret
+
+
+def test_settings_reject_invalid_item_cache_values() -> None:
+    with pytest.raises(ValidationError):
+        Settings(items_cache_max_entries=0)
+    with pytest.raises(ValidationError):
+        Settings(items_cache_ttl_seconds=0)
+
+
+def test_settings_reject_invalid_password_hash_executor_values() -> None:
+    with pytest.raises(ValidationError):
+        Settings(auth_password_hash_executor="fiber")
+
+    with pytest.raises(ValidationError):
+        Settings(auth_password_hash_workers=0)
+
+    with pytest.raises(ValidationError):
+        Settings(auth_password_hash_max_queue=-1)
+
+
 def test_settings_reject_invalid_runtime_concurrency_values() -> None:
     with pytest.raises(ValidationError):
         Settings(web_concurrency=0)
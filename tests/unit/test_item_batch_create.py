@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from __PROJECT_SLUG__.api.v1.features.items import repository, service
+from __PROJECT_SLUG__.api.v1.features.items.models import Item
+from __PROJECT_SLUG__.api.v1.features.items.schemas import ItemCreate
+
+
+async def test_create_items_inserts_in_chunks_and_keeps_input_order(
+    sqlite_sessions: async_sessionmaker[AsyncSession], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(repository, "INSERT_CHUNK_SIZE", 2)
+    engine = sqlite_sessions.kw["bind"]
+    statements: list[str] = []
+
+    def capture(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+        statements.append(statement)
+
+    payloads = [ItemCreate(name=f"Item {index}", price=index + 1.0) for index in range(5)]
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with sqlite_sessions() as session:
+            created = await service.create_items(payloads, tenant_id="acme", session=session)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    assert [item.name for item in created] == [payload.name for payload in payloads]
+    assert [item.price for item in created] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert {item.tenant_id for item in created} == {"acme"}
+    inserts = [statement for statement in statements if statement.startswith("INSERT")]
+    assert len(inserts) == 3
+    assert all("RETURNING" in statement for statement in inserts)
+
+    async with sqlite_sessions() as session:
+        assert await session.scalar(select(func.count(Item.id))) == 5
+
+
+async def test_batch_lists_in_input_order(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    payloads = [ItemCreate(name=f"Item {index}", price=1.0) for index in range(10)]
+    async with sqlite_sessions() as session:
+        await service.create_items(payloads, tenant_id="acme", session=session)
+
+    names: list[str] = []
+    cursor = None
+    while True:
+        async with sqlite_sessions() as session:
+            page = await service.list_items("acme", cursor=cursor, limit=4, session=session)
+        names += [item.name for item in page.items]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert names == [payload.name for payload in payloads]
+
+
+async def test_create_items_rolls_back_the_whole_batch_on_failure(
+    sqlite_sessions: async_sessionmaker[AsyncSession], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(repository, "INSERT_CHUNK_SIZE", 2)
+    payloads = [ItemCreate(name=f"Item {index}", price=1.0) for index in range(4)]
+    # The second chunk reuses the first chunk's ids, so its INSERT violates the primary key.
+    ids = iter([*range(1, 3), *range(1, 3)])
+    monkeypatch.setattr(repository.uuid, "uuid4", lambda: repository.uuid.UUID(int=next(ids)))
+
+    async with sqlite_sessions() as session:
+        with pytest.raises(IntegrityError):
+            await service.create_items(payloads, tenant_id="acme", session=session)
+
+    async with sqlite_sessions() as session:
+        assert await session.scalar(select(func.count(Item.id))) == 0
+
+
+async def test_single_and_batch_create_return_the_stored_price(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    async with sqlite_sessions() as session:
+        single = await service.create_item(
+            ItemCreate(name="Single", price=9.999), tenant_id="acme", session=session
+        )
+        batch = await service.create_items(
+            [ItemCreate(name="Batch", price=9.999), ItemCreate(name="Half", price=1.005)],
+            tenant_id="acme",
+            session=session,
+        )
+
+    assert [single.price, *(item.price for item in batch)] == [10.0, 10.0, 1.01]
+    async with sqlite_sessions() as session:
+        for item in [single, *batch]:
+            stored = await service.get_item(item.id, "acme", session=session)
+            assert stored == item
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from __PROJECT_SLUG__.api.v1.features.items import cache as cache_module
+from __PROJECT_SLUG__.api.v1.features.items import service
+from __PROJECT_SLUG__.api.v1.features.items.cache import ItemCache, item_cache
+from __PROJECT_SLUG__.api.v1.features.items.schemas import ItemCreate, ItemResponse
+
+
+class FakeRedisPipeline:
+    def __init__(self, client: FakeRedisClient) -> None:
+        self.client = client
+        self.commands: list[tuple[str, str, int | None]] = []
+
+    async def __aenter__(self) -> FakeRedisPipeline:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def set(self, name: str, value: str, ex: int | None = None) -> None:
+        self.commands.append((name, value, ex))
+
+    async def execute(self) -> list[bool]:
+        self.client.calls.append("pipeline")
+        return [await self.client.set(name, value, ex=ex) for name, value, ex in self.commands]
+
+
+class FakeRedisClient:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.calls: list[str] = []
+        self.fail = fail
+        self.closed = False
+
+    async def get(self, name: str) -> str | None:
+        self.calls.append("get")
+        if self.fail:
+            raise ConnectionError("redis is down")
+        return self.values.get(name)
+
+    async def set(self, name: str, value: str, ex: int | None = None) -> bool:
+        if self.fail:
+            raise ConnectionError("redis is down")
+        self.values[name] = value
+        self.ttls[name] = ex
+        return True
+
+    async def delete(self, *names: str) -> int:
+        self.calls.append("delete")
+        return sum(self.values.pop(name, None) is not None for name in names)
+
+    def pipeline(self, transaction: bool = True) -> FakeRedisPipeline:
+        return FakeRedisPipeline(self)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _item(tenant_id: str = "acme", item_id: UUID | None = None) -> ItemResponse:
+    return ItemResponse(
+        id=item_id or uuid4(),
+        name="Widget",
+        description=None,
+        price=9.99,
+        tenant_id=tenant_id,
+        created_at=datetime.now(UTC),
+    )
+
+
+@pytest.fixture
+def lookups(monkeypatch: pytest.MonkeyPatch) -> Generator[list[str], None, None]:
+    results: list[str] = []
+    monkeypatch.setattr(service, "record_item_cache_lookup", results.append)
+    yield results
+    item_cache.configure(enabled=False, max_entries=10_000, ttl_seconds=60)
+
+
+def test_local_tier_evicts_least_recently_used_and_expires_entries() -> None:
+    cache = ItemCache()
+    cache.configure(enabled=True, max_entries=2, ttl_seconds=10)
+    first, second, third = _item(), _item(), _item()
+
+    cache.put_local(first, now=0)
+    cache.put_local(second, now=0)
+    assert cache.get_local("acme", first.id, now=1) is first
+    cache.put_local(third, now=1)
+
+    assert cache.get_local("acme", second.id, now=1) is None
+    assert cache.get_local("acme", first.id, now=1) is first
+    assert cache.get_local("acme", third.id, now=11) is None
+    assert len(cache) == 1
+
+
+async def test_entries_are_namespaced_by_tenant() -> None:
+    redis = FakeRedisClient()
+    cache = ItemCache()
+    cache.configure(
+        enabled=True, max_entries=10, ttl_seconds=30, redis_prefix="svc", redis_client=redis
+    )
+    item = _item("acme")
+
+    await cache.put([item])
+
+    assert cache.get_local("other", item.id) is None
+    assert await cache.get_redis("other", item.id) is None
+    assert list(redis.values) == [f"svc:items:acme:{item.id}"]
+    assert redis.ttls[f"svc:items:acme:{item.id}"] == 30
+    # A value stored under another tenant's key is still refused.
+    redis.values[f"svc:items:other:{item.id}"] = item.model_dump_json()
+    assert await cache.get_redis("other", item.id) is None
+
+
+async def test_get_item_reads_through_local_then_redis_then_store(lookups: list[str]) -> None:
+    redis = FakeRedisClient()
+    item_cache.configure(enabled=True, max_entries=10, ttl_seconds=60, redis_client=redis)
+    created = await service.create_item(ItemCreate(name="Widget", price=1.0), tenant_id="acme")
+
+    assert await service.get_item(created.id, "acme") == created
+    item_cache.clear()
+    assert await service.get_item(created.id, "acme") == created
+    assert await service.get_item(created.id, "acme") == created
+    item_cache.clear()
+    redis.values.clear()
+    assert await service.get_item(created.id, "acme") == created
+    assert await service.get_item(created.id, "other") is None
+
+    assert lookups == ["local_hit", "redis_hit", "local_hit", "miss", "miss"]
+    assert redis.values == {f":items:acme:{created.id}": created.model_dump_json()}
+
+
+async def test_cached_item_matches_the_stored_row(
+    lookups: list[str], sqlite_sessions: async_sessionmaker[AsyncSession]
+) -> None:
+    item_cache.configure(enabled=True, max_entries=10, ttl_seconds=60)
+    async with sqlite_sessions() as session:
+        created = await service.create_item(
+            ItemCreate(name="Widget", price=9.999), tenant_id="acme", session=session
+        )
+        [batched] = await service.create_items(
+            [ItemCreate(name="Gadget", price=1.005)], tenant_id="acme", session=session
+        )
+
+    async with sqlite_sessions() as session:
+        cached = [
+            await service.get_item(item.id, "acme", session=session) for item in (created, batched)
+        ]
+        item_cache.clear()
+        stored = [
+            await service.get_item(item.id, "acme", session=session) for item in (created, batched)
+        ]
+
+    assert cached == stored
+    assert [item.price for item in stored] == [10.0, 1.01]
+    assert lookups == ["local_hit", "local_hit", "miss", "miss"]
+
+
+async def test_writes_replace_entries_and_invalidate_removes_them(lookups: list[str]) -> None:
+    redis = FakeRedisClient()
+    item_cache.configure(enabled=True, max_entries=10, ttl_seconds=60, redis_client=redis)
+    created = await service.create_items(
+        [ItemCreate(name=f"Item {index}", price=1.0) for index in range(3)], tenant_id="acme"
+    )
+
+    assert redis.calls == ["pipeline"]
+    assert len(item_cache) == 3
+    updated = created[0].model_copy(update={"name": "Renamed"})
+    await item_cache.put([updated])
+    assert (await service.get_item(created[0].id, "acme")).name == "Renamed"
+
+    await item_cache.invalidate("acme", [item.id for item in created])
+
+    assert len(item_cache) == 0
+    assert redis.values == {}
+
+
+async def test_redis_failures_fall_back_to_the_store(
+    lookups: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    errors: list[Any] = []
+    monkeypatch.setattr(cache_module, "record_item_cache_redis_error", lambda: errors.append(1))
+    redis = FakeRedisClient(fail=True)
+    item_cache.configure(enabled=True, max_entries=10, ttl_seconds=60, redis_client=redis)
+    created = await service.create_item(ItemCreate(name="Widget", price=1.0), tenant_id="acme")
+    item_cache.clear()
+
+    assert await service.get_item(created.id, "acme") == created
+
+    assert lookups == ["miss"]
+    # The write, the lookup and the refill after the miss each hit the failing server.
+    assert len(errors) == 3
+    await item_cache.close()
+    assert redis.closed
+
+
+async def test_disabled_cache_always_reads_the_store(lookups: list[str]) -> None:
+    item_cache.configure(enabled=False, max_entries=10, ttl_seconds=60)
+    created = await service.create_item(ItemCreate(name="Widget", price=1.0), tenant_id="acme")
+
+    assert await service.get_item(created.id, "acme") == created
+    assert len(item_cache) == 0
+    assert lookups == []
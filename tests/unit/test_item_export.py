@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from __PROJECT_SLUG__.api.v1.features.items import service
+from __PROJECT_SLUG__.api.v1.features.items.models import Item
+from __PROJECT_SLUG__.api.v1.features.items.repository import ItemRepository
+
+
+@pytest_asyncio.fixture
+async def sqlite_sessions(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> async_sessionmaker[AsyncSession]:
+    started = datetime(2026, 1, 1, tzinfo=UTC)
+    async with sqlite_sessions() as session:
+        session.add_all(
+            Item(
+                name=f"{tenant_id} {index}",
+                description="with, comma" if index == 0 else None,
+                price=Decimal("2.50"),
+                tenant_id=tenant_id,
+                created_at=started + timedelta(seconds=index),
+            )
+            for tenant_id, count in (("acme", 7), ("other", 2))
+            for index in range(count)
+        )
+        await session.commit()
+    return sqlite_sessions
+
+
+async def test_iter_export_chunks_reads_bounded_chunks_in_key_order(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    async with sqlite_sessions() as session:
+        chunks = [
+            chunk
+            async for chunk in ItemRepository(session).iter_export_chunks("acme", chunk_size=3)
+        ]
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert [row.name for chunk in chunks for row in chunk] == [f"acme {i}" for i in range(7)]
+
+
+async def test_export_items_as_ndjson(sqlite_sessions: async_sessionmaker[AsyncSession]) -> None:
+    async with sqlite_sessions() as session:
+        blocks = [
+            block async for block in service.export_items("acme", "ndjson", session, chunk_size=3)
+        ]
+
+    assert len(blocks) == 3
+    records = [json.loads(line) for line in b"".join(blocks).splitlines()]
+    assert [record["name"] for record in records] == [f"acme {i}" for i in range(7)]
+    assert records[0]["price"] == 2.5
+    assert records[0]["description"] == "with, comma"
+    assert records[1]["description"] is None
+
+
+async def test_export_items_as_csv(sqlite_sessions: async_sessionmaker[AsyncSession]) -> None:
+    async with sqlite_sessions() as session:
+        body = b"".join(
+            [block async for block in service.export_items("other", "csv", session, chunk_size=3)]
+        )
+
+    rows = list(csv.DictReader(io.StringIO(body.decode())))
+    assert [row["name"] for row in rows] == ["other 0", "other 1"]
+    assert rows[0]["description"] == "with, comma"
+    assert rows[0]["price"] == "2.50"
+
+
+async def test_export_of_an_empty_tenant_is_only_the_csv_header(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    async with sqlite_sessions() as session:
+        csv_blocks = [block async for block in service.export_items("nobody", "csv", session)]
+        ndjson_blocks = [block async for block in service.export_items("nobody", "ndjson", session)]
+
+    assert csv_blocks == [b"id,name,description,price,tenant_id,created_at\r\n"]
+    assert ndjson_blocks == []
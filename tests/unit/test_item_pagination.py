@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from __PROJECT_SLUG__.api.v1.features.items import service
+from __PROJECT_SLUG__.api.v1.features.items.models import Item
+from __PROJECT_SLUG__.core.pagination import CursorCodec, InvalidCursorError
+
+
+async def _seed_items(
+    sessions: async_sessionmaker[AsyncSession], tenant_id: str, count: int
+) -> list[UUID]:
+    # Pairs share a timestamp so the id tiebreaker is exercised.
+    started = datetime(2026, 1, 1, tzinfo=UTC)
+    items = [
+        Item(
+            name=f"{tenant_id}-{index}",
+            price=Decimal("1.00"),
+            tenant_id=tenant_id,
+            created_at=started + timedelta(seconds=index // 2),
+        )
+        for index in range(count)
+    ]
+    async with sessions() as session:
+        session.add_all(items)
+        await session.commit()
+    return [item.id for item in sorted(items, key=lambda item: (item.created_at, item.id))]
+
+
+def test_cursor_round_trips_and_is_bound_to_its_context() -> None:
+    codec = CursorCodec()
+    codec.configure("s" * 32)
+
+    cursor = codec.encode(["2026-01-01T00:00:00+00:00", "abc"], context="items:acme")
+
+    assert codec.decode(cursor, context="items:acme") == ["2026-01-01T00:00:00+00:00", "abc"]
+    with pytest.raises(InvalidCursorError):
+        codec.decode(cursor, context="items:other")
+
+
+@pytest.mark.parametrize("tamper", ["payload", "tag", "garbage"])
+def test_cursor_rejects_tampering(tamper: str) -> None:
+    codec = CursorCodec()
+    codec.configure("s" * 32)
+    payload, tag = codec.encode(["a", "b"], context="items:acme").split(".")
+    forged = CursorCodec()
+    forged.configure("f" * 32)
+    cursor = {
+        "payload": f"{forged.encode(['z', 'b'], context='items:acme').split('.')[0]}.{tag}",
+        "tag": f"{payload}.{tag[:-2]}AA",
+        "garbage": "%%%.!!",
+    }[tamper]
+
+    with pytest.raises(InvalidCursorError):
+        codec.decode(cursor, context="items:acme")
+
+
+def test_decode_cursor_rejects_signed_values_of_the_wrong_shape() -> None:
+    cursor = service.cursor_codec.encode(["not-a-date", "x"], context="items:acme")
+
+    with pytest.raises(InvalidCursorError):
+        service.decode_cursor(cursor, "acme")
+
+
+async def test_list_items_pages_through_a_tenant_in_key_order(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    expected = await _seed_items(sqlite_sessions, "acme", 7)
+    await _seed_items(sqlite_sessions, "other", 3)
+
+    seen: list[UUID] = []
+    cursor = None
+    pages = 0
+    while True:
+        async with sqlite_sessions() as session:
+            page = await service.list_items("acme", cursor=cursor, limit=3, session=session)
+        seen += [item.id for item in page.items]
+        pages += 1
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert pages == 3
+
+
+async def test_list_items_last_full_page_has_no_cursor(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_items(sqlite_sessions, "acme", 4)
+
+    async with sqlite_sessions() as session:
+        page = await service.list_items("acme", limit=4, session=session)
+
+    assert len(page.items) == 4
+    assert page.next_cursor is None
+
+
+async def test_cursor_from_one_tenant_is_rejected_for_another(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_items(sqlite_sessions, "acme", 3)
+    async with sqlite_sessions() as session:
+        page = await service.list_items("acme", limit=1, session=session)
+        assert page.next_cursor is not None
+
+        with pytest.raises(InvalidCursorError):
+            await service.list_items("other", cursor=page.next_cursor, limit=1, session=session)
+
+
+async def test_keyset_query_seeks_the_composite_index(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_items(sqlite_sessions, "acme", 3)
+    engine = sqlite_sessions.kw["bind"]
+    statements: list[tuple[str, tuple[object, ...]]] = []
+
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany) -> None:
+        statements.append((statement, parameters))
+
+    async with sqlite_sessions() as session:
+        page = await service.list_items("acme", limit=1, session=session)
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            await service.list_items("acme", cursor=page.next_cursor, limit=1, session=session)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+        [(statement, parameters)] = statements
+        connection = await session.connection()
+        plan = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        details = " ".join(row[-1] for row in plan)
+
+    assert "USING INDEX ix_items_tenant_created_id" in details
+    assert "TEMP B-TREE" not in details
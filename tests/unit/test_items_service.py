@@ -33,3 +33,19 @@ async def test_create_item_stamps_tenant_id() -> None:
     result = await service.create_item(payload, tenant_id="tenant-xyz")
 
     assert result.tenant_id == "tenant-xyz"
+
+
+async def test_list_items_pages_in_creation_order_without_session() -> None:
+    created = [
+        await service.create_item(ItemCreate(name=f"Item {index}", price=1.0), tenant_id="t1")
+        for index in range(5)
+    ]
+    await service.create_item(ItemCreate(name="Elsewhere", price=1.0), tenant_id="t2")
+
+    first = await service.list_items("t1", limit=3)
+    second = await service.list_items("t1", cursor=first.next_cursor, limit=3)
+
+    expected = sorted(created, key=lambda item: (item.created_at, item.id))
+    assert [item.id for item in first.items + second.items] == [item.id for item in expected]
+    assert first.next_cursor is not None
+    assert second.next_cursor is None
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from __PROJECT_SLUG__.core.security.keyring import (
+    asymmetric_keyring,
+    hmac_keyring,
+    jwk_thumbprint,
+)
+
+
+def _private_pem(private_key: object) -> bytes:
+    return private_key.private_bytes(  # type: ignore[attr-defined]
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def _public_pem(private_key: object) -> bytes:
+    return private_key.public_key().public_bytes(  # type: ignore[attr-defined]
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+
+
+def _generate(algorithm: str) -> object:
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    if algorithm == "ES256":
+        return ec.generate_private_key(ec.SECP256R1())
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def test_jwk_thumbprint_matches_rfc7638_example() -> None:
+    jwk = {
+        "kty": "RSA",
+        "n": (
+            "0vx7agoebGcQSuuPiLJXZptN9nndrQmbXEps2aiAFbWhM78LhWx4cbbfAAtVT86zwu1RK7aPFFxuhDR1L6tSo"
+            "c_BJECPebWKRXjBZCiFV4n3oknjhMstn64tZ_2W-5JsGY4Hc5n9yBXArwl93lqt7_RN5w6Cf0h4QyQ5v-65YGj"
+            "QR0_FDW2QvzqY368QQMicAtaSqzs8KJZgnYb9c7d0zgdAZHzu6qMQvRL5hajrn1n91CbOpbISD08qNLyrdkt-b"
+            "FTWhAI4vMQFh6WeZu0fM4lFd2NcRwr3XPksINHaQ-G_xBniIqbw0Ls1jF44-csFCur-kEgU8awapJzKnqDKgw"
+        ),
+        "e": "AQAB",
+        "alg": "RS256",
+        "kid": "2011-04-29",
+    }
+    assert jwk_thumbprint(jwk) == "NzbLsXh8uDCcd-6MNwXF4W_7noWXFZAfHkxZsRGC9Xs"
+
+
+@pytest.mark.parametrize("algorithm", ["EdDSA", "ES256", "RS256"])
+def test_asymmetric_keyring_signs_and_publishes_public_key(algorithm: str) -> None:
+    private_key = _generate(algorithm)
+    keyring = asymmetric_keyring(private_key_pem=_private_pem(private_key), algorithm=algorithm)
+
+    token = jwt.encode({"sub": "admin"}, keyring.signing_key, algorithm=algorithm)
+    verification_key = keyring.get(keyring.signing_kid)
+    assert verification_key is not None
+    assert jwt.decode(token, verification_key.key, algorithms=verification_key.algorithms) == {
+        "sub": "admin"
+    }
+
+    assert keyring.jwks is not None
+    (published,) = json.loads(keyring.jwks.body)["keys"]
+    assert published["kid"] == keyring.signing_kid
+    assert published["alg"] == algorithm
+    assert published["use"] == "sig"
+    assert "d" not in published  # private exponent / scalar never leaves the process
+    remote_key = jwt.PyJWK.from_dict(published).key
+    assert jwt.decode(token, remote_key, algorithms=[algorithm]) == {"sub": "admin"}
+
+
+def test_asymmetric_keyring_keeps_previous_keys_for_verification() -> None:
+    previous = _generate("ES256")
+    current = _generate("ES256")
+    keyring = asymmetric_keyring(
+        private_key_pem=_private_pem(current),
+        additional_public_key_pems=[_public_pem(previous)],
+        algorithm="ES256",
+        additional_secrets=["h" * 48],
+    )
+
+    assert keyring.jwks is not None
+    published = json.loads(keyring.jwks.body)["keys"]
+    assert [key["kid"] for key in published] == list(keyring.key_ids[:2])
+    assert len(keyring.key_ids) == 3  # HMAC secrets verify but are not published
+    assert "h" * 48 not in keyring.jwks.body.decode()
+
+
+def test_asymmetric_keyring_rejects_key_for_other_algorithm() -> None:
+    with pytest.raises(ValueError, match="ES256"):
+        asymmetric_keyring(private_key_pem=_private_pem(_generate("RS256")), algorithm="ES256")
+
+
+def test_jwks_etag_changes_with_key_set() -> None:
+    pem = _private_pem(_generate("EdDSA"))
+    first = asymmetric_keyring(private_key_pem=pem, algorithm="EdDSA")
+    same = asymmetric_keyring(private_key_pem=pem, algorithm="EdDSA")
+    rotated = asymmetric_keyring(
+        private_key_pem=_private_pem(_generate("EdDSA")), algorithm="EdDSA"
+    )
+    assert first.jwks is not None and same.jwks is not None and rotated.jwks is not None
+    assert first.jwks.etag == same.jwks.etag
+    assert first.jwks.etag != rotated.jwks.etag
+
+
+def test_hmac_keyring_has_no_jwks() -> None:
+    assert hmac_keyring(secret="s" * 48).jwks is None
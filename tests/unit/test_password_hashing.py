@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from __PROJECT_SLUG__.api.v1.features.auth.service import hash_password, verify_password
+from __PROJECT_SLUG__.core.security.hashing import (
+    PasswordHashingBusyError,
+    PasswordHashingExecutor,
+)
+
+
+async def test_executor_runs_hashing_off_the_event_loop() -> None:
+    executor = PasswordHashingExecutor(max_workers=1, max_queue=0)
+    loop_thread = threading.get_ident()
+
+    password_hash = await executor.run("hash", hash_password, "secret-password")
+    worker_thread = await executor.run("probe", threading.get_ident)
+
+    assert await executor.run("verify", verify_password, "secret-password", password_hash)
+    assert worker_thread != loop_thread
+    executor.shutdown()
+
+
+async def test_process_executor_hashes_in_a_fresh_worker_process() -> None:
+    executor = PasswordHashingExecutor(kind="process", max_workers=1, max_queue=0)
+    try:
+        password_hash = await asyncio.wait_for(
+            executor.run("hash", hash_password, "secret-password"), timeout=60
+        )
+        worker_pid = await executor.run("probe", os.getpid)
+    finally:
+        executor.shutdown()
+
+    assert verify_password("secret-password", password_hash)
+    assert worker_pid != os.getpid()
+
+
+async def test_executor_rejects_when_queue_is_full() -> None:
+    executor = PasswordHashingExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    running = [asyncio.ensure_future(executor.run("verify", release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHashingBusyError):
+        await executor.run("verify", release.wait)
+
+    release.set()
+    assert await asyncio.gather(*running) == [True, True]
+    await asyncio.sleep(0)
+    assert executor.in_flight == 0
+    executor.shutdown()
+
+
+async def test_executor_keeps_slot_until_cancelled_work_finishes() -> None:
+    executor = PasswordHashingExecutor(max_workers=1, max_queue=0)
+    release = threading.Event()
+    waiter = asyncio.ensure_future(executor.run("verify", release.wait))
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    with pytest.raises(PasswordHashingBusyError):
+        await executor.run("verify", release.wait)
+
+    release.set()
+    for _ in range(100):
+        if executor.in_flight == 0:
+            break
+        await asyncio.sleep(0.001)
+    assert executor.in_flight == 0
+    executor.shutdown()
+
+
+def test_executor_rejects_invalid_configuration() -> None:
+    with pytest.raises(ValueError):
+        PasswordHashingExecutor(kind="fiber")
+
+    with pytest.raises(ValueError):
+        PasswordHashingExecutor(max_workers=0)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from __PROJECT_SLUG__.api.v1.features.auth import service as auth_service
+from __PROJECT_SLUG__.core.config import get_settings
+from __PROJECT_SLUG__.core.security import password_tuning
+from __PROJECT_SLUG__.core.security.passwords import (
+    PasswordHashProfile,
+    hash_password,
+    needs_rehash,
+    verify_and_update,
+    verify_password,
+)
+
+# Small costs keep the suite fast; the logic does not depend on the magnitudes.
+ARGON2_LIGHT = PasswordHashProfile(argon2_time_cost=1, argon2_memory_kib=1024, argon2_parallelism=1)
+ARGON2_HEAVIER = PasswordHashProfile(
+    argon2_time_cost=2, argon2_memory_kib=2048, argon2_parallelism=1
+)
+PBKDF2_LIGHT = PasswordHashProfile(scheme="pbkdf2_sha256", pbkdf2_iterations=10_000)
+PBKDF2_HEAVIER = PasswordHashProfile(scheme="pbkdf2_sha256", pbkdf2_iterations=20_000)
+
+
+@pytest.mark.parametrize("profile", [ARGON2_LIGHT, PBKDF2_LIGHT])
+def test_hash_matches_its_own_profile(profile: PasswordHashProfile) -> None:
+    password_hash = hash_password("secret-password", profile)
+
+    assert verify_password("secret-password", password_hash)
+    assert not verify_password("wrong-password", password_hash)
+    assert not needs_rehash(password_hash, profile)
+
+
+@pytest.mark.parametrize(
+    ("created_with", "profile"),
+    [
+        (ARGON2_LIGHT, ARGON2_HEAVIER),  # upgrade
+        (ARGON2_HEAVIER, ARGON2_LIGHT),  # downgrade
+        (PBKDF2_LIGHT, PBKDF2_HEAVIER),
+        (PBKDF2_HEAVIER, PBKDF2_LIGHT),
+        (PBKDF2_LIGHT, ARGON2_LIGHT),  # scheme migration
+        (ARGON2_LIGHT, PBKDF2_LIGHT),
+    ],
+)
+def test_verify_and_update_rehashes_off_profile_hashes(
+    created_with: PasswordHashProfile, profile: PasswordHashProfile
+) -> None:
+    stored = hash_password("secret-password", created_with)
+    assert needs_rehash(stored, profile)
+
+    verified, new_hash = verify_and_update("secret-password", stored, profile)
+
+    assert verified
+    assert new_hash is not None
+    assert verify_password("secret-password", new_hash)
+    assert not needs_rehash(new_hash, profile)
+
+
+def test_verify_and_update_never_rehashes_on_wrong_password() -> None:
+    stored = hash_password("secret-password", PBKDF2_LIGHT)
+    assert verify_and_update("wrong-password", stored, ARGON2_LIGHT) == (False, None)
+
+
+class _FakeRepository:
+    def __init__(self, user: SimpleNamespace) -> None:
+        self.user = user
+        self.updates: list[tuple[str, str]] = []
+
+    async def get_user_by_username(self, username: str) -> SimpleNamespace | None:
+        return self.user if username == self.user.username else None
+
+    async def update_password_hash(
+        self, user_id: object, *, expected_hash: str, password_hash: str
+    ) -> bool:
+        self.updates.append((expected_hash, password_hash))
+        return True
+
+
+@pytest.mark.parametrize("rehash_on_login", [True, False])
+async def test_authenticate_database_user_rehashes_on_login(
+    monkeypatch: pytest.MonkeyPatch, rehash_on_login: bool
+) -> None:
+    monkeypatch.setenv("APP_AUTH_PASSWORD_HASH_SCHEME", "argon2")
+    monkeypatch.setenv("APP_AUTH_PASSWORD_HASH_ARGON2_TIME_COST", "1")
+    monkeypatch.setenv("APP_AUTH_PASSWORD_HASH_ARGON2_MEMORY_KIB", "1024")
+    monkeypatch.setenv("APP_AUTH_PASSWORD_HASH_ARGON2_PARALLELISM", "1")
+    monkeypatch.setenv("APP_AUTH_PASSWORD_REHASH_ON_LOGIN", str(rehash_on_login).lower())
+    get_settings.cache_clear()
+    stored = hash_password("secret-password", PBKDF2_LIGHT)
+    user = SimpleNamespace(
+        id=uuid4(),
+        username="admin",
+        password_hash=stored,
+        scopes_csv="items:read",
+        is_active=True,
+    )
+    repository = _FakeRepository(user)
+    monkeypatch.setattr(auth_service, "AuthRepository", lambda _session: repository)
+    try:
+        principal = await auth_service.authenticate_database_user(
+            username="admin", password="secret-password", session=object()
+        )
+    finally:
+        get_settings.cache_clear()
+
+    assert principal is not None
+    if rehash_on_login:
+        ((expected_hash, new_hash),) = repository.updates
+        assert expected_hash == stored
+        assert new_hash.startswith("$argon2id$v=19$m=1024,t=1,p=1$")
+        assert verify_password("secret-password", new_hash)
+    else:
+        assert repository.updates == []
+
+
+def _fake_measure(profile: PasswordHashProfile, samples: int) -> tuple[float, float]:
+    if profile.effective_scheme == "pbkdf2_sha256":
+        cost = profile.pbkdf2_iterations / 10_000
+    else:
+        cost = profile.argon2_time_cost * profile.argon2_memory_kib / 1024
+    return cost, cost
+
+
+def test_recommend_pbkdf2_scales_iterations_to_target(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(password_tuning, "measure", _fake_measure)
+
+    recommended = password_tuning.recommend_pbkdf2(PBKDF2_LIGHT, target_ms=45, samples=1)
+
+    assert recommended.pbkdf2_iterations == 450_000
+
+
+def test_recommend_argon2_raises_time_cost_then_trims_memory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(password_tuning, "measure", _fake_measure)
+    base = PasswordHashProfile(argon2_memory_kib=65536, argon2_parallelism=4)
+
+    roomy = password_tuning.recommend_argon2(base, target_ms=200, samples=1, verbose=False)
+    tight = password_tuning.recommend_argon2(base, target_ms=40, samples=1, verbose=False)
+
+    assert (roomy.argon2_time_cost, roomy.argon2_memory_kib) == (3, 65536)
+    assert (tight.argon2_time_cost, tight.argon2_memory_kib) == (1, 32768)
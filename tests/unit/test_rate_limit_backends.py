@@ -1,31 +1,54 @@
 from __future__ import annotations
 
+import asyncio
+import math
+
 import pytest
-from starlette.datastructures import Headers
 
 from __PROJECT_SLUG__.core.middleware.rate_limit import (
+    LeasedRedisRateLimiter,
     RedisFixedWindowRateLimiter,
+    RedisGCRARateLimiter,
+    SlidingWindowCounterRateLimiter,
     SlidingWindowRateLimiter,
-    build_rate_limit_key,
     build_rate_limiter,
+    digest_rate_limit_key,
+    join_rate_limit_key,
+    rate_limit_key_builder,
     resolve_client_ip,
 )
 
 
+class NoScriptError(Exception):
+    pass
+
+
 class FakeRedisClient:
-    def __init__(self) -> None:
+    """In-process stand-in for the fixed window Lua script that records every round trip."""
+
+    def __init__(self, *, scripts_cached: bool = True) -> None:
         self.counters: dict[str, int] = {}
-        self.expire_calls: list[tuple[str, int]] = []
+        self.ttls: dict[str, int] = {}
+        self.calls: list[str] = []
+        self.scripts_cached = scripts_cached
         self.closed = False
         self.ping_called = False
 
-    async def incr(self, key: str) -> int:
+    def _run_script(self, key: str, ttl_seconds: int) -> list[int]:
         self.counters[key] = self.counters.get(key, 0) + 1
-        return self.counters[key]
+        ttl = self.ttls.setdefault(key, ttl_seconds)
+        return [self.counters[key], ttl]
 
-    async def expire(self, key: str, seconds: int) -> bool:
-        self.expire_calls.append((key, seconds))
-        return True
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: str | int) -> list[int]:
+        self.calls.append("evalsha")
+        if not self.scripts_cached:
+            raise NoScriptError("NOSCRIPT No matching script. Please use EVAL.")
+        return self._run_script(str(keys_and_args[0]), int(keys_and_args[1]))
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: str | int) -> list[int]:
+        self.calls.append("eval")
+        self.scripts_cached = True
+        return self._run_script(str(keys_and_args[0]), int(keys_and_args[1]))
 
     async def aclose(self) -> None:
         self.closed = True
@@ -35,6 +58,54 @@ class FakeRedisClient:
         return True
 
 
+class FakeGCRARedisClient:
+    """Mirrors the GCRA Lua script against a controllable Redis clock."""
+
+    def __init__(self) -> None:
+        self.now_ms = 0.0
+        self.values: dict[str, float] = {}
+        self.calls: list[str] = []
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: str | int) -> list[int]:
+        self.calls.append("evalsha")
+        key, interval, capacity = str(keys_and_args[0]), *map(float, keys_and_args[1:])
+        tat = max(self.values.get(key, self.now_ms), self.now_ms)
+        new_tat = tat + interval
+        allow_at = new_tat - capacity
+        if self.now_ms < allow_at:
+            return [0, math.ceil(allow_at - self.now_ms)]
+        self.values[key] = new_tat
+        return [1, 0]
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: str | int) -> list[int]:
+        raise AssertionError("script should be served from the cache")
+
+    async def ping(self) -> bool:
+        return True
+
+
+class FakeLeaseRedisClient:
+    """Mirrors the lease Lua script: grants permits without exceeding the window limit."""
+
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = {}
+        self.calls: list[str] = []
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: str | int) -> int:
+        self.calls.append("evalsha")
+        key, lease, limit = str(keys_and_args[0]), int(keys_and_args[1]), int(keys_and_args[2])
+        used = self.counters.get(key, 0)
+        granted = max(0, min(lease, limit - used))
+        self.counters[key] = used + granted
+        return granted
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: str | int) -> int:
+        raise AssertionError("script should be served from the cache")
+
+    async def ping(self) -> bool:
+        return True
+
+
 async def test_sliding_window_check_returns_retry_after() -> None:
     limiter = SlidingWindowRateLimiter(max_requests=1, window_seconds=10)
 
@@ -65,10 +136,27 @@ async def test_redis_fixed_window_enforces_limit(monkeypatch: pytest.MonkeyPatch
     assert second.allowed is True
     assert third.allowed is False
     assert third.retry_after_seconds == 55
-    assert len(fake_redis.expire_calls) == 1
+    assert fake_redis.calls == ["evalsha", "evalsha", "evalsha"]
+    assert fake_redis.ttls == {"svc:2:ip:tenant:path": 120}
+
+
+async def test_redis_fixed_window_falls_back_to_eval_on_noscript() -> None:
+    fake_redis = FakeRedisClient(scripts_cached=False)
+    limiter = RedisFixedWindowRateLimiter(
+        max_requests=5,
+        window_seconds=60,
+        redis_url="redis://unused",
+        key_prefix="svc",
+        redis_client=fake_redis,
+    )
 
+    assert (await limiter.check("k")).allowed is True
+    assert (await limiter.check("k")).allowed is True
 
-async def test_redis_fixed_window_close_calls_client() -> None:
+    assert fake_redis.calls == ["evalsha", "eval", "evalsha"]
+
+
+async def test_redis_fixed_window_close_leaves_injected_client_open() -> None:
     fake_redis = FakeRedisClient()
     limiter = RedisFixedWindowRateLimiter(
         max_requests=1,
@@ -80,7 +168,8 @@ async def test_redis_fixed_window_close_calls_client() -> None:
 
     await limiter.close()
 
-    assert fake_redis.closed is True
+    # An injected client is shared with other limiters; whoever built it closes it.
+    assert fake_redis.closed is False
 
 
 async def test_redis_fixed_window_ping_calls_client() -> None:
@@ -111,6 +200,19 @@ def test_build_rate_limiter_memory_backend() -> None:
     assert isinstance(limiter, SlidingWindowRateLimiter)
 
 
+@pytest.mark.parametrize(
+    "limiter_class", [SlidingWindowRateLimiter, SlidingWindowCounterRateLimiter]
+)
+async def test_memory_limiters_admit_exactly_the_limit_under_concurrent_checks(
+    limiter_class: type[SlidingWindowRateLimiter] | type[SlidingWindowCounterRateLimiter],
+) -> None:
+    limiter = limiter_class(max_requests=50, window_seconds=60)
+
+    decisions = await asyncio.gather(*(limiter.check("k", now=1.0) for _ in range(200)))
+
+    assert sum(decision.allowed for decision in decisions) == 50
+
+
 async def test_memory_limiter_ping_is_noop() -> None:
     limiter = SlidingWindowRateLimiter(max_requests=1, window_seconds=10)
     await limiter.ping()
@@ -125,24 +227,274 @@ async def test_sliding_window_evicts_oldest_when_max_keys_reached() -> None:
     assert (await limiter.check("k1", now=3.0)).allowed is True
 
 
-def test_build_rate_limit_key_hashes_components() -> None:
-    first = build_rate_limit_key(client_ip="10.0.0.1", tenant_id="acme", path="/api/v1/items")
-    second = build_rate_limit_key(client_ip="10.0.0.1", tenant_id="acme", path="/api/v1/items")
-    third = build_rate_limit_key(client_ip="10.0.0.1", tenant_id="acme", path="/api/v1/other")
+def test_digest_rate_limit_key_is_short_and_distinguishes_components() -> None:
+    first = digest_rate_limit_key(("10.0.0.1", "acme", "/api/v1/items"))
+    second = digest_rate_limit_key(("10.0.0.1", "acme", "/api/v1/items"))
+    third = digest_rate_limit_key(("10.0.0.1", "acme", "/api/v1/other"))
 
     assert first == second
     assert first != third
+    assert len(first) == 32
+    assert "10.0.0.1" not in first
+
+
+def test_join_rate_limit_key_skips_hashing_but_bounds_length() -> None:
+    short = join_rate_limit_key(("10.0.0.1", "acme", "/api/v1/items"))
+    long = join_rate_limit_key(("10.0.0.1", "acme", "/" + "a" * 1000))
+
+    assert short == "10.0.0.1\x1facme\x1f/api/v1/items"
+    assert len(long) == 32
+
+
+def test_rate_limit_key_builder_digests_for_redis_backends_only() -> None:
+    assert rate_limit_key_builder("redis") is digest_rate_limit_key
+    assert rate_limit_key_builder("redis_gcra") is digest_rate_limit_key
+    assert rate_limit_key_builder("memory") is join_rate_limit_key
+    assert rate_limit_key_builder("shm") is join_rate_limit_key
 
 
 def test_resolve_client_ip_prefers_forwarded_header_when_trusted() -> None:
-    headers = Headers({"X-Forwarded-For": "198.51.100.23, 10.0.0.1"})
-    scope = {"client": ("127.0.0.1", 4242)}
+    scope = {
+        "headers": [(b"x-forwarded-for", b"198.51.100.23, 10.0.0.1")],
+        "client": ("127.0.0.1", 4242),
+    }
 
-    assert resolve_client_ip(headers, scope, trust_x_forwarded_for=True) == "198.51.100.23"
+    assert resolve_client_ip(scope, trust_x_forwarded_for=True) == "198.51.100.23"
 
 
 def test_resolve_client_ip_uses_socket_ip_when_untrusted() -> None:
-    headers = Headers({"X-Forwarded-For": "198.51.100.23, 10.0.0.1"})
-    scope = {"client": ("127.0.0.1", 4242)}
+    scope = {
+        "headers": [(b"x-forwarded-for", b"198.51.100.23, 10.0.0.1")],
+        "client": ("127.0.0.1", 4242),
+    }
+
+    assert resolve_client_ip(scope, trust_x_forwarded_for=False) == "127.0.0.1"
+
+
+async def test_sliding_window_evicts_least_recently_checked_key() -> None:
+    limiter = SlidingWindowRateLimiter(max_requests=1, window_seconds=10, max_keys=2)
+
+    assert (await limiter.check("k1", now=0.0)).allowed is True
+    assert (await limiter.check("k2", now=1.0)).allowed is True
+    assert (await limiter.check("k1", now=2.0)).allowed is False
+    assert (await limiter.check("k3", now=3.0)).allowed is True
+
+    # k2 was the least recently checked key, so k1 keeps its window state.
+    assert (await limiter.check("k1", now=4.0)).allowed is False
+    assert (await limiter.check("k2", now=5.0)).allowed is True
+
+
+async def test_sliding_window_prunes_keys_without_events_in_window() -> None:
+    limiter = SlidingWindowRateLimiter(max_requests=5, window_seconds=10)
+
+    await limiter.check("k1", now=0.0)
+    await limiter.check("k2", now=1.0)
+    await limiter.check("k1", now=5.0)
+    await limiter.check("k3", now=12.0)
+
+    assert list(limiter._events) == ["k1", "k3"]
+
+    await limiter.check("k3", now=15.5)
+
+    assert list(limiter._events) == ["k3"]
+
+
+async def test_sliding_window_spreads_mass_expiry_over_later_checks() -> None:
+    limiter = SlidingWindowRateLimiter(max_requests=5, window_seconds=10)
+    for index in range(6):
+        await limiter.check(f"k{index}", now=float(index) / 10)
+
+    await limiter.check("fresh", now=20.0)
+    assert len(limiter._events) == 6 - limiter.PRUNE_BATCH_SIZE + 1
+
+    for _ in range(3):
+        await limiter.check("fresh", now=20.0)
+    assert list(limiter._events) == ["fresh"]
+
+
+async def test_sliding_window_counter_weights_previous_window() -> None:
+    limiter = SlidingWindowCounterRateLimiter(max_requests=2, window_seconds=10)
+
+    assert (await limiter.check("k1", now=0.0)).allowed is True
+    assert (await limiter.check("k1", now=1.0)).allowed is True
+
+    denied = await limiter.check("k1", now=2.0)
+    assert denied.allowed is False
+    assert denied.retry_after_seconds == 13
+
+    # Half of the previous window still overlaps: estimate = 2 * 0.5 + 0.
+    assert (await limiter.check("k1", now=14.9)).allowed is False
+    assert (await limiter.check("k1", now=15.0)).allowed is True
+
+    denied = await limiter.check("k1", now=15.0)
+    assert denied.allowed is False
+    assert denied.retry_after_seconds == 5
+
+
+async def test_sliding_window_counter_prunes_and_evicts_keys() -> None:
+    limiter = SlidingWindowCounterRateLimiter(max_requests=1, window_seconds=10, max_keys=2)
+
+    assert (await limiter.check("k1", now=0.0)).allowed is True
+    assert (await limiter.check("k2", now=11.0)).allowed is True
+    assert (await limiter.check("k3", now=12.0)).allowed is True
+    assert list(limiter._counters) == ["k2", "k3"]
+
+    assert (await limiter.check("k4", now=31.0)).allowed is True
+    assert list(limiter._counters) == ["k4"]
+
+
+def test_build_rate_limiter_memory_counter_backend() -> None:
+    limiter = build_rate_limiter(
+        backend="memory_counter",
+        max_requests=10,
+        window_seconds=60,
+        memory_max_keys=1000,
+        redis_url="redis://localhost:6379/0",
+        redis_prefix="svc",
+    )
+
+    assert isinstance(limiter, SlidingWindowCounterRateLimiter)
+
+
+async def test_redis_gcra_allows_burst_then_spaces_requests() -> None:
+    fake_redis = FakeGCRARedisClient()
+    limiter = RedisGCRARateLimiter(
+        max_requests=6,
+        window_seconds=60,
+        redis_url="redis://unused",
+        key_prefix="svc",
+        burst=2,
+        redis_client=fake_redis,
+    )
+
+    assert (await limiter.check("k")).allowed is True
+    assert (await limiter.check("k")).allowed is True
+
+    denied = await limiter.check("k")
+    assert denied.allowed is False
+    assert denied.retry_after_seconds == 10
+
+    fake_redis.now_ms = 9_999
+    assert (await limiter.check("k")).allowed is False
+    fake_redis.now_ms = 10_000
+    assert (await limiter.check("k")).allowed is True
+
+    assert list(fake_redis.values) == ["svc:gcra:k"]
+    assert set(fake_redis.calls) == {"evalsha"}
+
+
+async def test_redis_gcra_defaults_to_strict_spacing() -> None:
+    fake_redis = FakeGCRARedisClient()
+    limiter = RedisGCRARateLimiter(
+        max_requests=3,
+        window_seconds=60,
+        redis_url="redis://unused",
+        key_prefix="svc",
+        redis_client=fake_redis,
+    )
+
+    results = [(await limiter.check("k")).allowed for _ in range(2)]
+    fake_redis.now_ms = 20_000
+    results.append((await limiter.check("k")).allowed)
+
+    assert limiter.burst == 1
+    assert results == [True, False, True]
+
+
+@pytest.mark.parametrize(("burst", "most_per_window"), [(None, 10), (3, 12), (10, 19)])
+async def test_redis_gcra_never_admits_more_than_limit_plus_burst_per_window(
+    burst: int | None, most_per_window: int
+) -> None:
+    fake_redis = FakeGCRARedisClient()
+    limiter = RedisGCRARateLimiter(
+        max_requests=10,
+        window_seconds=60,
+        redis_url="redis://unused",
+        key_prefix="svc",
+        redis_client=fake_redis,
+        **({} if burst is None else {"burst": burst}),
+    )
+    admitted: list[float] = []
+    # A client hammering every 100 ms for three windows.
+    for step in range(1800):
+        fake_redis.now_ms = step * 100.0
+        if (await limiter.check("k")).allowed:
+            admitted.append(fake_redis.now_ms)
+
+    busiest = max(sum(start <= at < start + 60_000 for at in admitted) for start in admitted)
+    assert busiest == most_per_window
+
+
+def _leased_limiter(fake_redis: FakeLeaseRedisClient, **overrides: int) -> LeasedRedisRateLimiter:
+    options = {"max_requests": 10, "window_seconds": 60, "lease_size": 4} | overrides
+    return LeasedRedisRateLimiter(
+        redis_url="redis://unused",
+        key_prefix="svc",
+        redis_client=fake_redis,
+        **options,
+    )
+
+
+async def test_leased_limiter_spends_permits_locally(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_redis = FakeLeaseRedisClient()
+    limiter = _leased_limiter(fake_redis)
+    monkeypatch.setattr("__PROJECT_SLUG__.core.middleware.rate_limit.time.time", lambda: 125.0)
+
+    results = [(await limiter.check("k")).allowed for _ in range(8)]
+
+    assert results == [True] * 8
+    assert len(fake_redis.calls) == 2
+    assert fake_redis.counters == {"svc:2:k": 8}
+
+
+async def test_leased_limiter_never_exceeds_limit_across_workers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_redis = FakeLeaseRedisClient()
+    workers = [_leased_limiter(fake_redis) for _ in range(3)]
+    monkeypatch.setattr("__PROJECT_SLUG__.core.middleware.rate_limit.time.time", lambda: 125.0)
+
+    admitted = 0
+    for _ in range(10):
+        for worker in workers:
+            admitted += (await worker.check("k")).allowed
+
+    assert admitted == 10
+
+
+async def test_leased_limiter_caches_denials_until_window_ends(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_redis = FakeLeaseRedisClient()
+    limiter = _leased_limiter(fake_redis, max_requests=2)
+    now = 125.0
+    monkeypatch.setattr("__PROJECT_SLUG__.core.middleware.rate_limit.time.time", lambda: now)
+
+    assert (await limiter.check("k")).allowed is True
+    assert (await limiter.check("k")).allowed is True
+    first_denial = await limiter.check("k")
+    calls_after_denial = len(fake_redis.calls)
+    second_denial = await limiter.check("k")
+
+    assert first_denial.allowed is False
+    assert first_denial.retry_after_seconds == 55
+    assert second_denial.allowed is False
+    assert len(fake_redis.calls) == calls_after_denial
+
+    now = 180.0
+    assert (await limiter.check("k")).allowed is True
+
+
+def test_build_rate_limiter_redis_backend_with_lease_size() -> None:
+    limiter = build_rate_limiter(
+        backend="redis",
+        max_requests=10,
+        window_seconds=60,
+        memory_max_keys=1000,
+        redis_url="redis://localhost:6379/0",
+        redis_prefix="svc",
+        redis_lease_size=5,
+    )
 
-    assert resolve_client_ip(headers, scope, trust_x_forwarded_for=False) == "127.0.0.1"
+    assert isinstance(limiter, LeasedRedisRateLimiter)
+    assert limiter.lease_size == 5
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from __PROJECT_SLUG__.core.middleware.rate_limit import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitBreakerRateLimiter,
+    CircuitOpenError,
+    RateLimitDecision,
+    SlidingWindowRateLimiter,
+    build_rate_limiter,
+)
+
+
+class FlakyBackend:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.healthy = True
+        self.delay_seconds = 0.0
+
+    async def check(self, key: str) -> RateLimitDecision:
+        self.calls += 1
+        if self.delay_seconds:
+            await asyncio.sleep(self.delay_seconds)
+        if not self.healthy:
+            raise ConnectionError("redis unavailable")
+        return RateLimitDecision(allowed=True)
+
+    async def ping(self) -> None:
+        if not self.healthy:
+            raise ConnectionError("redis unavailable")
+
+    async def close(self) -> None:
+        return None
+
+
+def _breaker(
+    backend: FlakyBackend,
+    *,
+    fallback: SlidingWindowRateLimiter | None = None,
+    reset_seconds: float = 60.0,
+) -> CircuitBreakerRateLimiter:
+    policy = CircuitBreakerPolicy(
+        call_timeout_seconds=0.01,
+        failure_ratio=0.5,
+        min_calls=4,
+        reset_seconds=reset_seconds,
+    )
+    return CircuitBreakerRateLimiter(
+        backend, breaker=CircuitBreaker(policy, name="test"), fallback=fallback
+    )
+
+
+async def _trip(breaker: CircuitBreakerRateLimiter) -> None:
+    for _ in range(breaker.policy.min_calls):
+        with pytest.raises((ConnectionError, TimeoutError)):
+            await breaker.check("k")
+
+
+async def test_breaker_opens_after_failure_ratio_and_skips_backend() -> None:
+    backend = FlakyBackend()
+    breaker = _breaker(backend)
+    assert (await breaker.check("k")).allowed is True
+    assert (await breaker.check("k")).allowed is True
+
+    backend.healthy = False
+    with pytest.raises(ConnectionError):
+        await breaker.check("k")
+    assert breaker.state == "closed"
+    with pytest.raises(ConnectionError):
+        await breaker.check("k")
+    assert breaker.state == "open"
+
+    calls_when_opened = backend.calls
+    with pytest.raises(CircuitOpenError):
+        await breaker.check("k")
+    assert backend.calls == calls_when_opened
+
+
+async def test_breaker_enforces_call_deadline() -> None:
+    backend = FlakyBackend()
+    backend.delay_seconds = 1.0
+    breaker = _breaker(backend)
+
+    await _trip(breaker)
+
+    assert breaker.state == "open"
+
+
+async def test_breaker_serves_memory_fallback_while_open() -> None:
+    backend = FlakyBackend()
+    backend.healthy = False
+    fallback = SlidingWindowRateLimiter(max_requests=1, window_seconds=60)
+    breaker = _breaker(backend, fallback=fallback)
+
+    assert (await breaker.check("k")).allowed is True
+    for _ in range(3):
+        assert (await breaker.check("k")).allowed is False
+    assert breaker.state == "open"
+
+    calls_when_opened = backend.calls
+    assert (await breaker.check("other")).allowed is True
+    assert backend.calls == calls_when_opened
+    await breaker.ping()
+
+
+async def test_breaker_half_open_probe_closes_circuit() -> None:
+    backend = FlakyBackend()
+    backend.healthy = False
+    breaker = _breaker(backend, reset_seconds=0.0)
+    await _trip(breaker)
+    assert breaker.state == "open"
+
+    with pytest.raises(ConnectionError):
+        await breaker.check("k")
+    assert breaker.state == "open"
+
+    backend.healthy = True
+    assert (await breaker.check("k")).allowed is True
+    assert breaker.state == "closed"
+
+
+async def test_breaker_allows_single_half_open_probe() -> None:
+    backend = FlakyBackend()
+    backend.healthy = False
+    breaker = _breaker(backend, reset_seconds=0.0)
+    await _trip(breaker)
+
+    backend.healthy = True
+    backend.delay_seconds = 0.005
+    results = await asyncio.gather(
+        breaker.check("k"),
+        breaker.check("k"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], RateLimitDecision)
+    assert isinstance(results[1], CircuitOpenError)
+    assert breaker.state == "closed"
+
+
+async def test_breaker_ping_fails_fast_when_open() -> None:
+    backend = FlakyBackend()
+    backend.healthy = False
+    breaker = _breaker(backend)
+    await _trip(breaker)
+
+    backend.healthy = True
+    with pytest.raises(CircuitOpenError):
+        await breaker.ping()
+
+
+def test_build_rate_limiter_wraps_redis_backends_only() -> None:
+    policy = CircuitBreakerPolicy(degrade_to_memory=True)
+    common = {
+        "max_requests": 10,
+        "window_seconds": 60,
+        "memory_max_keys": 1000,
+        "redis_url": "redis://localhost:6379/0",
+        "redis_prefix": "svc",
+        "circuit_breaker": policy,
+    }
+
+    redis_limiter = build_rate_limiter(backend="redis", **common)
+    memory_limiter = build_rate_limiter(backend="memory", **common)
+
+    assert isinstance(redis_limiter, CircuitBreakerRateLimiter)
+    assert isinstance(redis_limiter.fallback, SlidingWindowRateLimiter)
+    assert isinstance(memory_limiter, SlidingWindowRateLimiter)
+
+
+async def test_limiters_sharing_a_breaker_open_together() -> None:
+    backend = FlakyBackend()
+    backend.healthy = False
+    default = _breaker(backend)
+    policy_limiter = CircuitBreakerRateLimiter(FlakyBackend(), breaker=default.breaker)
+    await _trip(default)
+
+    with pytest.raises(CircuitOpenError):
+        await policy_limiter.check("k")
+    assert policy_limiter.state == "open"
+
+
+async def test_build_rate_limiter_shares_injected_redis_client_and_breaker() -> None:
+    class Client:
+        closed = False
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    client = Client()
+    breaker = CircuitBreaker(CircuitBreakerPolicy(), name="redis")
+    limiters = [
+        build_rate_limiter(
+            backend="redis",
+            max_requests=max_requests,
+            window_seconds=60,
+            memory_max_keys=1000,
+            redis_url="redis://localhost:6379/0",
+            redis_prefix="svc",
+            redis_client=client,  # type: ignore[arg-type]
+            circuit_breaker=breaker,
+        )
+        for max_requests in (10, 100)
+    ]
+
+    assert all(
+        isinstance(limiter, CircuitBreakerRateLimiter) and limiter.breaker is breaker
+        for limiter in limiters
+    )
+    for limiter in limiters:
+        await limiter.close()
+    assert not client.closed
+
+
+def test_circuit_state_metric_is_labelled_per_limiter() -> None:
+    prometheus_client = pytest.importorskip("prometheus_client")
+    policy = CircuitBreakerPolicy(min_calls=1)
+    first = CircuitBreaker(policy, name="first")
+    CircuitBreaker(policy, name="second")
+
+    first.record(success=False)
+
+    def state(name: str) -> float | None:
+        return prometheus_client.REGISTRY.get_sample_value(
+            "rate_limit_backend_circuit_state", {"limiter": name}
+        )
+
+    assert state("first") == 2
+    assert state("second") == 0
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from __PROJECT_SLUG__.core.middleware.rate_limit import (
+    RateLimitMiddleware,
+    RateLimitPolicy,
+    RateLimitPolicyTable,
+    SlidingWindowRateLimiter,
+)
+from __PROJECT_SLUG__.core.middleware.tenant import TenantMiddleware
+
+
+async def ok_app(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": json.dumps({}).encode()})
+
+
+def _table(*policies: RateLimitPolicy) -> RateLimitPolicyTable:
+    return RateLimitPolicyTable(
+        (
+            policy,
+            SlidingWindowRateLimiter(
+                max_requests=policy.max_requests,
+                window_seconds=policy.window_seconds,
+            ),
+        )
+        for policy in policies
+    )
+
+
+def test_policy_table_resolves_static_and_templated_routes() -> None:
+    token = RateLimitPolicy(route="/api/v1/auth/token", max_requests=5, window_seconds=60)
+    item = RateLimitPolicy(route="/api/v1/items/{item_id:int}", max_requests=50, window_seconds=60)
+    table = _table(token, item)
+
+    assert table.resolve("/api/v1/auth/token", "POST", "public").policy is token
+    assert table.resolve("/api/v1/items/42", "GET", "public").policy is item
+    assert table.resolve("/api/v1/items/abc", "GET", "public") is None
+    assert table.resolve("/api/v1/items/42/extra", "GET", "public") is None
+    assert table.resolve("/api/v1/ping", "GET", "public") is None
+
+
+def test_policy_table_prefers_most_specific_method_and_tenant() -> None:
+    route = "/api/v1/items/{item_id}"
+    fallback = RateLimitPolicy(route=route, max_requests=100, window_seconds=60)
+    writes = RateLimitPolicy(route=route, max_requests=10, window_seconds=60, method="POST")
+    tenant = RateLimitPolicy(route=route, max_requests=1000, window_seconds=60, tenant="acme")
+    tenant_writes = RateLimitPolicy(
+        route=route, max_requests=20, window_seconds=60, method="post", tenant="acme"
+    )
+    table = _table(fallback, writes, tenant, tenant_writes)
+
+    assert table.resolve("/api/v1/items/1", "GET", "public").policy is fallback
+    assert table.resolve("/api/v1/items/1", "POST", "public").policy is writes
+    assert table.resolve("/api/v1/items/1", "GET", "acme").policy is tenant
+    assert table.resolve("/api/v1/items/1", "POST", "acme").policy is tenant_writes
+
+
+def test_policy_table_rejects_duplicates_and_unknown_routes() -> None:
+    policy = RateLimitPolicy(route="/api/v1/ping", max_requests=1, window_seconds=60)
+    with pytest.raises(ValueError, match="Duplicate"):
+        _table(policy, policy)
+
+    table = _table(policy, RateLimitPolicy(route="/api/v1/nope", max_requests=1, window_seconds=1))
+    with pytest.raises(ValueError, match="/api/v1/nope"):
+        table.bind_routes(["/api/v1/ping"])
+
+
+def test_bound_table_does_not_apply_a_templated_policy_to_a_static_sibling() -> None:
+    item = RateLimitPolicy(route="/api/v1/items/{item_id}", max_requests=50, window_seconds=60)
+    table = _table(item)
+    assert table.resolve("/api/v1/items/export", "GET", "public").policy is item
+
+    table.bind_routes(["/api/v1/items", "/api/v1/items/export", "/api/v1/items/{item_id}"])
+
+    assert table.resolve("/api/v1/items/export", "GET", "public") is None
+    assert table.resolve("/api/v1/items", "GET", "public") is None
+    assert table.resolve("/api/v1/items/42", "GET", "public").policy is item
+
+
+def test_bound_table_follows_router_order_for_shadowed_static_routes() -> None:
+    item = RateLimitPolicy(route="/api/v1/items/{item_id}", max_requests=50, window_seconds=60)
+    table = _table(item)
+
+    # Declared after the parameterised route, "/export" is never routed to its own handler.
+    table.bind_routes(["/api/v1/items/{item_id}", "/api/v1/items/export"])
+
+    assert table.resolve("/api/v1/items/export", "GET", "public").policy is item
+
+
+def test_policy_fingerprint_names_the_selector_not_the_limit() -> None:
+    route = "/api/v1/items/{item_id}"
+    policy = RateLimitPolicy(route=route, max_requests=10, window_seconds=60, method="get")
+
+    assert (
+        policy.fingerprint
+        == RateLimitPolicy(
+            route=route, max_requests=99, window_seconds=60, method="GET"
+        ).fingerprint
+    )
+    assert (
+        policy.fingerprint
+        != RateLimitPolicy(
+            route=route, max_requests=10, window_seconds=60, tenant="acme"
+        ).fingerprint
+    )
+
+
+def test_policy_key_uses_selected_dimensions_only() -> None:
+    route = "/api/v1/items/{item_id}"
+    table = _table(RateLimitPolicy(route=route, max_requests=1, window_seconds=60, key_by=("ip",)))
+    policy = table.resolve("/api/v1/items/1", "GET", "public")
+
+    same_client = {
+        policy.key_parts(client_ip="10.0.0.1", tenant_id="a", path="/api/v1/items/1"),
+        policy.key_parts(client_ip="10.0.0.1", tenant_id="b", path="/api/v1/items/2"),
+    }
+    assert len(same_client) == 1
+    assert policy.key_parts(client_ip="10.0.0.2", tenant_id="a", path="/x") not in same_client
+
+
+async def _status(
+    app: ASGIApp,
+    path: str,
+    method: str = "GET",
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> int:
+    scope: Scope = {
+        "type": "http",
+        "path": path,
+        "method": method,
+        "headers": headers or [],
+        "client": ("10.0.0.1", 1234),
+    }
+    sent: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return next(msg["status"] for msg in sent if msg["type"] == "http.response.start")
+
+
+async def test_middleware_applies_policy_limiter_and_default_elsewhere() -> None:
+    table = _table(
+        RateLimitPolicy(
+            route="/api/v1/auth/token", max_requests=1, window_seconds=60, method="POST"
+        )
+    )
+    middleware = RateLimitMiddleware(
+        ok_app,
+        limiter=SlidingWindowRateLimiter(max_requests=100, window_seconds=60),
+        exempt_paths=[],
+        policies=table,
+    )
+
+    assert await _status(middleware, "/api/v1/auth/token", "POST") == 200
+    assert await _status(middleware, "/api/v1/auth/token", "POST") == 429
+    assert await _status(middleware, "/api/v1/auth/token", "GET") == 200
+    assert await _status(middleware, "/api/v1/ping") == 200
+    assert await _status(middleware, "/api/v1/ping") == 200
+
+
+async def test_middleware_resolves_tenant_policy_from_tenant_middleware() -> None:
+    route = "/api/v1/ping"
+    table = _table(RateLimitPolicy(route=route, max_requests=1, window_seconds=60, tenant="acme"))
+    app = TenantMiddleware(
+        RateLimitMiddleware(
+            ok_app,
+            limiter=SlidingWindowRateLimiter(max_requests=100, window_seconds=60),
+            exempt_paths=[],
+            policies=table,
+        )
+    )
+    acme = [(b"x-tenant-id", b"acme")]
+
+    assert await _status(app, route, headers=acme) == 200
+    assert await _status(app, route, headers=acme) == 429
+    assert await _status(app, route) == 200
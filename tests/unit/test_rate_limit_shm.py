@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from pathlib import Path
+
+import pytest
+
+from __PROJECT_SLUG__.core.middleware.rate_limit import build_rate_limiter
+from __PROJECT_SLUG__.core.middleware.rate_limit_shm import SharedMemoryRateLimiter, layout_path
+
+
+def _limiter(path: Path, **overrides: int) -> SharedMemoryRateLimiter:
+    options = {"max_requests": 2, "window_seconds": 60, "max_keys": 100, "stripes": 4}
+    options.update(overrides)
+    return SharedMemoryRateLimiter(path=str(path), **options)
+
+
+async def test_shm_limiter_enforces_limit_and_retry_after(tmp_path: Path) -> None:
+    limiter = _limiter(tmp_path / "rl.shm")
+
+    assert (await limiter.check("a", now=0.0)).allowed is True
+    assert (await limiter.check("a", now=1.0)).allowed is True
+    denied = await limiter.check("a", now=2.0)
+    assert denied.allowed is False
+    assert denied.retry_after_seconds is not None and denied.retry_after_seconds > 0
+    assert (await limiter.check("b", now=2.0)).allowed is True
+
+    await limiter.close()
+
+
+async def test_shm_limiter_state_is_shared_between_instances(tmp_path: Path) -> None:
+    first = _limiter(tmp_path / "rl.shm")
+    second = _limiter(tmp_path / "rl.shm")
+
+    assert await first.allow("a", now=0.0) is True
+    assert await second.allow("a", now=0.0) is True
+    assert await first.allow("a", now=0.0) is False
+
+    await first.close()
+    await second.close()
+
+
+async def test_shm_limiter_with_new_layout_leaves_mapped_table_alone(tmp_path: Path) -> None:
+    path = tmp_path / "rl.shm"
+    first = _limiter(path)
+    assert await first.allow("a", now=0.0) is True
+    assert await first.allow("a", now=0.0) is True
+
+    second = _limiter(path, window_seconds=30)
+
+    assert second.path != first.path
+    assert await second.allow("a", now=0.0) is True
+    # The old table keeps its size and counts while its workers are still running.
+    assert os.stat(first.path).st_size == first._size
+    assert await first.allow("a", now=0.0) is False
+    await first.close()
+    await second.close()
+
+
+def test_shm_limiter_refuses_a_file_with_a_foreign_layout(tmp_path: Path) -> None:
+    path = tmp_path / "rl.shm"
+    table = Path(layout_path(str(path), window_seconds=60, stripes=4, slots_per_stripe=50))
+    table.write_bytes(b"NOTRLSHM" + bytes(100))
+
+    with pytest.raises(RuntimeError, match="unexpected layout"):
+        _limiter(path)
+
+    assert table.stat().st_size == 108
+
+
+async def test_shm_limiter_evicts_when_probe_sequence_is_full(tmp_path: Path) -> None:
+    limiter = _limiter(tmp_path / "rl.shm", max_requests=1, max_keys=1, stripes=1)
+
+    for index in range(50):
+        assert await limiter.allow(f"key-{index}", now=float(index)) is True
+
+    await limiter.close()
+    with pytest.raises(RuntimeError):
+        await limiter.ping()
+
+
+def _worker(path: str, attempts: int, admitted: multiprocessing.Queue) -> None:
+    async def run() -> int:
+        limiter = SharedMemoryRateLimiter(
+            max_requests=50,
+            window_seconds=3600,
+            max_keys=100,
+            stripes=4,
+            path=path,
+        )
+        allowed = 0
+        for _ in range(attempts):
+            if await limiter.allow("shared", now=1800.0):
+                allowed += 1
+        await limiter.close()
+        return allowed
+
+    admitted.put(asyncio.run(run()))
+
+
+def test_shm_limiter_enforces_global_limit_across_processes(tmp_path: Path) -> None:
+    path = str(tmp_path / "rl.shm")
+    owner = SharedMemoryRateLimiter(
+        max_requests=50, window_seconds=3600, max_keys=100, stripes=4, path=path
+    )
+    context = multiprocessing.get_context("fork")
+    admitted = context.Queue()
+    workers = [context.Process(target=_worker, args=(path, 40, admitted)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+    assert sum(admitted.get(timeout=5) for _ in workers) == 50
+    assert asyncio.run(owner.allow("shared", now=1800.0)) is False
+    asyncio.run(owner.close())
+
+
+def test_build_rate_limiter_shm_backend(tmp_path: Path) -> None:
+    limiter = build_rate_limiter(
+        backend="shm",
+        max_requests=10,
+        window_seconds=60,
+        memory_max_keys=1000,
+        redis_url="redis://localhost:6379/0",
+        redis_prefix="svc",
+        shm_path=str(tmp_path / "rl.shm"),
+        shm_stripes=8,
+    )
+
+    assert isinstance(limiter, SharedMemoryRateLimiter)
+    assert limiter.stripes == 8
+    assert limiter.slots_per_stripe == 250
+    assert limiter.path == str(tmp_path / "rl.shm.60s-8x250")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from __PROJECT_SLUG__.api.v1.features.auth import service
+from __PROJECT_SLUG__.api.v1.features.auth.models import RefreshToken
+from __PROJECT_SLUG__.api.v1.features.auth.repository import AuthRepository
+
+
+async def _seed_tokens(
+    sessions: async_sessionmaker[AsyncSession], *, expired: int, revoked: int, valid: int
+) -> None:
+    now = datetime.now(UTC)
+    async with sessions() as session:
+        repo = AuthRepository(session)
+        user = await repo.create_user(
+            username="purge", password_hash="x", scopes_csv="", is_active=True
+        )
+        for index in range(expired + revoked + valid):
+            expires_at = now + (timedelta(hours=-1) if index < expired else timedelta(hours=1))
+            token = await repo.create_refresh_token(
+                user_id=user.id,
+                token_hash=f"token-{index}",
+                expires_at=expires_at,
+                commit=False,
+            )
+            if expired <= index < expired + revoked:
+                token.revoked_at = now
+        await session.commit()
+
+
+async def _remaining(sessions: async_sessionmaker[AsyncSession]) -> list[str]:
+    async with sessions() as session:
+        result = await session.execute(select(RefreshToken.token_hash))
+        return sorted(result.scalars())
+
+
+async def test_purge_deletes_expired_and_revoked_tokens_in_batches(
+    sqlite_sessions: async_sessionmaker[AsyncSession], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await _seed_tokens(sqlite_sessions, expired=5, revoked=3, valid=2)
+    batches: list[tuple[str, int]] = []
+    monkeypatch.setattr(
+        service,
+        "record_refresh_token_purge_batch",
+        lambda reason, deleted, _seconds: batches.append((reason, deleted)),
+    )
+
+    purged = await service.purge_refresh_tokens(
+        session_factory=sqlite_sessions, batch_size=2, batch_pause_seconds=0
+    )
+
+    assert purged == 8
+    assert batches == [
+        ("expired", 2),
+        ("expired", 2),
+        ("expired", 1),
+        ("revoked", 2),
+        ("revoked", 1),
+    ]
+    assert await _remaining(sqlite_sessions) == ["token-8", "token-9"]
+
+
+async def test_purge_loop_survives_database_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+
+    async def failing_purge(**_kwargs: object) -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("database unavailable")
+        raise _StopLoop
+
+    monkeypatch.setattr(service, "purge_refresh_tokens", failing_purge)
+    monkeypatch.setattr(service.random, "uniform", lambda _low, _high: 0)
+
+    with pytest.raises(_StopLoop):
+        await service.run_refresh_token_purge(
+            session_factory=None,  # type: ignore[arg-type]
+            interval_seconds=0,
+            batch_size=1,
+            batch_pause_seconds=0,
+        )
+    assert calls == 2
+
+
+class _StopLoop(BaseException):
+    pass
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from __PROJECT_SLUG__.api.v1.features.auth.repository import (
+    AuthRepository,
+    build_rotate_refresh_token_statement,
+)
+
+
+def test_postgres_rotation_is_a_single_statement() -> None:
+    now = datetime.now(UTC)
+    statement = build_rotate_refresh_token_statement(
+        "old" * 8, new_token_hash="new" * 8, new_expires_at=now + timedelta(days=1), now=now
+    )
+    sql = str(statement.compile(dialect=asyncpg.dialect()))
+
+    assert sql.startswith("WITH consumed AS \n(UPDATE refresh_tokens")
+    assert "owner AS \n(SELECT users.id" in sql
+    assert "inserted AS \n(INSERT INTO refresh_tokens" in sql
+    assert sql.count(";") == 0
+
+
+async def _create_user(
+    sessions: async_sessionmaker[AsyncSession], *, is_active: bool = True
+) -> AuthRepository:
+    async with sessions() as session:
+        repo = AuthRepository(session)
+        user = await repo.create_user(
+            username="rotator", password_hash="x", scopes_csv="items:read", is_active=is_active
+        )
+        await repo.create_refresh_token(
+            user_id=user.id,
+            token_hash="old-token",
+            expires_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+    return repo
+
+
+async def test_stepwise_rotation_issues_successor_once(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    await _create_user(sqlite_sessions)
+    expires_at = datetime.now(UTC) + timedelta(hours=2)
+
+    async with sqlite_sessions() as session:
+        owner = await AuthRepository(session).rotate_refresh_token(
+            "old-token", new_token_hash="new-token", new_expires_at=expires_at
+        )
+    async with sqlite_sessions() as session:
+        replay = await AuthRepository(session).rotate_refresh_token(
+            "old-token", new_token_hash="other-token", new_expires_at=expires_at
+        )
+        successor = await AuthRepository(session).get_valid_refresh_token("new-token")
+
+    assert owner is not None
+    assert (owner.username, owner.scopes_csv) == ("rotator", "items:read")
+    assert replay is None
+    assert successor is not None
+    assert successor.user_id == owner.user_id
+
+
+async def test_stepwise_rotation_consumes_token_of_inactive_owner(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    await _create_user(sqlite_sessions, is_active=False)
+    expires_at = datetime.now(UTC) + timedelta(hours=2)
+
+    async with sqlite_sessions() as session:
+        repo = AuthRepository(session)
+        owner = await repo.rotate_refresh_token(
+            "old-token", new_token_hash="new-token", new_expires_at=expires_at
+        )
+        assert owner is None
+        assert await repo.get_valid_refresh_token("old-token") is None
+        assert await repo.get_valid_refresh_token("new-token") is None
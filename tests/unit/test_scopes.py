@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import HTTPException
+
+from __PROJECT_SLUG__.core.config import get_settings
+from __PROJECT_SLUG__.core.security.auth import (
+    AuthPrincipal,
+    create_access_token,
+    require_scopes,
+    scope_registry,
+)
+from __PROJECT_SLUG__.core.security.scopes import ScopeRegistry
+
+
+def test_registry_assigns_one_bit_per_scope() -> None:
+    registry = ScopeRegistry(["a", "b"])
+
+    assert registry.compile(["b", "a", "b"]) == 0b11
+    assert registry.register("c") == 0b100
+    assert registry.register("a") == 0b1
+    assert registry.mask(["c", "unknown"]) == 0b100
+    assert registry.mask(["a", 1]) is None
+    assert registry.names(0b101, order=["c", "b", "a"]) == ["c", "a"]
+
+
+def test_oauth2_scheme_scopes_are_registered_at_import() -> None:
+    assert "items:read" in scope_registry
+    assert "items:write" in scope_registry
+
+
+def test_principal_checks_scopes_with_a_mask() -> None:
+    principal = AuthPrincipal(username="alice", scopes=["items:read", "not-required-anywhere"])
+
+    assert principal.has_scopes(scope_registry.compile(["items:read"]))
+    assert not principal.has_scopes(scope_registry.compile(["items:read", "items:write"]))
+    assert not hasattr(principal, "__dict__")
+
+
+async def test_require_scopes_reports_missing_scopes_in_declared_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("APP_AUTH_ENABLED", "true")
+    monkeypatch.setenv("APP_AUTH_JWT_SECRET", "x" * 48)
+    get_settings.cache_clear()
+    try:
+        dependency = require_scopes(["reports:export", "items:read", "items:write"])
+        token, _ = create_access_token(username="alice", scopes=["items:read"])
+
+        with pytest.raises(HTTPException) as exc:
+            await dependency(token)
+        assert exc.value.status_code == 403
+        assert exc.value.detail == "Missing required scopes: reports:export, items:write"
+
+        token, _ = create_access_token(
+            username="alice", scopes=["items:write", "items:read", "reports:export"]
+        )
+        principal = await dependency(token)
+        assert principal.username == "alice"
+        assert principal.scopes == ["items:write", "items:read", "reports:export"]
+    finally:
+        get_settings.cache_clear()
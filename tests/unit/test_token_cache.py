@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from __PROJECT_SLUG__.core.security.token_cache import VerifiedTokenCache
+
+VERIFIER = ("secret", (), "HS256", "aud", "iss")
+
+
+def _cache(max_entries: int = 10) -> VerifiedTokenCache:
+    cache = VerifiedTokenCache(max_entries=max_entries)
+    assert cache.get("warmup", verifier=VERIFIER) is None
+    return cache
+
+
+def test_token_cache_entry_expires_exactly_at_exp() -> None:
+    cache = _cache()
+    cache.put("token", {"sub": "admin", "exp": 1000}, verifier=VERIFIER)
+
+    assert cache.get("token", verifier=VERIFIER, now=999.999) == {"sub": "admin", "exp": 1000}
+    assert cache.get("token", verifier=VERIFIER, now=1000.0) is None
+    assert len(cache) == 0
+
+
+def test_token_cache_evicts_least_recently_used() -> None:
+    cache = _cache(max_entries=2)
+    for token in ("a", "b"):
+        cache.put(token, {"exp": 1000}, verifier=VERIFIER)
+    assert cache.get("a", verifier=VERIFIER, now=0.0) is not None
+
+    cache.put("c", {"exp": 1000}, verifier=VERIFIER)
+
+    assert cache.get("b", verifier=VERIFIER, now=0.0) is None
+    assert cache.get("a", verifier=VERIFIER, now=0.0) is not None
+    assert cache.get("c", verifier=VERIFIER, now=0.0) is not None
+
+
+def test_token_cache_drops_entries_when_verifier_changes() -> None:
+    cache = _cache()
+    cache.put("token", {"exp": 1000}, verifier=VERIFIER)
+    rotated = ("new-secret", ("secret",), "HS256", "aud", "iss")
+
+    assert cache.get("token", verifier=rotated, now=0.0) is None
+    assert cache.get("token", verifier=VERIFIER, now=0.0) is None
+
+
+def test_token_cache_skips_tokens_without_exp_and_returns_copies() -> None:
+    cache = _cache()
+    cache.put("forever", {"sub": "admin"}, verifier=VERIFIER)
+    cache.put("token", {"exp": 1000, "scopes": ["items:read"]}, verifier=VERIFIER)
+
+    claims = cache.get("token", verifier=VERIFIER, now=0.0)
+    assert claims is not None
+    claims["sub"] = "mutated"
+
+    assert cache.get("forever", verifier=VERIFIER, now=0.0) is None
+    assert "sub" not in cache.get("token", verifier=VERIFIER, now=0.0)
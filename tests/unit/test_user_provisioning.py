@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator, Iterable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from __PROJECT_SLUG__.api.v1.features.auth.provisioning import (
+    UserImportLimitError,
+    import_users,
+    iter_lines,
+)
+from __PROJECT_SLUG__.api.v1.features.auth.repository import AuthRepository
+from __PROJECT_SLUG__.core.security.hashing import PasswordHashingExecutor
+from __PROJECT_SLUG__.core.security.passwords import PasswordHashProfile, verify_password
+
+_PROFILE = PasswordHashProfile(scheme="pbkdf2_sha256", pbkdf2_iterations=10_000)
+
+
+async def _chunks(parts: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+async def test_iter_lines_rejoins_lines_split_across_chunks() -> None:
+    chunks = _chunks([b'{"a"', b':1}\n{"b":2}\n{', b"}"])
+    lines = [line async for line in iter_lines(chunks, max_line_bytes=16)]
+
+    assert lines == [b'{"a":1}', b'{"b":2}', b"{}"]
+
+
+@pytest.mark.parametrize(
+    "parts",
+    [
+        [b"ok\n", b"0123456789"],  # unterminated line grows past the cap
+        [b"ok\n01234", b"56789\nok"],  # terminated line split across chunks
+        [b"ok\n0123456789\n"],  # whole line inside one chunk
+    ],
+)
+async def test_iter_lines_rejects_lines_over_the_cap(parts: list[bytes]) -> None:
+    lines: list[bytes] = []
+
+    with pytest.raises(UserImportLimitError, match="Line 2 exceeds 8 bytes"):
+        async for line in iter_lines(_chunks(parts), max_line_bytes=8):
+            lines.append(line)
+
+    assert lines == [b"ok"]
+
+
+async def test_import_users_reports_a_result_per_line(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    async with sqlite_sessions() as session:
+        await AuthRepository(session).create_user(
+            username="existing", password_hash="x", scopes_csv="", is_active=True
+        )
+    records = [
+        {"username": "alice", "password": "alice-pw", "scopes": ["items:read"]},
+        {"username": "existing", "password": "ignored"},
+        {"username": "bob", "password": "bob-pw", "is_active": False},
+        {"username": "alice", "password": "again"},
+        {"username": "", "password": "pw"},
+        {"username": "carol", "password": "carol-pw"},
+    ]
+    lines = [json.dumps(record).encode() for record in records]
+    lines.insert(2, b"")
+    hashing = PasswordHashingExecutor(kind="thread", max_workers=2, max_queue=2)
+
+    try:
+        results = [
+            result
+            async for result in import_users(
+                _chunks(lines),
+                session_factory=sqlite_sessions,
+                hashing=hashing,
+                batch_size=2,
+                profile=_PROFILE,
+            )
+        ]
+    finally:
+        hashing.shutdown()
+
+    statuses = {result.line: (result.username, result.status) for result in results}
+    assert statuses == {
+        1: ("alice", "created"),
+        2: ("existing", "exists"),
+        4: ("bob", "created"),
+        5: ("alice", "duplicate"),
+        6: (None, "invalid"),
+        7: ("carol", "created"),
+    }
+    async with sqlite_sessions() as session:
+        repo = AuthRepository(session)
+        alice = await repo.get_user_by_username("alice")
+        bob = await repo.get_user_by_username("bob")
+    assert alice is not None and verify_password("alice-pw", alice.password_hash)
+    assert alice.scopes_csv == "items:read"
+    assert bob is not None and not bob.is_active
+
+
+async def test_import_users_commits_records_up_to_the_cap_then_stops(
+    sqlite_sessions: async_sessionmaker[AsyncSession],
+) -> None:
+    lines = [
+        json.dumps({"username": f"user{index}", "password": "pw"}).encode() for index in range(4)
+    ]
+    hashing = PasswordHashingExecutor(kind="thread", max_workers=2, max_queue=2)
+    results = []
+
+    try:
+        with pytest.raises(UserImportLimitError):
+            async for result in import_users(
+                _chunks(lines),
+                session_factory=sqlite_sessions,
+                hashing=hashing,
+                batch_size=2,
+                profile=_PROFILE,
+                max_records=3,
+            ):
+                results.append(result)
+    finally:
+        hashing.shutdown()
+
+    assert sorted(result.username for result in results) == ["user0", "user1", "user2"]
+    async with sqlite_sessions() as session:
+        assert await AuthRepository(session).get_user_by_username("user3") is None